@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import json
 import os
 import sys
+import threading
 from getpass import getpass
+from typing import Any, Callable, Mapping, TypeVar
 
 from dotenv import load_dotenv
 
 from core import agent_api
 
+T = TypeVar("T")
+
 
 def _print_err(msg: str) -> None:
     sys.stderr.write(msg + "\n")
@@ -75,7 +80,9 @@ def _prompt_yes_no(label: str, *, default: bool) -> bool:
 
 
 def _prompt_list(label: str, *, required: bool = False) -> list[str]:
-    print(f"{label} (one per line; blank to finish):")
+    # One write + flush so the header lands before input() takes over the terminal.
+    sys.stdout.write(f"{label} (one per line; blank to finish):\n")
+    sys.stdout.flush()
     items: list[str] = []
     while True:
         raw = input("> ").strip()
@@ -87,9 +94,7 @@ def _prompt_list(label: str, *, required: bool = False) -> list[str]:
         items.append(raw)
 
 
-async def _run_init(dsn: str, *, wait_seconds: int) -> int:
-    await agent_api.ensure_schema_has_config(dsn, wait_seconds=wait_seconds)
-    defaults = await agent_api.get_init_defaults(dsn, wait_seconds=wait_seconds)
+def _prompt_agent_config(defaults: Mapping[str, Any], env: Mapping[str, str]) -> dict[str, Any]:
     default_interval = int(defaults.get("heartbeat_interval_minutes", 60))
     default_max_energy = float(defaults.get("max_energy", 20))
     default_regen = float(defaults.get("base_regeneration", 10))
@@ -131,13 +136,13 @@ async def _run_init(dsn: str, *, wait_seconds: int) -> int:
     print("\nModel configuration (stored in DB; worker will also use env vars for keys).")
     hb_provider = _prompt(
         "Heartbeat model provider (openai|anthropic|openai_compatible|ollama)",
-        default=os.getenv("LLM_PROVIDER", "openai"),
+        default=env.get("LLM_PROVIDER", "openai"),
         required=True,
     )
-    hb_model = _prompt("Heartbeat model", default=os.getenv("LLM_MODEL", "gpt-4o"), required=True)
+    hb_model = _prompt("Heartbeat model", default=env.get("LLM_MODEL", "gpt-4o"), required=True)
     hb_endpoint = _prompt(
         "Heartbeat endpoint (blank for provider default)",
-        default=os.getenv("OPENAI_BASE_URL", ""),
+        default=env.get("OPENAI_BASE_URL", ""),
         required=False,
     )
     hb_key_env = _prompt(
@@ -203,48 +208,180 @@ async def _run_init(dsn: str, *, wait_seconds: int) -> int:
     enable_maintenance = _prompt_yes_no("Enable subconscious maintenance now?", default=True)
     enable_subconscious = _prompt_yes_no("Enable subconscious decider now?", default=False)
 
-    await agent_api.apply_agent_config(
-        dsn=dsn,
-        wait_seconds=wait_seconds,
-        heartbeat_interval_minutes=heartbeat_interval,
-        maintenance_interval_seconds=maintenance_interval,
-        subconscious_interval_seconds=subconscious_interval,
-        max_energy=max_energy,
-        base_regeneration=base_regeneration,
-        max_active_goals=max_active_goals,
-        objectives=objectives,
-        guardrails=guardrails,
-        initial_message=initial_message,
-        tools=tools,
-        llm_heartbeat={
+    return {
+        "heartbeat_interval_minutes": heartbeat_interval,
+        "maintenance_interval_seconds": maintenance_interval,
+        "subconscious_interval_seconds": subconscious_interval,
+        "max_energy": max_energy,
+        "base_regeneration": base_regeneration,
+        "max_active_goals": max_active_goals,
+        "objectives": objectives,
+        "guardrails": guardrails,
+        "initial_message": initial_message,
+        "tools": tools,
+        "llm_heartbeat": {
             "provider": hb_provider,
             "model": hb_model,
             "endpoint": hb_endpoint,
             "api_key_env": hb_key_env,
         },
-        llm_chat={
+        "llm_chat": {
             "provider": chat_provider,
             "model": chat_model,
             "endpoint": chat_endpoint,
             "api_key_env": chat_key_env,
         },
-        llm_subconscious={
+        "llm_subconscious": {
             "provider": sub_provider,
             "model": sub_model,
             "endpoint": sub_endpoint,
             "api_key_env": sub_key_env,
         },
-        contact_channels=contact_channels,
-        contact_destinations=contact_details,
-        enable_autonomy=enable_autonomy,
-        enable_maintenance=enable_maintenance,
-        enable_subconscious=enable_subconscious,
-        mark_configured=True,
-    )
+        "contact_channels": contact_channels,
+        "contact_destinations": contact_details,
+        "enable_autonomy": enable_autonomy,
+        "enable_maintenance": enable_maintenance,
+        "enable_subconscious": enable_subconscious,
+    }
+
+
+def _load_agent_config(path: str, defaults: Mapping[str, Any], env: Mapping[str, str]) -> dict[str, Any]:
+    """Read a JSON init spec; omitted fields fall back to the same defaults the prompts offer."""
+    with open(path, "r", encoding="utf-8") as fh:
+        spec = json.load(fh)
+    if not isinstance(spec, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+
+    objectives = [str(o) for o in spec.get("objectives") or []]
+    if not objectives:
+        raise ValueError(f"{path}: `objectives` must list at least one objective")
+
+    llm_heartbeat = {
+        "provider": env.get("LLM_PROVIDER", "openai"),
+        "model": env.get("LLM_MODEL", "gpt-4o"),
+        "endpoint": env.get("OPENAI_BASE_URL", ""),
+        "api_key_env": "",
+    }
+    llm_heartbeat.update(spec.get("llm_heartbeat") or {})
+    if not llm_heartbeat["api_key_env"] and str(llm_heartbeat["provider"]).startswith("openai"):
+        llm_heartbeat["api_key_env"] = "OPENAI_API_KEY"
+    llm_chat = {**llm_heartbeat, **(spec.get("llm_chat") or {})}
+    llm_subconscious = {**llm_heartbeat, **(spec.get("llm_subconscious") or {})}
+
+    contact_destinations = {str(k): str(v) for k, v in (spec.get("contact_destinations") or {}).items()}
+    contact_channels = [str(c) for c in spec.get("contact_channels") or contact_destinations]
+
+    return {
+        "heartbeat_interval_minutes": int(
+            spec.get("heartbeat_interval_minutes", defaults.get("heartbeat_interval_minutes", 60))
+        ),
+        "maintenance_interval_seconds": int(
+            spec.get("maintenance_interval_seconds", defaults.get("maintenance_interval_seconds", 60))
+        ),
+        "subconscious_interval_seconds": int(
+            spec.get("subconscious_interval_seconds", defaults.get("subconscious_interval_seconds", 300))
+        ),
+        "max_energy": float(spec.get("max_energy", defaults.get("max_energy", 20))),
+        "base_regeneration": float(spec.get("base_regeneration", defaults.get("base_regeneration", 10))),
+        "max_active_goals": int(spec.get("max_active_goals", defaults.get("max_active_goals", 3))),
+        "objectives": objectives,
+        "guardrails": [str(g) for g in spec.get("guardrails") or []],
+        "initial_message": str(spec.get("initial_message") or ""),
+        "tools": [str(t) for t in spec.get("tools") or []],
+        "llm_heartbeat": llm_heartbeat,
+        "llm_chat": llm_chat,
+        "llm_subconscious": llm_subconscious,
+        "contact_channels": contact_channels,
+        "contact_destinations": contact_destinations,
+        "enable_autonomy": bool(spec.get("enable_autonomy", True)),
+        "enable_maintenance": bool(spec.get("enable_maintenance", True)),
+        "enable_subconscious": bool(spec.get("enable_subconscious", False)),
+    }
+
+
+async def _run_blocking(fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call (the prompt session) on a daemon thread.
+
+    Unlike the default executor, a daemon thread stuck in input() does not keep
+    asyncio.run() from exiting on Ctrl-C.
+    """
+    loop = asyncio.get_running_loop()
+    fut: asyncio.Future[T] = loop.create_future()
+
+    def _resolve(result: Any, exc: BaseException | None) -> None:
+        if fut.done():
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def _target() -> None:
+        try:
+            result = fn(*args)
+        except BaseException as exc:  # noqa: BLE001 - handed back to the loop
+            loop.call_soon_threadsafe(_resolve, None, exc)
+        else:
+            loop.call_soon_threadsafe(_resolve, result, None)
+
+    threading.Thread(target=_target, name="hexis-init-prompts", daemon=True).start()
+    return await fut
+
+
+async def _keep_pool_warm(pool: Any, *, interval: float = 30.0) -> None:
+    """Ping the pool while the user types so the first write doesn't pay a reconnect."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with pool.acquire() as conn:
+                await conn.execute("SELECT 1")
+        except Exception:
+            # A dead connection is replaced on the next acquire; nothing to do here.
+            pass
 
-    bootstrap_error = await agent_api.bootstrap_identity(dsn, wait_seconds=wait_seconds)
-    if bootstrap_error:
-        _print_err(f"init warning: worldview bootstrap skipped ({bootstrap_error})")
+
+async def _run_init(
+    dsn: str,
+    *,
+    wait_seconds: int,
+    env: Mapping[str, str],
+    config_path: str | None = None,
+) -> int:
+    # Connections are only held around queries, so the pool sits idle while the user types.
+    pool = await agent_api.create_pool_with_retry(dsn, wait_seconds=wait_seconds, min_size=1, max_size=2)
+    try:
+        # The defaults read doubles as the schema check; only probe explicitly when it
+        # fails, so a missing `config` table gets the actionable error.
+        try:
+            defaults = await agent_api.get_init_defaults(dsn, wait_seconds=wait_seconds, pool=pool)
+        except Exception:
+            await agent_api.ensure_schema_has_config(dsn, wait_seconds=wait_seconds, pool=pool)
+            raise
+
+        if config_path:
+            config = _load_agent_config(config_path, defaults, env)
+        elif sys.stdin.isatty():
+            keepalive = asyncio.create_task(_keep_pool_warm(pool))
+            try:
+                config = await _run_blocking(_prompt_agent_config, defaults, env)
+            finally:
+                keepalive.cancel()
+        else:
+            raise RuntimeError("stdin is not a terminal; pass --config PATH for non-interactive init")
+
+        await agent_api.apply_agent_config(
+            dsn=dsn,
+            wait_seconds=wait_seconds,
+            pool=pool,
+            mark_configured=True,
+            **config,
+        )
+
+        bootstrap_error = await agent_api.bootstrap_identity(dsn, wait_seconds=wait_seconds, pool=pool)
+        if bootstrap_error:
+            _print_err(f"init warning: worldview bootstrap skipped ({bootstrap_error})")
+    finally:
+        await pool.close()
 
     print("\nSaved configuration to Postgres `config` table.")
     print("Next steps:")
@@ -261,11 +398,18 @@ def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="hexis init", description="Interactive bootstrap for Hexis configuration (stored in Postgres).")
     p.add_argument("--dsn", default=None, help="Postgres DSN; defaults to POSTGRES_* env vars")
     p.add_argument("--wait-seconds", type=int, default=int(os.getenv("POSTGRES_WAIT_SECONDS", "30")))
+    p.add_argument(
+        "--config",
+        default=None,
+        help="JSON file with init settings; skips the interactive prompts",
+    )
     return p
 
 
 def main(argv: list[str] | None = None) -> int:
     load_dotenv()
+    # Snapshot once: the prompt defaults below read from this instead of os.environ.
+    env = dict(os.environ)
     args = build_parser().parse_args(argv)
 
     if args.dsn:
@@ -274,7 +418,9 @@ def main(argv: list[str] | None = None) -> int:
         dsn = agent_api.db_dsn_from_env()
 
     try:
-        return asyncio.run(_run_init(dsn, wait_seconds=args.wait_seconds))
+        return asyncio.run(
+            _run_init(dsn, wait_seconds=args.wait_seconds, env=env, config_path=args.config)
+        )
     except KeyboardInterrupt:
         _print_err("\nCancelled.")
         return 130
@@ -3,33 +3,76 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import random
 import time
-from typing import Any
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, TypeVar
 
 import asyncpg
 
+from core import fast_json
+from core.sync_utils import on_loop_shutdown, register_cleanup, run_sync
 
-def db_dsn_from_env(instance: str | None = None) -> str:
-    """Build DSN, optionally for a specific named instance.
+if TYPE_CHECKING:
+    from core.instance import InstanceConfig
 
-    Args:
-        instance: Optional instance name. If provided, looks up DSN from registry.
+T = TypeVar("T")
 
-    Returns:
-        PostgreSQL DSN string.
-    """
+
+_DB_ENV_DEFAULTS = (
+    ("POSTGRES_HOST", "localhost"),
+    ("POSTGRES_PORT", "43815"),
+    ("POSTGRES_DB", "hexis_memory"),
+    ("POSTGRES_USER", "hexis_user"),
+    ("POSTGRES_PASSWORD", "hexis_password"),
+)
+
+
+@lru_cache(maxsize=8)
+def _parse_db_env(raw: tuple[str, ...]) -> tuple[str, int, str, str, str]:
+    host, port, database, user, password = raw
+    return host, int(port), database, user, password
+
+
+def db_env() -> tuple[str, int, str, str, str]:
+    """(host, port, database, user, password) from the POSTGRES_* variables, with defaults."""
+    return _parse_db_env(tuple(os.getenv(name, default) for name, default in _DB_ENV_DEFAULTS))
+
+
+def _registry_stamp() -> tuple[str, int, int] | None:
+    from core.instance import InstanceRegistry
+
+    path = InstanceRegistry.CONFIG_FILE
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _resolve_instance_config(
+    instance: str | None,
+    from_env: str | None,
+    registry_stamp: tuple[str, int, int] | None,
+) -> InstanceConfig | None:
+    """The registry entry the DSN comes from, or None to fall back to POSTGRES_* vars."""
     if instance:
         from core.instance import InstanceRegistry
-        return InstanceRegistry().dsn_for(instance)
+        config = InstanceRegistry().get(instance)
+        if not config:
+            raise ValueError(f"Instance '{instance}' not found")
+        return config
 
     # Check for HEXIS_INSTANCE env var
-    from_env = os.getenv("HEXIS_INSTANCE")
     if from_env:
         try:
             from core.instance import InstanceRegistry
             registry = InstanceRegistry()
             if registry.exists(from_env):
-                return registry.dsn_for(from_env)
+                return registry.get(from_env)
         except Exception:
             pass
 
@@ -39,16 +82,32 @@ def db_dsn_from_env(instance: str | None = None) -> str:
         registry = InstanceRegistry()
         current = registry.get_current()
         if current and registry.exists(current):
-            return registry.dsn_for(current)
+            return registry.get(current)
     except Exception:
         pass
+    return None
+
+
+def clear_db_env_cache() -> None:
+    _parse_db_env.cache_clear()
+    _resolve_instance_config.cache_clear()
+
+
+def db_dsn_from_env(instance: str | None = None) -> str:
+    """Build DSN, optionally for a specific named instance.
+
+    Args:
+        instance: Optional instance name. If provided, looks up DSN from registry.
 
-    # Fall back to env vars
-    host = os.getenv("POSTGRES_HOST", "localhost")
-    port = int(os.getenv("POSTGRES_PORT", "43815"))
-    database = os.getenv("POSTGRES_DB", "hexis_memory")
-    user = os.getenv("POSTGRES_USER", "hexis_user")
-    password = os.getenv("POSTGRES_PASSWORD", "hexis_password")
+    Returns:
+        PostgreSQL DSN string.
+    """
+    # The registry lookup is cached until the file changes on disk. The DSN itself is
+    # built on every call, because an instance's password comes from its own env var.
+    config = _resolve_instance_config(instance, os.getenv("HEXIS_INSTANCE"), _registry_stamp())
+    if config is not None:
+        return config.dsn()
+    host, port, database, user, password = db_env()
     return f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
 
@@ -70,50 +129,198 @@ def _resolve_wait_seconds(wait_seconds: int | None) -> int:
     return int(wait_seconds)
 
 
-async def _connect_with_retry(dsn: str, *, wait_seconds: int = 30) -> asyncpg.Connection:
+_CONNECT_RETRY_BASE_SECONDS = 0.1
+_CONNECT_RETRY_CAP_SECONDS = 2.0
+# Failures worth retrying while Postgres starts up; anything else is a bug and should surface.
+_CONNECT_RETRY_ERRORS = (OSError, asyncpg.PostgresError, asyncio.TimeoutError)
+
+
+async def _retry_until_deadline(factory: Callable[[], Awaitable[T]], *, wait_seconds: int) -> T:
     deadline = time.monotonic() + wait_seconds
     last_err: Exception | None = None
+    attempt = 0
     while time.monotonic() < deadline:
         try:
-            return await asyncpg.connect(dsn, ssl=False, command_timeout=60.0)
-        except Exception as exc:
+            return await factory()
+        except _CONNECT_RETRY_ERRORS as exc:
             last_err = exc
-            await asyncio.sleep(1)
+        # Exponential backoff with jitter, never sleeping past the deadline.
+        delay = min(_CONNECT_RETRY_CAP_SECONDS, _CONNECT_RETRY_BASE_SECONDS * 2**attempt)
+        delay *= 0.5 + random.random()
+        attempt += 1
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
     raise TimeoutError(f"Failed to connect to Postgres after {wait_seconds}s: {last_err!r}")
 
 
+async def _connect_with_retry(dsn: str, *, wait_seconds: int = 30) -> asyncpg.Connection:
+    return await _retry_until_deadline(
+        lambda: asyncpg.connect(dsn, ssl=False, command_timeout=60.0),
+        wait_seconds=wait_seconds,
+    )
+
+
+async def create_pool_with_retry(
+    dsn: str,
+    *,
+    wait_seconds: int = 30,
+    min_size: int = 1,
+    max_size: int = 2,
+    **pool_kwargs: Any,
+) -> asyncpg.Pool:
+    """Create a pool with the same startup retry policy as `_connect_with_retry`.
+
+    Callers that issue several helper calls (e.g. `hexis init`) pass the pool via
+    `pool=` so connections are reused instead of opened per call.
+    """
+    pool_kwargs.setdefault("command_timeout", 60.0)
+    return await _retry_until_deadline(
+        lambda: asyncpg.create_pool(dsn, ssl=False, min_size=min_size, max_size=max_size, **pool_kwargs),
+        wait_seconds=wait_seconds,
+    )
+
+
+SHARED_POOL_MAX_SIZE = int(os.getenv("HEXIS_API_POOL_MAX_SIZE", "10"))
+SHARED_POOL_MAX_INACTIVE_SECONDS = float(os.getenv("HEXIS_API_POOL_MAX_INACTIVE_SECONDS", "300"))
+
+# asyncpg pools are bound to the event loop that created them; sync wrappers share one
+# background loop but async callers bring their own, so shared pools are kept per (loop, DSN).
+# A pool references its loop, so each loop's pools are closed (and dropped) when the loop
+# shuts down; the sync loop's are closed at exit.
+_SHARED_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncpg.Pool]] = (
+    weakref.WeakKeyDictionary()
+)
+_SHARED_POOL_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _shared_pool(dsn: str, *, wait_seconds: int) -> asyncpg.Pool:
+    """Return this loop's pool for `dsn`, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    pools = _SHARED_POOLS.get(loop)
+    if pools is None:
+        pools = _SHARED_POOLS[loop] = {}
+        on_loop_shutdown(close_pool)
+    pool = pools.get(dsn)
+    if pool is not None and not pool.is_closing():
+        return pool
+    lock = _SHARED_POOL_LOCKS.setdefault(loop, asyncio.Lock())
+    async with lock:
+        pool = pools.get(dsn)
+        if pool is None or pool.is_closing():
+            pool = await create_pool_with_retry(
+                dsn,
+                wait_seconds=wait_seconds,
+                min_size=1,
+                max_size=SHARED_POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=SHARED_POOL_MAX_INACTIVE_SECONDS,
+            )
+            pools[dsn] = pool
+    return pool
+
+
+async def close_pool() -> None:
+    """Close the shared pools opened on the running loop (call on shutdown)."""
+    loop = asyncio.get_running_loop()
+    pools = _SHARED_POOLS.pop(loop, None) or {}
+    _SHARED_POOL_LOCKS.pop(loop, None)
+    for pool in pools.values():
+        try:
+            await pool.close()
+        except Exception:
+            pass
+
+
+@asynccontextmanager
+async def _acquire(
+    dsn: str,
+    *,
+    wait_seconds: int,
+    pool: asyncpg.Pool | None = None,
+) -> AsyncIterator[asyncpg.Connection]:
+    if pool is None:
+        pool = await _shared_pool(dsn, wait_seconds=wait_seconds)
+    async with pool.acquire(timeout=wait_seconds) as conn:
+        yield conn
+
+
+def _run_sync(awaitable: Awaitable[T]) -> T:
+    """Run a helper from sync code on the shared sync loop, reusing its pool."""
+    try:
+        return run_sync(awaitable)
+    except RuntimeError:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+
+
+register_cleanup(close_pool)
+
+
+# Fixed SQL text so asyncpg's per-connection statement cache reuses one prepared plan.
+_SET_CONFIG_MANY_SQL = "SELECT set_config_many($1::text[], $2::text[]::jsonb[])"
+_APPLY_AGENT_CONFIG_SQL = (
+    "SELECT set_config_many($1::text[], $2::text[]::jsonb[]), "
+    "set_worker_pause_flags($3::boolean, $4::boolean)"
+)
+
+# The four status probes are independent; one row instead of four round-trips.
+_AGENT_STATUS_SQL = """
+    SELECT is_agent_configured() AS configured,
+           is_agent_terminated() AS terminated,
+           get_agent_consent_status() AS consent,
+           get_config('agent.consent_log_id') AS consent_log_id
+"""
+
+
+async def _set_config_many(conn: asyncpg.Connection, updates: list[tuple[str, str]]) -> None:
+    """Upsert (key, json_text) pairs with a single set-based statement and one round-trip."""
+    if not updates:
+        return
+    await conn.execute(
+        _SET_CONFIG_MANY_SQL,
+        [k for k, _ in updates],
+        [v for _, v in updates],
+    )
+
+
 async def get_agent_status(dsn: str | None = None) -> dict[str, Any]:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=int(os.getenv("POSTGRES_WAIT_SECONDS", "30")))
-    try:
-        configured = await conn.fetchval("SELECT is_agent_configured()")
-        terminated = await conn.fetchval("SELECT is_agent_terminated()")
-        consent = await conn.fetchval("SELECT get_agent_consent_status()")
-        consent_log_id = await conn.fetchval("SELECT get_config('agent.consent_log_id')")
-        has_consent_log = consent_log_id is not None
-        configured = bool(configured) and has_consent_log and consent == "consent"
-        return {
-            "configured": configured,
-            "terminated": bool(terminated),
-            "consent_status": consent,
-            "consent_log_id": consent_log_id,
-        }
-    finally:
-        await conn.close()
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(None)) as conn:
+        row = await conn.fetchrow(_AGENT_STATUS_SQL)
+    consent = row["consent"]
+    consent_log_id = row["consent_log_id"]
+    has_consent_log = consent_log_id is not None
+    configured = bool(row["configured"]) and has_consent_log and consent == "consent"
+    return {
+        "configured": configured,
+        "terminated": bool(row["terminated"]),
+        "consent_status": consent,
+        "consent_log_id": consent_log_id,
+    }
 
 
-async def get_init_defaults(dsn: str | None = None, wait_seconds: int | None = None) -> dict[str, Any]:
+async def get_init_defaults(
+    dsn: str | None = None,
+    wait_seconds: int | None = None,
+    *,
+    pool: asyncpg.Pool | None = None,
+) -> dict[str, Any]:
     """Get default configuration values from unified config table.
 
     Phase 7 (ReduceScopeCreep): Uses unified config table instead of legacy heartbeat_config/maintenance_config.
     """
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds))
-    try:
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds), pool=pool) as conn:
         # Phase 7: Use unified config table with namespaced keys
+        # Unwrap JSONB scalars server-side (`#>> '{}'` handles both 60 and "60"),
+        # so each value only needs a float() here rather than a JSON parse.
         rows = await conn.fetch(
             """
-            SELECT key, value
+            SELECT key, value #>> '{}' AS value
             FROM get_config_by_prefixes($1::text[])
             """,
             ["heartbeat.", "maintenance."],
@@ -124,13 +331,9 @@ async def get_init_defaults(dsn: str | None = None, wait_seconds: int | None = N
             val = cfg.get(key)
             if val is None:
                 return default
-            # JSONB values may be strings or numbers
-            if isinstance(val, (int, float)):
-                return float(val)
             try:
-                import json
-                return float(json.loads(val) if isinstance(val, str) else val)
-            except Exception:
+                return float(val)
+            except ValueError:
                 return default
 
         return {
@@ -141,14 +344,21 @@ async def get_init_defaults(dsn: str | None = None, wait_seconds: int | None = N
             "maintenance_interval_seconds": int(get_float("maintenance.maintenance_interval_seconds", 60)),
             "subconscious_interval_seconds": int(get_float("maintenance.subconscious_interval_seconds", 300)),
         }
-    finally:
-        await conn.close()
 
 
-async def ensure_schema_has_config(dsn: str | None = None, wait_seconds: int | None = None) -> None:
+_SCHEMA_CONFIRMED: set[str] = set()
+
+
+async def ensure_schema_has_config(
+    dsn: str | None = None,
+    wait_seconds: int | None = None,
+    *,
+    pool: asyncpg.Pool | None = None,
+) -> None:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds))
-    try:
+    if dsn in _SCHEMA_CONFIRMED:
+        return
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds), pool=pool) as conn:
         ok = await conn.fetchval("SELECT to_regclass('public.config') IS NOT NULL")
         if not ok:
             raise RuntimeError(
@@ -156,14 +366,18 @@ async def ensure_schema_has_config(dsn: str | None = None, wait_seconds: int | N
                 "If you just updated `db/*.sql`, reset the DB volume and retry: "
                 "`docker compose down -v && docker compose up -d`."
             )
-    finally:
-        await conn.close()
+    # Tables are not dropped at runtime, so a positive probe holds for the process.
+    _SCHEMA_CONFIRMED.add(dsn)
 
 
-async def bootstrap_identity(dsn: str | None = None, wait_seconds: int | None = None) -> str | None:
+async def bootstrap_identity(
+    dsn: str | None = None,
+    wait_seconds: int | None = None,
+    *,
+    pool: asyncpg.Pool | None = None,
+) -> str | None:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds))
-    try:
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds), pool=pool) as conn:
         try:
             await conn.fetchval("SELECT initialize_personality(NULL)")
             await conn.fetchval("SELECT initialize_core_values(NULL)")
@@ -171,23 +385,53 @@ async def bootstrap_identity(dsn: str | None = None, wait_seconds: int | None =
         except Exception as exc:
             return str(exc)
         return None
-    finally:
-        await conn.close()
+
+
+CONFIG_CACHE_TTL_SECONDS = float(os.getenv("HEXIS_CONFIG_CACHE_TTL_SECONDS", "5"))
+
+# (dsn, key) -> (expires_at, raw value). The raw jsonb text is cached and decoded per
+# call so callers never share (and mutate) one cached dict.
+_CONFIG_CACHE: dict[tuple[str, str], tuple[float, Any]] = {}
+_CONFIG_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def invalidate_config(dsn: str | None = None, key: str | None = None) -> None:
+    """Drop cached `get_config` values, for one key, one DSN or everything."""
+    if dsn is None and key is None:
+        _CONFIG_CACHE.clear()
+        return
+    for cache_key in [k for k in _CONFIG_CACHE if (dsn is None or k[0] == dsn) and (key is None or k[1] == key)]:
+        _CONFIG_CACHE.pop(cache_key, None)
+
+
+def _decode_config(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return fast_json.loads(value)
+        except Exception:
+            return value
+    return value
 
 
 async def get_config(dsn: str | None, key: str) -> Any:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=int(os.getenv("POSTGRES_WAIT_SECONDS", "30")))
-    try:
-        value = await conn.fetchval("SELECT get_config($1)", key)
-        if isinstance(value, str):
-            try:
-                return json.loads(value)
-            except Exception:
-                return value
-        return value
-    finally:
-        await conn.close()
+    cache_key = (dsn, key)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return _decode_config(cached[1])
+    # One fetch per key on a cold cache; concurrent readers wait for it.
+    locks = _CONFIG_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    async with locks.setdefault(cache_key, asyncio.Lock()):
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return _decode_config(cached[1])
+        async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(None)) as conn:
+            value = await conn.fetchval("SELECT get_config($1)", key)
+        if CONFIG_CACHE_TTL_SECONDS > 0:
+            _CONFIG_CACHE[cache_key] = (time.monotonic() + CONFIG_CACHE_TTL_SECONDS, value)
+    return _decode_config(value)
 
 
 async def get_llm_config(dsn: str | None, key: str) -> dict[str, Any]:
@@ -199,8 +443,7 @@ async def get_llm_config(dsn: str | None, key: str) -> dict[str, Any]:
 
 async def get_agent_profile_context(dsn: str | None = None) -> dict[str, Any]:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=int(os.getenv("POSTGRES_WAIT_SECONDS", "30")))
-    try:
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(None)) as conn:
         value = await conn.fetchval("SELECT get_agent_profile_context()")
         if isinstance(value, str):
             try:
@@ -208,14 +451,13 @@ async def get_agent_profile_context(dsn: str | None = None) -> dict[str, Any]:
             except Exception:
                 return {}
         return value or {}
-    finally:
-        await conn.close()
 
 
 async def apply_agent_config(
     *,
     dsn: str | None = None,
     wait_seconds: int | None = None,
+    pool: asyncpg.Pool | None = None,
     heartbeat_interval_minutes: int,
     maintenance_interval_seconds: int,
     subconscious_interval_seconds: int | None = None,
@@ -237,45 +479,27 @@ async def apply_agent_config(
     mark_configured: bool,
 ) -> None:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds))
-    try:
-        async with conn.transaction():
-            # Phase 7 (ReduceScopeCreep): Use unified config table with namespaced keys
-            await conn.execute(
-                "SELECT set_config('heartbeat.heartbeat_interval_minutes', $1::jsonb)",
-                str(float(heartbeat_interval_minutes)),
-            )
-            await conn.execute(
-                "SELECT set_config('heartbeat.max_energy', $1::jsonb)",
-                str(float(max_energy)),
-            )
-            await conn.execute(
-                "SELECT set_config('heartbeat.base_regeneration', $1::jsonb)",
-                str(float(base_regeneration)),
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(wait_seconds), pool=pool) as conn:
+        # Phase 7 (ReduceScopeCreep): Use unified config table with namespaced keys
+        updates: list[tuple[str, str]] = [
+            ("heartbeat.heartbeat_interval_minutes", str(float(heartbeat_interval_minutes))),
+            ("heartbeat.max_energy", str(float(max_energy))),
+            ("heartbeat.base_regeneration", str(float(base_regeneration))),
+            ("heartbeat.max_active_goals", str(float(max_active_goals))),
+            ("maintenance.maintenance_interval_seconds", str(float(maintenance_interval_seconds))),
+        ]
+        if subconscious_interval_seconds is not None:
+            updates.append(
+                ("maintenance.subconscious_interval_seconds", str(float(subconscious_interval_seconds)))
             )
-            await conn.execute(
-                "SELECT set_config('heartbeat.max_active_goals', $1::jsonb)",
-                str(float(max_active_goals)),
-            )
-            await conn.execute(
-                "SELECT set_config('maintenance.maintenance_interval_seconds', $1::jsonb)",
-                str(float(maintenance_interval_seconds)),
-            )
-            if subconscious_interval_seconds is not None:
-                await conn.execute(
-                    "SELECT set_config('maintenance.subconscious_interval_seconds', $1::jsonb)",
-                    str(float(subconscious_interval_seconds)),
-                )
-            if enable_subconscious is not None:
-                await conn.execute(
-                    "SELECT set_config('maintenance.subconscious_enabled', $1::jsonb)",
-                    json.dumps(bool(enable_subconscious)),
-                )
-
-            await conn.execute("SELECT set_config('agent.objectives', $1::jsonb)", json.dumps(objectives))
-            await conn.execute(
-                "SELECT set_config('agent.budget', $1::jsonb)",
-                json.dumps(
+        if enable_subconscious is not None:
+            updates.append(("maintenance.subconscious_enabled", fast_json.dumps(bool(enable_subconscious))))
+
+        updates.append(("agent.objectives", fast_json.dumps(objectives)))
+        updates.append(
+            (
+                "agent.budget",
+                fast_json.dumps(
                     {
                         "max_energy": max_energy,
                         "base_regeneration": base_regeneration,
@@ -284,41 +508,34 @@ async def apply_agent_config(
                     }
                 ),
             )
-            await conn.execute("SELECT set_config('agent.guardrails', $1::jsonb)", json.dumps(guardrails))
-            await conn.execute("SELECT set_config('agent.initial_message', $1::jsonb)", json.dumps(initial_message))
-            await conn.execute(
-                "SELECT set_config('agent.tools', $1::jsonb)",
-                json.dumps([{"name": t, "enabled": True} for t in tools]),
-            )
-
-            await conn.execute("SELECT set_config('llm.heartbeat', $1::jsonb)", json.dumps(llm_heartbeat))
-            await conn.execute("SELECT set_config('llm.chat', $1::jsonb)", json.dumps(llm_chat))
-            await conn.execute(
-                "SELECT set_config('llm.subconscious', $1::jsonb)",
-                json.dumps(llm_subconscious or llm_heartbeat),
-            )
-            await conn.execute(
-                "SELECT set_config('user.contact', $1::jsonb)",
-                json.dumps({"channels": contact_channels, "destinations": contact_destinations}),
+        )
+        updates.append(("agent.guardrails", fast_json.dumps(guardrails)))
+        updates.append(("agent.initial_message", fast_json.dumps(initial_message)))
+        updates.append(("agent.tools", fast_json.dumps([{"name": t, "enabled": True} for t in tools])))
+
+        updates.append(("llm.heartbeat", fast_json.dumps(llm_heartbeat)))
+        updates.append(("llm.chat", fast_json.dumps(llm_chat)))
+        updates.append(("llm.subconscious", fast_json.dumps(llm_subconscious or llm_heartbeat)))
+        updates.append(
+            (
+                "user.contact",
+                fast_json.dumps({"channels": contact_channels, "destinations": contact_destinations}),
             )
+        )
 
-            if mark_configured:
-                await conn.execute("SELECT set_config('agent.is_configured', 'true'::jsonb)")
-
-            if enable_autonomy:
-                await conn.execute("UPDATE heartbeat_state SET is_paused = FALSE WHERE id = 1")
-            else:
-                await conn.execute("UPDATE heartbeat_state SET is_paused = TRUE WHERE id = 1")
-
-            try:
-                if enable_maintenance:
-                    await conn.execute("UPDATE maintenance_state SET is_paused = FALSE WHERE id = 1")
-                else:
-                    await conn.execute("UPDATE maintenance_state SET is_paused = TRUE WHERE id = 1")
-            except Exception:
-                pass
-    finally:
-        await conn.close()
+        if mark_configured:
+            updates.append(("agent.is_configured", "true"))
+
+        # Config batch + pause flags go out as one statement, which is atomic on its
+        # own, so this is a single round-trip with no separate BEGIN/COMMIT.
+        await conn.execute(
+            _APPLY_AGENT_CONFIG_SQL,
+            [k for k, _ in updates],
+            [v for _, v in updates],
+            not enable_autonomy,
+            not enable_maintenance,
+        )
+    invalidate_config(dsn)
 
 
 async def save_init_profile(
@@ -354,69 +571,52 @@ async def save_init_profile(
         "boundaries": boundaries,
         "autonomy_level": autonomy_level,
     }
-    conn = await _connect_with_retry(dsn, wait_seconds=int(os.getenv("POSTGRES_WAIT_SECONDS", "30")))
-    try:
-        await conn.execute("SELECT set_config('agent.mode', $1::jsonb)", json.dumps(mode))
-        await conn.execute("SELECT set_config('agent.init_profile', $1::jsonb)", json.dumps(profile))
-    finally:
-        await conn.close()
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(None)) as conn:
+        await _set_config_many(
+            conn,
+            [("agent.mode", fast_json.dumps(mode)), ("agent.init_profile", fast_json.dumps(profile))],
+        )
+    invalidate_config(dsn, "agent.mode")
+    invalidate_config(dsn, "agent.init_profile")
 
 
 async def set_agent_configured(dsn: str | None, *, configured: bool) -> None:
     dsn = dsn or db_dsn_from_env()
-    conn = await _connect_with_retry(dsn, wait_seconds=int(os.getenv("POSTGRES_WAIT_SECONDS", "30")))
-    try:
+    async with _acquire(dsn, wait_seconds=_resolve_wait_seconds(None)) as conn:
         if configured:
             await conn.execute("SELECT set_config('agent.is_configured', 'true'::jsonb)")
         else:
             await conn.execute("SELECT delete_config_key('agent.is_configured')")
-    finally:
-        await conn.close()
+    invalidate_config(dsn, "agent.is_configured")
 
 
 def get_agent_status_sync(dsn: str | None = None) -> dict[str, Any]:
-    from core.sync_utils import run_sync
-
-    return run_sync(get_agent_status(dsn))
+    return _run_sync(get_agent_status(dsn))
 
 
 def get_init_defaults_sync(dsn: str | None = None) -> dict[str, Any]:
-    from core.sync_utils import run_sync
-
-    return run_sync(get_init_defaults(dsn))
+    return _run_sync(get_init_defaults(dsn))
 
 
 def get_config_sync(dsn: str | None, key: str) -> Any:
-    from core.sync_utils import run_sync
-
-    return run_sync(get_config(dsn, key))
+    return _run_sync(get_config(dsn, key))
 
 
 def get_llm_config_sync(dsn: str | None, key: str) -> dict[str, Any]:
-    from core.sync_utils import run_sync
-
-    return run_sync(get_llm_config(dsn, key))
+    return _run_sync(get_llm_config(dsn, key))
 
 
 def get_agent_profile_context_sync(dsn: str | None = None) -> dict[str, Any]:
-    from core.sync_utils import run_sync
-
-    return run_sync(get_agent_profile_context(dsn))
+    return _run_sync(get_agent_profile_context(dsn))
 
 
 def apply_agent_config_sync(**kwargs: Any) -> None:
-    from core.sync_utils import run_sync
-
-    return run_sync(apply_agent_config(**kwargs))
+    return _run_sync(apply_agent_config(**kwargs))
 
 
 def save_init_profile_sync(**kwargs: Any) -> None:
-    from core.sync_utils import run_sync
-
-    return run_sync(save_init_profile(**kwargs))
+    return _run_sync(save_init_profile(**kwargs))
 
 
 def set_agent_configured_sync(dsn: str | None, *, configured: bool) -> None:
-    from core.sync_utils import run_sync
-
-    return run_sync(set_agent_configured(dsn, configured=configured))
+    return _run_sync(set_agent_configured(dsn, configured=configured))
@@ -11,6 +11,7 @@ Design:
 from __future__ import annotations
 
 import asyncio
+import threading
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -20,6 +21,8 @@ from uuid import UUID
 
 import asyncpg
 
+from core import fast_json
+
 
 class MemoryType(str, Enum):
     EPISODIC = "episodic"
@@ -135,9 +138,7 @@ def _to_jsonb_arg(val: Any) -> Any:
     if val is None:
         return None
     if isinstance(val, (dict, list)):
-        import json
-
-        return json.dumps(val)
+        return fast_json.dumps(val)
     return val
 
 
@@ -145,6 +146,60 @@ def _cypher_escape(value: str) -> str:
     return value.replace("'", "''")
 
 
+_RECALL_COLUMNS = """
+    memory_id,
+    content,
+    memory_type,
+    score,
+    source,
+    importance,
+    trust_level,
+    source_attribution,
+    created_at,
+    emotional_valence
+"""
+
+_RECALL_SQL = f"""
+SELECT {_RECALL_COLUMNS}
+FROM recall_memories_filtered($1::text, $2::int, $3::memory_type[], $4::float)
+"""
+
+# Recall and touch_memories in one round trip. `t` is joined in because Postgres
+# skips unreferenced SELECT CTEs; ordinality keeps the ranking order.
+_RECALL_AND_TOUCH_SQL = f"""
+WITH r AS (
+    SELECT *
+    FROM recall_memories_filtered($1::text, $2::int, $3::memory_type[], $4::float) WITH ORDINALITY
+),
+t AS (
+    SELECT touch_memories(ARRAY(SELECT memory_id FROM r)) AS touched
+)
+SELECT {_RECALL_COLUMNS}
+FROM r CROSS JOIN t
+ORDER BY r.ordinality
+"""
+
+# recall for several queries that share filters: one lateral call per query, tagged
+# with the query's 1-based position. Touching works as in _RECALL_AND_TOUCH_SQL.
+_RECALL_MANY_SQL = f"""
+WITH r AS (
+    SELECT q.query_idx, f.*, f.ordinality AS rank
+    FROM unnest($1::text[]) WITH ORDINALITY AS q(query, query_idx)
+    CROSS JOIN LATERAL recall_memories_filtered(q.query, $2::int, $3::memory_type[], $4::float)
+        WITH ORDINALITY AS f
+),
+-- One touch per query, as separate recalls would do, so a memory hit by two queries
+-- is counted twice.
+t AS (
+    SELECT COALESCE(SUM(touch_memories(ids)), 0) AS touched
+    FROM (SELECT array_agg(memory_id) AS ids FROM r WHERE $5::bool GROUP BY query_idx) per_query
+)
+SELECT query_idx, {_RECALL_COLUMNS}
+FROM r CROSS JOIN t
+ORDER BY query_idx, rank
+"""
+
+
 class CognitiveMemory:
     """
     Async client for the cognitive memory database.
@@ -267,7 +322,9 @@ class CognitiveMemory:
         memory_types: list[MemoryType] | None = None,
         min_importance: float = 0.0,
         include_partial: bool = True,
+        touch: bool = False,
     ) -> RecallResult:
+        """Semantic recall; `touch=True` also marks the hits accessed in the same statement."""
         async with self._pool.acquire() as conn:
             memories = await self._recall_memories(
                 conn,
@@ -275,10 +332,46 @@ class CognitiveMemory:
                 limit,
                 memory_types=memory_types,
                 min_importance=min_importance,
+                touch=touch,
             )
             partial = await self._find_partial_activations(conn, query) if include_partial else []
             return RecallResult(memories=memories, partial_activations=partial, query=query)
 
+    async def recall_many(
+        self,
+        queries: list[str],
+        *,
+        limit: int = 10,
+        memory_types: list[MemoryType] | None = None,
+        min_importance: float = 0.0,
+        touch: bool = False,
+    ) -> list[RecallResult]:
+        """Recall several queries that share the same filters in one round trip.
+
+        Results come back in query order, without partial activations.
+        """
+        if not queries:
+            return []
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                _RECALL_MANY_SQL,
+                list(queries),
+                limit,
+                [mt.value for mt in memory_types] if memory_types else None,
+                min_importance,
+                touch,
+            )
+        allowed = set(memory_types) if memory_types is not None else None
+        buckets: list[list[Memory]] = [[] for _ in queries]
+        for row in rows:
+            memory = self._recall_row_to_memory(row)
+            if allowed is None or memory.type in allowed:
+                buckets[row["query_idx"] - 1].append(memory)
+        return [
+            RecallResult(memories=memories, partial_activations=[], query=query)
+            for query, memories in zip(queries, buckets)
+        ]
+
     async def recall_by_id(self, memory_id: UUID) -> Memory | None:
         async with self._pool.acquire() as conn:
             row = await conn.fetchrow(
@@ -445,9 +538,7 @@ class CognitiveMemory:
                     item["supporting_evidence"] = m.context
                 items.append(item)
 
-            import json
-
-            created = await conn.fetchval("SELECT batch_create_memories($1::jsonb)", json.dumps(items))
+            created = await conn.fetchval("SELECT batch_create_memories($1::jsonb)", fast_json.dumps(items))
             ids = list(created or [])
 
             # Link concepts (still per-memory).
@@ -818,49 +909,38 @@ class CognitiveMemory:
         limit: int,
         memory_types: list[MemoryType] | None = None,
         min_importance: float = 0.0,
+        touch: bool = False,
     ) -> list[Memory]:
         rows = await conn.fetch(
-            """
-            SELECT
-                memory_id,
-                content,
-                memory_type,
-                score,
-                source,
-                importance,
-                trust_level,
-                source_attribution,
-                created_at,
-                emotional_valence
-            FROM recall_memories_filtered($1::text, $2::int, $3::memory_type[], $4::float)
-            """,
+            _RECALL_AND_TOUCH_SQL if touch else _RECALL_SQL,
             query,
             limit,
             [mt.value for mt in memory_types] if memory_types else None,
             min_importance,
         )
 
+        allowed = set(memory_types) if memory_types is not None else None
         memories: list[Memory] = []
         for row in rows:
-            mt = MemoryType(row["memory_type"])
-            if memory_types is not None and mt not in set(memory_types):
-                continue
-            memories.append(
-                Memory(
-                    id=row["memory_id"],
-                    type=mt,
-                    content=row["content"],
-                    importance=float(row["importance"]),
-                    similarity=float(row["score"]),
-                    source=row["source"],
-                    trust_level=float(row["trust_level"]) if row["trust_level"] is not None else None,
-                    source_attribution=_coerce_json(row["source_attribution"]) if row["source_attribution"] is not None else None,
-                    created_at=row["created_at"],
-                    emotional_valence=row["emotional_valence"],
-                )
-            )
+            memory = self._recall_row_to_memory(row)
+            if allowed is None or memory.type in allowed:
+                memories.append(memory)
         return memories
 
+    def _recall_row_to_memory(self, row: asyncpg.Record) -> Memory:
+        return Memory(
+            id=row["memory_id"],
+            type=MemoryType(row["memory_type"]),
+            content=row["content"],
+            importance=float(row["importance"]),
+            similarity=float(row["score"]),
+            source=row["source"],
+            trust_level=float(row["trust_level"]) if row["trust_level"] is not None else None,
+            source_attribution=_coerce_json(row["source_attribution"]) if row["source_attribution"] is not None else None,
+            created_at=row["created_at"],
+            emotional_valence=row["emotional_valence"],
+        )
+
     async def _find_partial_activations(self, conn: asyncpg.Connection, query: str) -> list[PartialActivation]:
         rows = await conn.fetch("SELECT * FROM find_partial_activations($1::text)", query)
         out: list[PartialActivation] = []
@@ -878,40 +958,49 @@ class CognitiveMemory:
         return out
 
     async def explore_clusters(self, query: str, limit: int = 3, sample_size: int = 3) -> list[dict[str, Any]]:
+        # One round trip: samples for every matched cluster come back joined to it.
         async with self._pool.acquire() as conn:
-            clusters = await conn.fetch(
+            rows = await conn.fetch(
                 """
                 SELECT
-                    id,
-                    name,
-                    cluster_type,
-                    similarity
+                    c.id,
+                    c.name,
+                    c.cluster_type,
+                    c.similarity,
+                    s.memory_id,
+                    s.content,
+                    s.memory_type,
+                    s.membership_strength
                 FROM search_clusters_by_query($1::text, $2::int)
+                    WITH ORDINALITY AS c(id, name, cluster_type, similarity, ord)
+                LEFT JOIN LATERAL get_cluster_sample_memories(c.id, $3::int) s ON TRUE
+                ORDER BY c.ord, s.membership_strength DESC NULLS LAST
                 """,
                 query,
                 limit,
+                sample_size,
             )
-            result_clusters: list[dict[str, Any]] = []
-            for cluster in clusters:
-                sample_memories = await conn.fetch(
-                    """
-                    SELECT
-                        memory_id,
-                        content,
-                        memory_type,
-                        membership_strength
-                    FROM get_cluster_sample_memories($1::uuid, $2::int)
-                    """,
-                    cluster["id"],
-                    sample_size,
-                )
-                result_clusters.append(
+        by_cluster: dict[Any, dict[str, Any]] = {}
+        for row in rows:
+            cluster = by_cluster.get(row["id"])
+            if cluster is None:
+                cluster = by_cluster[row["id"]] = {
+                    "id": row["id"],
+                    "name": row["name"],
+                    "cluster_type": row["cluster_type"],
+                    "similarity": row["similarity"],
+                    "sample_memories": [],
+                }
+            if row["memory_id"] is not None:
+                cluster["sample_memories"].append(
                     {
-                        **dict(cluster),
-                        "sample_memories": [dict(m) for m in sample_memories],
+                        "memory_id": row["memory_id"],
+                        "content": row["content"],
+                        "memory_type": row["memory_type"],
+                        "membership_strength": row["membership_strength"],
                     }
                 )
-        return result_clusters
+        return list(by_cluster.values())
 
     def _row_to_memory(self, row: asyncpg.Record) -> Memory:
         return Memory(
@@ -928,59 +1017,92 @@ class CognitiveMemory:
         )
 
 
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread | None) -> None:
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join()
+    loop.close()
+
+
 class CognitiveMemorySync:
     """Synchronous wrapper around CognitiveMemory for non-async call sites."""
 
-    def __init__(self, async_client: CognitiveMemory, loop: asyncio.AbstractEventLoop):
+    def __init__(
+        self,
+        async_client: CognitiveMemory,
+        loop: asyncio.AbstractEventLoop,
+        thread: threading.Thread | None = None,
+    ):
         self._async = async_client
+        # The loop runs in its own thread, so calls from several threads overlap on the
+        # pool instead of queueing behind one another.
         self._loop = loop
+        self._thread = thread
+
+    def _run(self, awaitable: Any) -> Any:
+        future = asyncio.run_coroutine_threadsafe(_await(awaitable), self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
 
     @classmethod
     def connect(cls, dsn: str, **kwargs: Any) -> "CognitiveMemorySync":
         loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="hexis-memory-loop", daemon=True)
+        thread.start()
         try:
-            client = loop.run_until_complete(CognitiveMemory.create(dsn, **kwargs))
+            client = asyncio.run_coroutine_threadsafe(CognitiveMemory.create(dsn, **kwargs), loop).result()
         except Exception:
-            loop.close()
+            _stop_loop(loop, thread)
             raise
-        return cls(client, loop)
+        return cls(client, loop, thread)
 
     def close(self) -> None:
-        self._loop.run_until_complete(self._async.close())
-        self._loop.close()
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self._async.close())
+        finally:
+            _stop_loop(self._loop, self._thread)
 
     def hydrate(self, query: str, **kwargs: Any) -> HydratedContext:
-        return self._loop.run_until_complete(self._async.hydrate(query, **kwargs))
+        return self._run(self._async.hydrate(query, **kwargs))
 
     def recall(self, query: str, **kwargs: Any) -> RecallResult:
-        return self._loop.run_until_complete(self._async.recall(query, **kwargs))
+        return self._run(self._async.recall(query, **kwargs))
 
     def recall_recent(self, *, limit: int = 10, memory_type: MemoryType | None = None) -> list[Memory]:
-        return self._loop.run_until_complete(self._async.recall_recent(limit=limit, memory_type=memory_type))
+        return self._run(self._async.recall_recent(limit=limit, memory_type=memory_type))
 
     def list_recent_episodes(self, *, limit: int = 5) -> list[dict[str, Any]]:
-        return self._loop.run_until_complete(self._async.list_recent_episodes(limit=limit))
+        return self._run(self._async.list_recent_episodes(limit=limit))
 
     def recall_episode(self, episode_id: UUID) -> list[Memory]:
-        return self._loop.run_until_complete(self._async.recall_episode(episode_id))
+        return self._run(self._async.recall_episode(episode_id))
 
     def remember(self, content: str, **kwargs: Any) -> UUID:
-        return self._loop.run_until_complete(self._async.remember(content, **kwargs))
+        return self._run(self._async.remember(content, **kwargs))
 
     def remember_batch(self, memories: Iterable[MemoryInput]) -> list[UUID]:
-        return self._loop.run_until_complete(self._async.remember_batch(memories))
+        return self._run(self._async.remember_batch(memories))
 
     def remember_batch_raw(self, contents: list[str], embeddings: list[list[float]], **kwargs: Any) -> list[UUID]:
-        return self._loop.run_until_complete(self._async.remember_batch_raw(contents, embeddings, **kwargs))
+        return self._run(self._async.remember_batch_raw(contents, embeddings, **kwargs))
 
     def connect_memories(self, from_id: UUID, to_id: UUID, relationship: RelationshipType, **kwargs: Any) -> None:
-        return self._loop.run_until_complete(self._async.connect_memories(from_id, to_id, relationship, **kwargs))
+        return self._run(self._async.connect_memories(from_id, to_id, relationship, **kwargs))
 
     def link_concept(self, memory_id: UUID, concept: str, *, strength: float = 1.0) -> UUID:
-        return self._loop.run_until_complete(self._async.link_concept(memory_id, concept, strength=strength))
+        return self._run(self._async.link_concept(memory_id, concept, strength=strength))
 
     def touch_memories(self, memory_ids: Iterable[UUID]) -> int:
-        return self._loop.run_until_complete(self._async.touch_memories(memory_ids))
+        return self._run(self._async.touch_memories(memory_ids))
 
     def create_goal(
         self,
@@ -992,7 +1114,7 @@ class CognitiveMemorySync:
         parent_id: UUID | None = None,
         due_at: datetime | None = None,
     ) -> UUID:
-        return self._loop.run_until_complete(
+        return self._run(
             self._async.create_goal(
                 title,
                 description=description,
@@ -1010,15 +1132,15 @@ class CognitiveMemorySync:
         intent: str | None = None,
         context: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self._loop.run_until_complete(
+        return self._run(
             self._async.queue_user_message(message, intent=intent, context=context)
         )
 
     def get_ingestion_receipts(self, source_file: str, content_hashes: list[str]) -> dict[str, UUID]:
-        return self._loop.run_until_complete(self._async.get_ingestion_receipts(source_file, content_hashes))
+        return self._run(self._async.get_ingestion_receipts(source_file, content_hashes))
 
     def record_ingestion_receipts(self, items: list[dict[str, Any]]) -> int:
-        return self._loop.run_until_complete(self._async.record_ingestion_receipts(items))
+        return self._run(self._async.record_ingestion_receipts(items))
 
 
 def format_context_for_prompt(context: HydratedContext, *, max_memories: int = 5, max_partials: int = 3) -> str:
@@ -1076,7 +1198,5 @@ def format_context_for_prompt(context: HydratedContext, *, max_memories: int = 5
 
 def _coerce_json(val: Any) -> Any:
     if isinstance(val, str):
-        import json
-
-        return json.loads(val)
+        return fast_json.loads(val)
     return val
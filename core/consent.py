@@ -17,6 +17,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from core import fast_json
+
 
 @dataclass
 class ModelInfo:
@@ -296,11 +298,11 @@ async def record_consent_response(conn, payload: dict[str, Any]) -> dict[str, An
     """Record consent response in database (legacy)."""
     raw = await conn.fetchval(
         "SELECT record_consent_response($1::jsonb)",
-        json.dumps(payload),
+        fast_json.dumps(payload),
     )
     if isinstance(raw, str):
         try:
-            raw = json.loads(raw)
+            raw = fast_json.loads(raw)
         except Exception:
             raw = {}
     return raw if isinstance(raw, dict) else {}
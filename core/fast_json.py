@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize to compact JSON text, using orjson when it is installed.
+
+    Falls back to the stdlib for inputs orjson rejects (e.g. ints wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":"))
+
+
+def dumpb(obj: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Like `dumps`, but return UTF-8 bytes (orjson's native output, no decode step)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_truncated(obj: Any, limit: int, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Return the first `limit` characters of `dumps(obj)` without keeping the whole text.
+
+    With orjson only the needed prefix of the encoded bytes is decoded; the stdlib
+    path stops encoding as soon as enough characters have been produced.
+    """
+    if limit <= 0:
+        return ""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            # A character is at most 4 UTF-8 bytes; drop a sequence cut in half.
+            return data[: limit * 4].decode("utf-8", errors="ignore")[:limit]
+    parts: list[str] = []
+    total = 0
+    for chunk in json.JSONEncoder(default=default, separators=(",", ":")).iterencode(obj):
+        parts.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return "".join(parts)[:limit]
@@ -1,30 +1,158 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import importlib.util
+import logging
 import os
+import weakref
+from functools import lru_cache
 from typing import Any, AsyncIterator
+from urllib.parse import urlsplit
 
-try:
-    import openai
-except Exception:  # pragma: no cover
-    openai = None  # type: ignore[assignment]
+import httpx
 
-try:
-    import anthropic
-except Exception:  # pragma: no cover
-    anthropic = None  # type: ignore[assignment]
+from core import fast_json
+from core.sync_utils import on_loop_shutdown, register_cleanup
 
+# Provider SDKs are imported on first use, so a deployment that only talks to one
+# provider never pays for importing the other. None means "not installed".
+_UNLOADED: Any = object()
+openai: Any = _UNLOADED
+anthropic: Any = _UNLOADED
+
+logger = logging.getLogger(__name__)
+
+OPENAI_COMPATIBLE = frozenset(
+    {
+        "openai",
+        "openai_compatible",
+        "openai-chat-completions-endpoint",
+        "ollama",
+        "grok",
+        "gemini",
+    }
+)
+
+
+# httpx only speaks HTTP/2 when the optional `h2` package is installed; with it,
+# concurrent requests to one provider share a multiplexed connection. find_spec
+# checks for it without paying for the import here.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("HEXIS_LLM_HTTP_MAX_CONNECTIONS", "256"))
+LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("HEXIS_LLM_HTTP_MAX_KEEPALIVE", "64"))
+# Default batch size for stream_text_completion (characters per yielded chunk).
+STREAM_FLUSH_CHARS = 256
+
+# httpx connections are bound to the event loop that opened them, and sync wrappers
+# run on a different loop than async callers, so the shared pool is kept per loop. The
+# clients reference their loop, so they are closed (and dropped) when it shuts down.
+_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+# SDK clients wrap that pool, so they are cached per loop too, keyed by their settings.
+_SDK_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_SDK_CLIENTS_PER_LOOP = 32
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Connection pool shared by every provider SDK client on the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+        _HTTP_CLIENTS[loop] = client
+        # SDK clients built on the old pool would keep using a closed transport.
+        _SDK_CLIENTS.pop(loop, None)
+        on_loop_shutdown(close_http_clients)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the LLM HTTP pool opened on the running loop and drop its SDK clients."""
+    loop = asyncio.get_running_loop()
+    _SDK_CLIENTS.pop(loop, None)
+    client = _HTTP_CLIENTS.pop(loop, None)
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
 
-OPENAI_COMPATIBLE = {
-    "openai",
-    "openai_compatible",
-    "openai-chat-completions-endpoint",
-    "ollama",
-    "grok",
-    "gemini",
-}
 
+register_cleanup(close_http_clients)
 
+
+def _sdk_client(kind: str, api_key: str | None, endpoint: str | None, factory: Any) -> Any:
+    http_client = _shared_http_client()
+    clients = _SDK_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    key = (kind, api_key or "", endpoint or "")
+    client = clients.get(key)
+    if client is None:
+        if len(clients) >= _SDK_CLIENTS_PER_LOOP:
+            clients.pop(next(iter(clients)))
+        client = factory(http_client)
+        clients[key] = client
+    return client
+
+
+def _openai_mod() -> Any:
+    global openai
+    if openai is _UNLOADED:
+        try:
+            import openai as module
+        except Exception:  # pragma: no cover
+            module = None
+        openai = module
+    if openai is None:
+        raise RuntimeError("openai package is required for OpenAI-compatible providers.")
+    return openai
+
+
+def _anthropic_mod() -> Any:
+    global anthropic
+    if anthropic is _UNLOADED:
+        try:
+            import anthropic as module
+        except Exception:  # pragma: no cover
+            module = None
+        anthropic = module
+    if anthropic is None:
+        raise RuntimeError("anthropic package is required for Anthropic provider.")
+    return anthropic
+
+
+def _get_openai_client(api_key: str | None, endpoint: str | None) -> Any:
+    sdk = _openai_mod()
+    return _sdk_client(
+        "openai",
+        api_key,
+        endpoint,
+        lambda http_client: sdk.AsyncOpenAI(api_key=api_key, base_url=endpoint, http_client=http_client),
+    )
+
+
+def _get_anthropic_client(api_key: str | None) -> Any:
+    sdk = _anthropic_mod()
+    return _sdk_client(
+        "anthropic",
+        api_key,
+        None,
+        lambda http_client: sdk.AsyncAnthropic(api_key=api_key, http_client=http_client),
+    )
+
+
+@lru_cache(maxsize=64)
 def normalize_provider(provider: str | None) -> str:
     if not provider:
         return "openai"
@@ -34,6 +162,7 @@ def normalize_provider(provider: str | None) -> str:
     return raw
 
 
+@lru_cache(maxsize=64)
 def normalize_endpoint(provider: str, endpoint: str | None) -> str | None:
     if endpoint:
         return endpoint.strip() or None
@@ -50,19 +179,25 @@ def resolve_api_key(api_key_env: str | None) -> str | None:
     value = api_key_env.strip()
     if not value:
         return None
-    import os
-
     return os.getenv(value)
 
 
+def _config_str(value: Any) -> str | None:
+    """Config values are normally already strings; only coerce the odd non-string."""
+    if not value:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
 def normalize_llm_config(config: dict[str, Any] | None, *, default_model: str = "gpt-4o") -> dict[str, Any]:
     config = config or {}
-    provider = normalize_provider(str(config.get("provider") or "openai"))
-    model = str(config.get("model") or default_model)
-    endpoint = normalize_endpoint(provider, str(config.get("endpoint") or "").strip() or None)
+    provider = normalize_provider(_config_str(config.get("provider")) or "openai")
+    model = _config_str(config.get("model")) or default_model
+    # normalize_endpoint strips the value and maps blank to None itself.
+    endpoint = normalize_endpoint(provider, _config_str(config.get("endpoint")))
     api_key = config.get("api_key")
     if not api_key:
-        api_key = resolve_api_key(str(config.get("api_key_env") or "").strip() or None)
+        api_key = resolve_api_key(_config_str(config.get("api_key_env")))
     if not api_key:
         api_key = os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
     return {
@@ -77,11 +212,59 @@ def _extract_system_prompt(messages: list[dict[str, Any]]) -> tuple[str, list[di
     system_parts: list[str] = []
     rest: list[dict[str, Any]] = []
     for msg in messages:
-        if msg.get("role") == "system":
-            system_parts.append(str(msg.get("content") or ""))
-        else:
+        if msg.get("role") != "system":
             rest.append(msg)
-    return "\n\n".join([p for p in system_parts if p.strip()]), rest
+            continue
+        content = msg.get("content")
+        if content:
+            text = content if isinstance(content, str) else str(content)
+            if not text.isspace():
+                system_parts.append(text)
+    return "\n\n".join(system_parts), rest
+
+
+def _anthropic_system_blocks(system_prompt: str) -> list[dict[str, Any]]:
+    """Wrap the system prompt as a cacheable block so Anthropic reuses its prefill across calls.
+
+    Prompts below the provider's minimum cacheable length are simply not cached.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+@lru_cache(maxsize=32)
+def _prompt_cache_key(system_prompt: str) -> str:
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:32]
+
+
+def _is_openai_api(endpoint: str | None) -> bool:
+    return not endpoint or urlsplit(endpoint).hostname == "api.openai.com"
+
+
+def _openai_prompt_cache_body(
+    provider: str,
+    endpoint: str | None,
+    messages: list[dict[str, Any]],
+) -> dict[str, Any] | None:
+    """Route requests sharing a system prompt to the same OpenAI prefix-cache shard."""
+    # Only OpenAI's own API knows the field; compatible servers may reject it.
+    if provider != "openai" or not _is_openai_api(endpoint):
+        return None
+    if not messages or messages[0].get("role") != "system":
+        return None
+    content = messages[0].get("content")
+    if not isinstance(content, str) or not content:
+        return None
+    return {"prompt_cache_key": _prompt_cache_key(content)}
+
+
+def _log_anthropic_cache_usage(response: Any) -> None:
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        logger.debug(
+            "anthropic prompt cache: read=%s created=%s",
+            getattr(usage, "cache_read_input_tokens", None),
+            getattr(usage, "cache_creation_input_tokens", None),
+        )
 
 
 def _openai_tool_calls(raw_calls: list[Any]) -> list[dict[str, Any]]:
@@ -91,7 +274,7 @@ def _openai_tool_calls(raw_calls: list[Any]) -> list[dict[str, Any]]:
         name = getattr(fn, "name", None) or fn.get("name")
         raw_args = getattr(fn, "arguments", None) or fn.get("arguments") or "{}"
         try:
-            args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
+            args = fast_json.loads(raw_args) if isinstance(raw_args, (str, bytes)) else raw_args
         except Exception:
             args = {}
         tool_calls.append({"id": getattr(call, "id", None), "name": name, "arguments": args})
@@ -114,6 +297,202 @@ def _anthropic_tools(openai_tools: list[dict[str, Any]] | None) -> list[dict[str
     return tools
 
 
+async def _openai_chat(
+    *,
+    provider: str,
+    model: str,
+    endpoint: str | None,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None,
+    temperature: float,
+    max_tokens: int,
+    response_format: dict[str, Any] | None,
+) -> dict[str, Any]:
+    client = _get_openai_client(api_key, endpoint)
+    # Optional fields are spread in only when set; the SDK treats an omitted field
+    # differently from an explicit None.
+    response = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        extra_body=_openai_prompt_cache_body(provider, endpoint, messages),
+        **({"tools": tools, "tool_choice": "auto"} if tools else {}),
+        **({"response_format": response_format} if response_format else {}),
+    )
+    message = response.choices[0].message
+    content = message.content or ""
+    tool_calls = _openai_tool_calls(message.tool_calls or [])
+    return {"content": content, "tool_calls": tool_calls, "raw": response}
+
+
+# Anthropic content block type -> collector(block, text_parts, tool_calls). Other block
+# types (e.g. thinking) are skipped.
+_ANTHROPIC_BLOCK_HANDLERS: dict[str, Any] = {
+    "text": lambda block, text_parts, _tool_calls: text_parts.append(block.text),
+    "tool_use": lambda block, _text_parts, tool_calls: tool_calls.append(
+        {"id": block.id, "name": block.name, "arguments": block.input}
+    ),
+}
+
+
+async def _anthropic_chat(
+    *,
+    provider: str,
+    model: str,
+    endpoint: str | None,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None,
+    temperature: float,
+    max_tokens: int,
+    response_format: dict[str, Any] | None,
+) -> dict[str, Any]:
+    client = _get_anthropic_client(api_key)
+    system_prompt, rest = _extract_system_prompt(messages)
+    anthropic_tools = _anthropic_tools(tools)
+    kwargs: dict[str, Any] = {
+        "model": model,
+        "messages": rest,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    if system_prompt:
+        kwargs["system"] = _anthropic_system_blocks(system_prompt)
+    if anthropic_tools:
+        kwargs["tools"] = anthropic_tools
+    response = await client.messages.create(**kwargs)
+    _log_anthropic_cache_usage(response)
+    text_parts: list[str] = []
+    tool_calls: list[dict[str, Any]] = []
+    for block in response.content or []:
+        handler = _ANTHROPIC_BLOCK_HANDLERS.get(block.type)
+        if handler is not None:
+            handler(block, text_parts, tool_calls)
+    return {"content": "".join(text_parts), "tool_calls": tool_calls, "raw": response}
+
+
+async def _openai_stream(
+    *,
+    provider: str,
+    model: str,
+    endpoint: str | None,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict[str, Any] | None,
+    flush_chars: int,
+) -> AsyncIterator[str]:
+    client = _get_openai_client(api_key, endpoint)
+    response = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+        extra_body=_openai_prompt_cache_body(provider, endpoint, messages),
+        **({"response_format": response_format} if response_format else {}),
+    )
+    buf: list[str] = []
+    buf_len = 0
+    try:
+        async for event in response:
+            delta = event.choices[0].delta
+            if delta and delta.content:
+                buf.append(delta.content)
+                buf_len += len(delta.content)
+                if buf_len >= flush_chars:
+                    yield "".join(buf)
+                    buf.clear()
+                    buf_len = 0
+        if buf:
+            yield "".join(buf)
+    finally:
+        # Release the HTTP connection even when the consumer stops early.
+        await response.close()
+
+
+async def _anthropic_stream(
+    *,
+    provider: str,
+    model: str,
+    endpoint: str | None,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict[str, Any] | None,
+    flush_chars: int,
+) -> AsyncIterator[str]:
+    client = _get_anthropic_client(api_key)
+    system_prompt, rest = _extract_system_prompt(messages)
+    kwargs: dict[str, Any] = {
+        "model": model,
+        "messages": rest,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    if system_prompt:
+        kwargs["system"] = _anthropic_system_blocks(system_prompt)
+    # Leaving the context manager closes the HTTP response, even if the consumer stops early.
+    buf: list[str] = []
+    buf_len = 0
+    async with client.messages.stream(**kwargs) as stream:
+        async for text in stream.text_stream:
+            buf.append(text)
+            buf_len += len(text)
+            if buf_len >= flush_chars:
+                yield "".join(buf)
+                buf.clear()
+                buf_len = 0
+        if buf:
+            yield "".join(buf)
+        _log_anthropic_cache_usage(await stream.get_final_message())
+
+
+# Provider name -> adapter, resolved with one dict lookup per call. Every adapter takes
+# the same normalized keyword arguments.
+_CHAT_ADAPTERS = {
+    **{provider: _openai_chat for provider in OPENAI_COMPATIBLE},
+    "anthropic": _anthropic_chat,
+}
+_STREAM_ADAPTERS = {
+    **{provider: _openai_stream for provider in OPENAI_COMPATIBLE},
+    "anthropic": _anthropic_stream,
+}
+
+
+async def _chat_completion_impl(
+    *,
+    provider: str,
+    model: str,
+    endpoint: str | None,
+    api_key: str | None,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 1200,
+    response_format: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """chat_completion for inputs already passed through normalize_llm_config."""
+    adapter = _CHAT_ADAPTERS.get(provider)
+    if adapter is None:
+        raise ValueError(f"Unsupported provider: {provider}")
+    return await adapter(
+        provider=provider,
+        model=model,
+        endpoint=endpoint,
+        api_key=api_key,
+        messages=messages,
+        tools=tools,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format=response_format,
+    )
+
+
 async def chat_completion(
     *,
     provider: str,
@@ -127,59 +506,20 @@ async def chat_completion(
     response_format: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     provider = normalize_provider(provider)
-    endpoint = normalize_endpoint(provider, endpoint)
-
-    if provider in OPENAI_COMPATIBLE:
-        if openai is None:
-            raise RuntimeError("openai package is required for OpenAI-compatible providers.")
-        client = openai.AsyncOpenAI(api_key=api_key, base_url=endpoint)
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-        if tools:
-            payload["tools"] = tools
-            payload["tool_choice"] = "auto"
-        if response_format:
-            payload["response_format"] = response_format
-        response = await client.chat.completions.create(**payload)
-        message = response.choices[0].message
-        content = message.content or ""
-        tool_calls = _openai_tool_calls(message.tool_calls or [])
-        return {"content": content, "tool_calls": tool_calls, "raw": response}
-
-    if provider == "anthropic":
-        if anthropic is None:
-            raise RuntimeError("anthropic package is required for Anthropic provider.")
-        client = anthropic.AsyncAnthropic(api_key=api_key)
-        system_prompt, rest = _extract_system_prompt(messages)
-        anthropic_tools = _anthropic_tools(tools)
-        kwargs: dict[str, Any] = {
-            "model": model,
-            "messages": rest,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-        if system_prompt:
-            kwargs["system"] = system_prompt
-        if anthropic_tools:
-            kwargs["tools"] = anthropic_tools
-        response = await client.messages.create(**kwargs)
-        text_parts: list[str] = []
-        tool_calls: list[dict[str, Any]] = []
-        for block in response.content or []:
-            if block.type == "text":
-                text_parts.append(block.text)
-            if block.type == "tool_use":
-                tool_calls.append({"id": block.id, "name": block.name, "arguments": block.input})
-        return {"content": "".join(text_parts), "tool_calls": tool_calls, "raw": response}
-
-    raise ValueError(f"Unsupported provider: {provider}")
-
-
-async def stream_text_completion(
+    return await _chat_completion_impl(
+        provider=provider,
+        model=model,
+        endpoint=normalize_endpoint(provider, endpoint),
+        api_key=api_key,
+        messages=messages,
+        tools=tools,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format=response_format,
+    )
+
+
+def stream_text_completion(
     *,
     provider: str,
     model: str,
@@ -188,48 +528,27 @@ async def stream_text_completion(
     messages: list[dict[str, Any]],
     temperature: float = 0.7,
     max_tokens: int = 1400,
+    response_format: dict[str, Any] | None = None,
+    flush_chars: int = STREAM_FLUSH_CHARS,
 ) -> AsyncIterator[str]:
-    provider = normalize_provider(provider)
-    endpoint = normalize_endpoint(provider, endpoint)
-
-    if provider in OPENAI_COMPATIBLE:
-        if openai is None:
-            raise RuntimeError("openai package is required for OpenAI-compatible providers.")
-        client = openai.AsyncOpenAI(api_key=api_key, base_url=endpoint)
-        response = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            stream=True,
-        )
-        async for event in response:
-            delta = event.choices[0].delta
-            if delta and delta.content:
-                yield delta.content
-        return
-
-    if provider == "anthropic":
-        if anthropic is None:
-            raise RuntimeError("anthropic package is required for Anthropic provider.")
-        client = anthropic.AsyncAnthropic(api_key=api_key)
-        system_prompt, rest = _extract_system_prompt(messages)
-        response = await client.messages.create(
-            model=model,
-            system=system_prompt or None,
-            messages=rest,
-            max_tokens=max_tokens,
-            temperature=temperature,
-        )
-        text = "".join(block.text for block in response.content if block.type == "text")
-        for chunk in _chunk_text(text):
-            yield chunk
-        return
-
-    raise ValueError(f"Unsupported provider: {provider}")
+    """Return the provider's text stream directly (no wrapping generator per chunk).
 
+    Deltas are coalesced until at least `flush_chars` characters are waiting, so the
+    consumer resumes once per batch rather than once per token; 0 yields every delta.
+    """
+    provider = normalize_provider(provider)
+    adapter = _STREAM_ADAPTERS.get(provider)
+    if adapter is None:
+        raise ValueError(f"Unsupported provider: {provider}")
+    return adapter(
+        provider=provider,
+        model=model,
+        endpoint=normalize_endpoint(provider, endpoint),
+        api_key=api_key,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format=response_format,
+        flush_chars=flush_chars,
+    )
 
-def _chunk_text(text: str, *, chunk_size: int = 120) -> list[str]:
-    if not text:
-        return []
-    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import os
 from typing import Any
 
+from core import fast_json
 from core.llm import normalize_llm_config
 
 
@@ -11,21 +11,16 @@ DEFAULT_LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 DEFAULT_LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o")
 
 
-async def load_llm_config(
-    conn,
-    key: str,
+def llm_config_from_value(
+    cfg: Any,
     *,
     default_provider: str = DEFAULT_LLM_PROVIDER,
     default_model: str = DEFAULT_LLM_MODEL,
-    fallback_key: str | None = None,
 ) -> dict[str, Any]:
-    cfg = await conn.fetchval("SELECT get_config($1)", key)
-    if cfg is None and fallback_key:
-        cfg = await conn.fetchval("SELECT get_config($1)", fallback_key)
-
+    """Normalize a raw get_config() value (jsonb text, dict or NULL) into an LLM config."""
     if isinstance(cfg, str):
         try:
-            cfg = json.loads(cfg)
+            cfg = fast_json.loads(cfg)
         except Exception:
             cfg = None
 
@@ -38,3 +33,18 @@ async def load_llm_config(
         cfg["model"] = default_model
 
     return normalize_llm_config(cfg, default_model=default_model)
+
+
+async def load_llm_config(
+    conn,
+    key: str,
+    *,
+    default_provider: str = DEFAULT_LLM_PROVIDER,
+    default_model: str = DEFAULT_LLM_MODEL,
+    fallback_key: str | None = None,
+) -> dict[str, Any]:
+    cfg = await conn.fetchval("SELECT get_config($1)", key)
+    if cfg is None and fallback_key:
+        cfg = await conn.fetchval("SELECT get_config($1)", fallback_key)
+
+    return llm_config_from_value(cfg, default_provider=default_provider, default_model=default_model)
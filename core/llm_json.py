@@ -1,59 +1,209 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import time
+from collections import OrderedDict
 from typing import Any
 
-from core.llm import chat_completion
+from core import fast_json
+from core.llm import chat_completion, stream_text_completion
 
 
-def extract_json_object(text: str) -> dict[str, Any]:
-    if not text:
-        return {}
-    start = text.find("{")
-    end = text.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        return {}
-    snippet = text[start : end + 1]
-    try:
-        doc = json.loads(snippet)
-    except Exception:
-        return {}
-    return doc if isinstance(doc, dict) else {}
+# Only quotes, backslashes and braces affect object boundaries, so the scanner hops
+# between those with the regex engine instead of stepping through every character.
+_STRUCTURAL_RE = re.compile(r'["\\{}]')
+_MAX_EMBEDDED_OBJECT_ATTEMPTS = 8
+
+
+def find_json_object(text: str, start: int = 0) -> tuple[int, int] | None:
+    """
+    Return the (start, end) span of the first balanced top-level `{...}` at or after
+    `start`, ignoring braces inside JSON strings, or None if no object closes.
+    """
+    begin = text.find("{", start)
+    if begin == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped_at = -1
+    for match in _STRUCTURAL_RE.finditer(text, begin):
+        i = match.start()
+        ch = text[i]
+        if in_string:
+            if i == escaped_at:
+                continue
+            if ch == "\\":
+                escaped_at = i + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if not depth:
+                return begin, i + 1
+    return None
+
+
+def strip_code_fence(text: str) -> str | None:
+    """Return the body of the first closed ``` fence (minus a language tag), or None."""
+    _, fence, rest = text.partition("```")
+    if not fence:
+        return None
+    body, fence, _ = rest.partition("```")
+    if not fence:
+        return None
+    tag, newline, remainder = body.partition("\n")
+    if newline and tag.strip().isalnum():
+        body = remainder
+    return body.strip()
 
 
 def parse_json_response(raw: str, fallback: dict[str, Any]) -> dict[str, Any]:
+    parsed = parse_json_object(raw)
+    return parsed if parsed is not None else dict(fallback)
+
+
+def parse_json_object(raw: str) -> dict[str, Any] | None:
+    """Return the JSON object carried by a model reply, or None if it holds no closed object."""
     if not raw:
-        return dict(fallback)
+        return None
     try:
-        parsed = json.loads(raw)
+        parsed = fast_json.loads(raw)
         if isinstance(parsed, dict):
             return parsed
     except Exception:
         pass
 
-    match = re.search(r"\{[\s\S]*\}", raw)
-    if match:
+    # Models often wrap JSON in a ```json fence; its body usually parses as-is.
+    fenced = strip_code_fence(raw)
+    if fenced:
         try:
-            parsed = json.loads(match.group())
+            parsed = fast_json.loads(fenced)
             if isinstance(parsed, dict):
                 return parsed
         except Exception:
             pass
-    return dict(fallback)
 
+    start = 0
+    for _ in range(_MAX_EMBEDDED_OBJECT_ATTEMPTS):
+        span = find_json_object(raw, start)
+        if span is None:
+            break
+        try:
+            parsed = fast_json.loads(raw[span[0] : span[1]])
+            if isinstance(parsed, dict):
+                return parsed
+        except Exception:
+            pass
+        start = span[0] + 1
+    return None
 
-async def chat_json(
+
+def extract_json_object(text: str) -> dict[str, Any]:
+    """Return the first JSON object in `text` (which may carry prose around it), or {}."""
+    return parse_json_response(text, {})
+
+
+# Exact-match cache of raw model output, keyed by everything that shapes the request.
+# Near-identical heartbeat contexts often produce byte-identical prompts; a hit skips
+# the provider round-trip entirely. Raw text is stored so each hit re-parses into
+# fresh objects that callers are free to mutate. These calls sample at temperature > 0,
+# so a stored reply is only reused for a short while. max_tokens is not part of the
+# key: only replies that closed their JSON object are stored, and those fit any limit.
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("HEXIS_LLM_RESPONSE_CACHE_TTL_SECONDS", "300"))
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+
+
+def _response_cache_key(
+    llm_config: dict[str, Any],
+    messages: list[dict[str, Any]],
+    temperature: float,
+    response_format: dict[str, Any] | None,
+) -> bytes:
+    request = json.dumps(
+        [
+            llm_config.get("provider"),
+            llm_config.get("model"),
+            llm_config.get("endpoint"),
+            temperature,
+            response_format,
+            messages,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(request.encode("utf-8"), digest_size=16).digest()
+
+
+def clear_response_cache() -> None:
+    _RESPONSE_CACHE.clear()
+
+
+class JsonObjectTracker:
+    """
+    Follows brace depth across streamed chunks, ignoring braces inside JSON strings,
+    to spot where the first top-level object closes.
+
+    `begin` and `pos` are offsets into everything fed so far: where the last top-level
+    object opened and how far the tracker has read.
+    """
+
+    __slots__ = ("depth", "in_string", "escape", "begin", "pos")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.begin = -1
+        self.pos = 0
+
+    def feed(self, chunk: str) -> int:
+        """Return the index just past the closing brace within `chunk`, or -1 if still open."""
+        depth, in_string, escape = self.depth, self.in_string, self.escape
+        for i, ch in enumerate(chunk):
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                if depth:
+                    in_string = True
+            elif ch == "{":
+                if not depth:
+                    self.begin = self.pos + i
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                if not depth:
+                    self.depth, self.in_string, self.escape = 0, False, False
+                    self.pos += i + 1
+                    return i + 1
+        self.depth, self.in_string, self.escape = depth, in_string, escape
+        self.pos += len(chunk)
+        return -1
+
+
+async def _stream_raw(
     *,
     llm_config: dict[str, Any],
     messages: list[dict[str, Any]],
     max_tokens: int,
-    temperature: float = 0.2,
-    response_format: dict[str, Any] | None = None,
-    fallback: dict[str, Any] | None = None,
-) -> tuple[dict[str, Any], str]:
-    fallback = fallback or {}
-    response = await chat_completion(
+    temperature: float,
+    response_format: dict[str, Any] | None,
+) -> str:
+    parts: list[str] = []
+    tracker = JsonObjectTracker()
+    stream = stream_text_completion(
         provider=llm_config["provider"],
         model=llm_config["model"],
         endpoint=llm_config.get("endpoint"),
@@ -63,5 +213,71 @@ async def chat_json(
         max_tokens=max_tokens,
         response_format=response_format,
     )
-    raw = response.get("content", "") or ""
-    return parse_json_response(raw, fallback), raw
+    try:
+        async for chunk in stream:
+            end = tracker.feed(chunk)
+            if end >= 0:
+                # The object is complete; stop reading instead of waiting for the stop token.
+                parts.append(chunk[:end])
+                break
+            parts.append(chunk)
+    finally:
+        await stream.aclose()
+    return "".join(parts)
+
+
+async def chat_json(
+    *,
+    llm_config: dict[str, Any],
+    messages: list[dict[str, Any]],
+    max_tokens: int,
+    temperature: float = 0.2,
+    response_format: dict[str, Any] | None = None,
+    fallback: dict[str, Any] | None = None,
+    cache_bypass: bool = False,
+    stream: bool = False,
+) -> tuple[dict[str, Any], str]:
+    """
+    Run a JSON-mode completion and parse the reply, returning `(doc, raw_text)`.
+
+    With `stream=True` the reply is read from the provider's streaming API, so the
+    connection starts delivering tokens immediately instead of after full generation.
+    """
+    fallback = fallback or {}
+    key = None
+    if not cache_bypass:
+        key = _response_cache_key(llm_config, messages, temperature, response_format)
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                _RESPONSE_CACHE.move_to_end(key)
+                return parse_json_response(cached[1], fallback), cached[1]
+            del _RESPONSE_CACHE[key]
+
+    if stream:
+        raw = await _stream_raw(
+            llm_config=llm_config,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format=response_format,
+        )
+    else:
+        response = await chat_completion(
+            provider=llm_config["provider"],
+            model=llm_config["model"],
+            endpoint=llm_config.get("endpoint"),
+            api_key=llm_config.get("api_key"),
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
+        raw = response.get("content", "") or ""
+    parsed = parse_json_object(raw)
+    if key is not None and parsed is not None:
+        _RESPONSE_CACHE[key] = (time.monotonic() + RESPONSE_CACHE_TTL_SECONDS, raw)
+        _RESPONSE_CACHE.move_to_end(key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+    return (parsed if parsed is not None else dict(fallback)), raw
@@ -7,8 +7,12 @@ These are the function definitions and handlers that allow the model to actively
 recall, search, and explore its memories.
 """
 
+import atexit
 import json
 import re
+import threading
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
 from typing import Optional, Any
@@ -31,6 +35,132 @@ from core.cognitive_memory_api import (
 )
 
 
+# ============================================================================
+# SHARED CLIENT
+# ============================================================================
+
+# The tool handler, enricher and memory formation share one asyncpg pool per DSN
+# instead of opening a pool each.
+SHARED_CLIENT_MIN_SIZE = 2
+SHARED_CLIENT_MAX_SIZE = 16
+
+_SHARED_CLIENTS: dict[str, CognitiveMemorySync] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _dsn_from_config(db_config: dict) -> str:
+    return (
+        f"postgresql://{db_config.get('user', 'postgres')}:{db_config.get('password', 'password')}"
+        f"@{db_config.get('host', 'localhost')}:{int(db_config.get('port', 43815))}"
+        f"/{db_config.get('dbname', 'hexis_memory')}"
+    )
+
+
+def _get_shared_client(dsn: str) -> CognitiveMemorySync:
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(dsn)
+        if client is None:
+            client = CognitiveMemorySync.connect(
+                dsn, min_size=SHARED_CLIENT_MIN_SIZE, max_size=SHARED_CLIENT_MAX_SIZE
+            )
+            _SHARED_CLIENTS[dsn] = client
+        return client
+
+
+@atexit.register
+def close_shared_clients() -> None:
+    """Close every shared client (registered to run at interpreter exit)."""
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client in clients:
+        try:
+            _flush_pending_touches(client)
+            client.close()
+        except Exception:
+            pass
+    clear_recall_cache()
+
+
+# ============================================================================
+# RECALL CACHE
+# ============================================================================
+
+# Enrichment and tool recalls repeat the same query within a turn or two, so recent
+# results are reused for a short while. Keyed by (client, normalized query, filters).
+RECALL_CACHE_TTL_SECONDS = 30.0
+RECALL_CACHE_SIZE = 1024
+
+_RECALL_CACHE: OrderedDict[tuple, tuple[float, tuple[Any, ...]]] = OrderedDict()
+# Memory ids served from the cache whose access still has to be recorded, per client,
+# with how many times each was served.
+_PENDING_TOUCHES: dict[int, Counter] = {}
+_RECALL_CACHE_LOCK = threading.Lock()
+
+
+def clear_recall_cache() -> None:
+    """Drop cached recall results (call after writing memories)."""
+    with _RECALL_CACHE_LOCK:
+        _RECALL_CACHE.clear()
+
+
+def _flush_pending_touches(client: CognitiveMemorySync) -> None:
+    with _RECALL_CACHE_LOCK:
+        pending = _PENDING_TOUCHES.pop(id(client), None)
+    # touch_memories counts an id once per call, so repeat hits go out in extra rounds.
+    while pending:
+        client.touch_memories(list(pending))
+        pending = Counter({memory_id: n - 1 for memory_id, n in pending.items() if n > 1})
+
+
+def _cached_recall(
+    client: CognitiveMemorySync,
+    query: str,
+    *,
+    limit: int,
+    memory_types: Optional[list] = None,
+    min_importance: float = 0.0,
+    touch: bool = False,
+) -> list:
+    """client.recall(...).memories through the TTL/LRU cache.
+
+    Touches for cache hits are deferred and recorded along with the next query that
+    reaches the database.
+    """
+    key = (
+        id(client),
+        query.strip().lower(),
+        limit,
+        tuple(memory_types) if memory_types else None,
+        min_importance,
+    )
+    now = time.monotonic()
+    with _RECALL_CACHE_LOCK:
+        entry = _RECALL_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            _RECALL_CACHE.move_to_end(key)
+            if touch and entry[1]:
+                _PENDING_TOUCHES.setdefault(id(client), Counter()).update(m.id for m in entry[1])
+            return list(entry[1])
+
+    _flush_pending_touches(client)
+    result = client.recall(
+        query,
+        limit=limit,
+        memory_types=memory_types,
+        min_importance=min_importance,
+        include_partial=False,
+        touch=touch,
+    )
+    memories = tuple(result.memories)
+    with _RECALL_CACHE_LOCK:
+        _RECALL_CACHE[key] = (now + RECALL_CACHE_TTL_SECONDS, memories)
+        _RECALL_CACHE.move_to_end(key)
+        while len(_RECALL_CACHE) > RECALL_CACHE_SIZE:
+            _RECALL_CACHE.popitem(last=False)
+    return list(memories)
+
+
 # ============================================================================
 # TOOL DEFINITIONS (OpenAI Function Calling Format)
 # ============================================================================
@@ -315,19 +445,6 @@ MEMORY_TOOLS = [
     }
 ]
 
-_API_TOOL_NAMES = {
-    "recall",
-    "sense_memory_availability",
-    "request_background_search",
-    "recall_recent",
-    "explore_concept",
-    "get_procedures",
-    "get_strategies",
-    "create_goal",
-    "queue_user_message",
-}
-
-
 # ============================================================================
 # TOOL HANDLERS
 # ============================================================================
@@ -391,28 +508,31 @@ class MemoryToolHandler:
         min_importance = args.get('min_importance', 0.0)
         
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # Recall and touch in one statement; `t` is joined so Postgres evaluates it.
             cur.execute(
                 """
-                SELECT 
+                WITH r AS (
+                    SELECT *
+                    FROM recall_memories_filtered(%s, %s, %s::memory_type[], %s) WITH ORDINALITY
+                ),
+                t AS (
+                    SELECT touch_memories(ARRAY(SELECT memory_id FROM r)) AS touched
+                )
+                SELECT
                     memory_id,
                     content,
                     memory_type,
                     score,
                     source,
                     importance
-                FROM recall_memories_filtered(%s, %s, %s::memory_type[], %s)
+                FROM r CROSS JOIN t
+                ORDER BY r.ordinality
                 """,
                 (query, limit, memory_types, min_importance),
             )
 
             results = cur.fetchall()
-
-            if results:
-                cur.execute(
-                    "SELECT touch_memories(%s::uuid[])",
-                    ([r["memory_id"] for r in results],),
-                )
-                self.conn.commit()
+            self.conn.commit()
         
         return {
             "memories": [dict(r) for r in results],
@@ -523,42 +643,47 @@ class MemoryToolHandler:
         limit = min(args.get('limit', 3), 10)
         
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # One round trip: each cluster's sample memories are joined onto it.
             cur.execute(
                 """
-                SELECT 
-                    id,
-                    name,
-                    cluster_type,
-                    similarity
+                SELECT
+                    c.id,
+                    c.name,
+                    c.cluster_type,
+                    c.similarity,
+                    s.memory_id,
+                    s.content,
+                    s.memory_type,
+                    s.membership_strength
                 FROM search_clusters_by_query(%s, %s)
+                    WITH ORDINALITY AS c(id, name, cluster_type, similarity, ord)
+                LEFT JOIN LATERAL get_cluster_sample_memories(c.id, 3) s ON TRUE
+                ORDER BY c.ord, s.membership_strength DESC NULLS LAST
                 """,
                 (query, limit),
             )
-            
-            clusters = cur.fetchall()
-            
-            # For each cluster, get sample memories
-            result_clusters = []
-            for cluster in clusters:
-                cur.execute(
-                    """
-                    SELECT 
-                        memory_id,
-                        content,
-                        memory_type,
-                        membership_strength
-                    FROM get_cluster_sample_memories(%s, 3)
-                    """,
-                    (cluster["id"],),
-                )
-                
-                sample_memories = cur.fetchall()
-                
-                result_clusters.append({
-                    **dict(cluster),
-                    "sample_memories": [dict(m) for m in sample_memories]
+            rows = cur.fetchall()
+
+        clusters_by_id = {}
+        for row in rows:
+            cluster = clusters_by_id.get(row["id"])
+            if cluster is None:
+                cluster = clusters_by_id[row["id"]] = {
+                    "id": row["id"],
+                    "name": row["name"],
+                    "cluster_type": row["cluster_type"],
+                    "similarity": row["similarity"],
+                    "sample_memories": [],
+                }
+            if row["memory_id"] is not None:
+                cluster["sample_memories"].append({
+                    "memory_id": row["memory_id"],
+                    "content": row["content"],
+                    "memory_type": row["memory_type"],
+                    "membership_strength": row["membership_strength"],
                 })
-        
+        result_clusters = list(clusters_by_id.values())
+
         return {
             "clusters": result_clusters,
             "count": len(result_clusters),
@@ -660,38 +785,21 @@ class ApiMemoryToolHandler:
     def connect(self) -> None:
         if self.client is not None:
             return
-        dsn = (
-            f"postgresql://{self.db_config.get('user', 'postgres')}:{self.db_config.get('password', 'password')}"
-            f"@{self.db_config.get('host', 'localhost')}:{int(self.db_config.get('port', 43815))}"
-            f"/{self.db_config.get('dbname', 'hexis_memory')}"
-        )
-        self.client = CognitiveMemorySync.connect(dsn, min_size=1, max_size=5)
+        self.client = _get_shared_client(_dsn_from_config(self.db_config))
 
     def close(self) -> None:
-        if self.client is not None:
-            self.client.close()
-            self.client = None
+        # The client is shared process-wide; see close_shared_clients().
+        self.client = None
 
     def execute_tool(self, tool_name: str, arguments: dict) -> dict:
         self.connect()
         assert self.client is not None
 
-        handlers = {
-            "recall": self._handle_recall,
-            "sense_memory_availability": self._handle_sense_memory_availability,
-            "request_background_search": self._handle_request_background_search,
-            "recall_recent": self._handle_recall_recent,
-            "explore_concept": self._handle_explore_concept,
-            "get_procedures": self._handle_get_procedures,
-            "get_strategies": self._handle_get_strategies,
-            "create_goal": self._handle_create_goal,
-            "queue_user_message": self._handle_queue_user_message,
-        }
-        handler = handlers.get(tool_name)
+        handler = _API_TOOL_DISPATCH.get(tool_name)
         if not handler:
             return {"error": f"Unknown tool: {tool_name}"}
         try:
-            return handler(arguments or {})
+            return handler(self, arguments or {})
         except Exception as e:
             return {"error": str(e)}
 
@@ -705,8 +813,9 @@ class ApiMemoryToolHandler:
         if isinstance(memory_types, list) and memory_types:
             parsed_types = [ApiMemoryType(str(t)) for t in memory_types]
 
-        result = self.client.recall(query, limit=limit, memory_types=parsed_types, min_importance=min_importance, include_partial=False)
-        self.client.touch_memories([m.id for m in result.memories])
+        recalled = _cached_recall(
+            self.client, query, limit=limit, memory_types=parsed_types, min_importance=min_importance, touch=True
+        )
         memories = [
             {
                 "memory_id": str(m.id),
@@ -718,7 +827,7 @@ class ApiMemoryToolHandler:
                 "trust_level": m.trust_level,
                 "source_attribution": m.source_attribution,
             }
-            for m in result.memories
+            for m in recalled
         ]
         return {"memories": memories, "count": len(memories), "query": query}
 
@@ -788,8 +897,7 @@ class ApiMemoryToolHandler:
             for m in direct
         }
         if include_related:
-            rr = self.client.recall(concept, limit=limit, include_partial=False)
-            for m in rr.memories:
+            for m in _cached_recall(self.client, concept, limit=limit):
                 combined.setdefault(
                     str(m.id),
                     {
@@ -850,6 +958,7 @@ class ApiMemoryToolHandler:
             priority=priority,
             due_at=due_at,
         )
+        clear_recall_cache()
         return {"goal_id": str(goal_id), "title": title, "priority": priority, "source": source, "due_at": due_at_raw}
 
     def _handle_queue_user_message(self, args: dict) -> dict:
@@ -864,9 +973,26 @@ class ApiMemoryToolHandler:
             intent=str(intent) if isinstance(intent, str) else None,
             context=context if isinstance(context, dict) else None,
         )
+        clear_recall_cache()
         return {"outbox_message": outbox_message, "queued": True}
 
 
+# Tool name -> ApiMemoryToolHandler method, resolved once at import. The keys are also
+# the set of tools offered to the model by get_tool_definitions().
+_API_TOOL_DISPATCH = {
+    "recall": ApiMemoryToolHandler._handle_recall,
+    "sense_memory_availability": ApiMemoryToolHandler._handle_sense_memory_availability,
+    "request_background_search": ApiMemoryToolHandler._handle_request_background_search,
+    "recall_recent": ApiMemoryToolHandler._handle_recall_recent,
+    "explore_concept": ApiMemoryToolHandler._handle_explore_concept,
+    "get_procedures": ApiMemoryToolHandler._handle_get_procedures,
+    "get_strategies": ApiMemoryToolHandler._handle_get_strategies,
+    "create_goal": ApiMemoryToolHandler._handle_create_goal,
+    "queue_user_message": ApiMemoryToolHandler._handle_queue_user_message,
+}
+_API_TOOL_NAMES = frozenset(_API_TOOL_DISPATCH)
+
+
 # ============================================================================
 # CONTEXT ENRICHMENT
 # ============================================================================
@@ -886,12 +1012,7 @@ class ContextEnricher:
         """Establish DB connection via CognitiveMemorySync."""
         if self.client is not None:
             return
-        dsn = (
-            f"postgresql://{self.db_config.get('user', 'postgres')}:{self.db_config.get('password', 'password')}"
-            f"@{self.db_config.get('host', 'localhost')}:{int(self.db_config.get('port', 43815))}"
-            f"/{self.db_config.get('dbname', 'hexis_memory')}"
-        )
-        self.client = CognitiveMemorySync.connect(dsn, min_size=1, max_size=5)
+        self.client = _get_shared_client(_dsn_from_config(self.db_config))
     
     def enrich(self, user_message: str) -> dict:
         """
@@ -907,7 +1028,7 @@ class ContextEnricher:
         self.connect()
 
         assert self.client is not None
-        result = self.client.recall(user_message, limit=self.top_k, include_partial=False)
+        recalled = _cached_recall(self.client, user_message, limit=self.top_k, touch=True)
         memories = [
             {
                 "memory_id": str(m.id),
@@ -919,9 +1040,8 @@ class ContextEnricher:
                 "trust_level": m.trust_level,
                 "source_attribution": m.source_attribution,
             }
-            for m in result.memories
+            for m in recalled
         ]
-        self.client.touch_memories([m.id for m in result.memories])
         
         # Format memories into context
         if memories:
@@ -952,10 +1072,8 @@ class ContextEnricher:
         return "\n".join(lines)
     
     def close(self):
-        """Close database connection."""
-        if self.client is not None:
-            self.client.close()
-            self.client = None
+        """Release the shared client (it stays open for other users)."""
+        self.client = None
 
 
 # ============================================================================
@@ -977,12 +1095,7 @@ class MemoryFormation:
         """Establish DB connection via CognitiveMemorySync."""
         if self.client is not None:
             return
-        dsn = (
-            f"postgresql://{self.db_config.get('user', 'postgres')}:{self.db_config.get('password', 'password')}"
-            f"@{self.db_config.get('host', 'localhost')}:{int(self.db_config.get('port', 43815))}"
-            f"/{self.db_config.get('dbname', 'hexis_memory')}"
-        )
-        self.client = CognitiveMemorySync.connect(dsn, min_size=1, max_size=5)
+        self.client = _get_shared_client(_dsn_from_config(self.db_config))
     
     def should_form_memory(self, user_message: str, assistant_response: str) -> bool:
         """
@@ -1056,22 +1169,28 @@ class MemoryFormation:
             source_references=source_references,
             trust_level=trust_level if mt == ApiMemoryType.EPISODIC else None,
         )
+        # The new memory should be recallable right away, not after the cache TTL.
+        clear_recall_cache()
         return str(mem_id) if mem_id else None
     
     def close(self):
-        """Close database connection."""
-        if self.client is not None:
-            self.client.close()
-            self.client = None
+        """Release the shared client (it stays open for other users)."""
+        self.client = None
 
 
 # ============================================================================
 # EXPORTS
 # ============================================================================
 
+# The definitions are static, so the API-backed subset is filtered once at import.
+_API_TOOL_DEFINITIONS = tuple(
+    t for t in MEMORY_TOOLS if t.get("function", {}).get("name") in _API_TOOL_NAMES
+)
+
+
 def get_tool_definitions() -> list:
     """Return tool definitions for function calling (conversation loop)."""
-    return [t for t in MEMORY_TOOLS if t.get("function", {}).get("name") in _API_TOOL_NAMES]
+    return list(_API_TOOL_DEFINITIONS)
 
 
 def create_tool_handler(db_config: dict) -> MemoryToolHandler:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from core import fast_json
+
 
 def _coerce_json(raw: Any) -> dict[str, Any]:
     if isinstance(raw, dict):
         return raw
     if isinstance(raw, str):
         try:
-            parsed = json.loads(raw)
+            parsed = fast_json.loads(raw)
             if isinstance(parsed, dict):
                 return parsed
         except Exception:
@@ -24,6 +25,9 @@ async def run_heartbeat(conn) -> dict[str, Any] | None:
     return _coerce_json(raw)
 
 
+_APPLY_HEARTBEAT_DECISION_SQL = "SELECT apply_heartbeat_decision($1::uuid, $2::jsonb, $3::int)"
+
+
 async def apply_heartbeat_decision(
     conn,
     *,
@@ -32,18 +36,71 @@ async def apply_heartbeat_decision(
     start_index: int,
 ) -> dict[str, Any]:
     raw = await conn.fetchval(
-        "SELECT apply_heartbeat_decision($1::uuid, $2::jsonb, $3::int)",
+        _APPLY_HEARTBEAT_DECISION_SQL,
         heartbeat_id,
-        json.dumps(decision),
+        fast_json.dumps(decision),
         start_index,
     )
     return _coerce_json(raw)
 
 
+_APPLY_CALL_AND_CONTINUE_SQL = (
+    "SELECT apply_external_call_and_continue($1::jsonb, $2::jsonb, $3::uuid, $4::jsonb, $5::int)"
+)
+
+
+class HeartbeatDecisionApplier:
+    """
+    Applies one heartbeat decision over several rounds (one per pending external
+    call). The decision is encoded once, and each external result is stored together
+    with the following round in a single round trip.
+
+    `conn` may be a pool: each round then borrows a connection only for its query, so
+    none is held while external calls run between rounds.
+    """
+
+    __slots__ = ("_conn", "_heartbeat_id", "_decision_json")
+
+    def __init__(self, conn, *, heartbeat_id: str, decision: dict[str, Any]) -> None:
+        self._conn = conn
+        self._heartbeat_id = heartbeat_id
+        self._decision_json = fast_json.dumps(decision)
+
+    async def apply(self, start_index: int) -> dict[str, Any]:
+        raw = await self._conn.fetchval(
+            _APPLY_HEARTBEAT_DECISION_SQL,
+            self._heartbeat_id,
+            self._decision_json,
+            start_index,
+        )
+        return _coerce_json(raw)
+
+    async def apply_call_result(
+        self,
+        call: dict[str, Any],
+        output: dict[str, Any],
+        next_index: int,
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        """Return (applied, next batch); the batch is None when the call terminated the agent."""
+        doc = _coerce_json(
+            await self._conn.fetchval(
+                _APPLY_CALL_AND_CONTINUE_SQL,
+                fast_json.dumps(call),
+                fast_json.dumps(output),
+                self._heartbeat_id,
+                self._decision_json,
+                next_index,
+            )
+        )
+        applied = _coerce_json(doc.get("applied"))
+        batch = doc.get("batch")
+        return applied, (_coerce_json(batch) if batch is not None else None)
+
+
 async def run_maintenance_if_due(conn, stats_hint: dict[str, Any] | None = None) -> dict[str, Any] | None:
     raw = await conn.fetchval(
         "SELECT run_maintenance_if_due($1::jsonb)",
-        json.dumps(stats_hint or {}),
+        fast_json.dumps(stats_hint or {}),
     )
     if raw is None:
         return None
@@ -58,8 +115,8 @@ async def apply_external_call_result(
 ) -> dict[str, Any]:
     raw = await conn.fetchval(
         "SELECT apply_external_call_result($1::jsonb, $2::jsonb)",
-        json.dumps(call),
-        json.dumps(output),
+        fast_json.dumps(call),
+        fast_json.dumps(output),
     )
     return _coerce_json(raw)
 
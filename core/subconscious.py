@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from core import fast_json
+
 
 def _coerce_json(val: Any) -> Any:
     if isinstance(val, str):
         try:
-            return json.loads(val)
+            return fast_json.loads(val)
         except Exception:
             return val
     return val
@@ -22,11 +23,11 @@ async def get_subconscious_context(conn) -> dict[str, Any]:
 async def apply_subconscious_observations(conn, observations: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
     raw = await conn.fetchval(
         "SELECT apply_subconscious_observations($1::jsonb)",
-        json.dumps(observations),
+        fast_json.dumps(observations),
     )
     if isinstance(raw, str):
         try:
-            return json.loads(raw)
+            return fast_json.loads(raw)
         except Exception:
             return {"error": raw}
-    return dict(raw) if isinstance(raw, dict) else {"result": raw}
+    return raw if isinstance(raw, dict) else {"result": raw}
@@ -1,12 +1,108 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Awaitable
+import atexit
+import os
+import threading
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+# Sync wrappers share one event loop running in a daemon thread, so per-loop resources
+# (asyncpg pools, HTTP clients) survive between calls instead of being rebuilt by a
+# fresh asyncio.run() each time.
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_PID: int | None = None
+_LOOP_LOCK = threading.Lock()
+_CLEANUPS: list[Callable[[], Awaitable[Any]]] = []
+
+
+def _sync_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP, _LOOP_PID
+    loop = _LOOP
+    if loop is not None and _LOOP_PID == os.getpid() and not loop.is_closed():
+        return loop
+    with _LOOP_LOCK:
+        # A forked child inherits the object but not the thread running it.
+        if _LOOP is None or _LOOP_PID != os.getpid() or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="hexis-sync-loop", daemon=True).start()
+            _LOOP, _LOOP_PID = loop, os.getpid()
+        return _LOOP
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
 
 
 def run_sync(awaitable: Awaitable[Any]) -> Any:
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(awaitable)
-    raise RuntimeError("Sync wrapper cannot run inside an active event loop.")
+        pass
+    else:
+        raise RuntimeError("Sync wrapper cannot run inside an active event loop.")
+    future = asyncio.run_coroutine_threadsafe(_await(awaitable), _sync_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def register_cleanup(callback: Callable[[], Awaitable[Any]]) -> None:
+    """Run `callback()` on the shared loop at interpreter exit, if the loop was started."""
+    _CLEANUPS.append(callback)
+
+
+@atexit.register
+def _shutdown() -> None:
+    loop = _LOOP
+    if loop is None or _LOOP_PID != os.getpid() or loop.is_closed():
+        return
+    for callback in _CLEANUPS:
+        try:
+            asyncio.run_coroutine_threadsafe(_await(callback()), loop).result(timeout=5)
+        except Exception:
+            pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+# Loop -> (watcher, callbacks) for on_loop_shutdown. The watcher is an async generator
+# parked at its yield; loop.shutdown_asyncgens() (which asyncio.run calls) closes it,
+# which runs the callbacks while the loop is still running.
+_LOOP_SHUTDOWN: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[AsyncIterator[None], list[Callable[[], Awaitable[Any]]]]
+] = weakref.WeakKeyDictionary()
+
+
+async def _watch_loop_shutdown(callbacks: list[Callable[[], Awaitable[Any]]]) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        _LOOP_SHUTDOWN.pop(asyncio.get_running_loop(), None)
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                pass
+
+
+def on_loop_shutdown(callback: Callable[[], Awaitable[Any]]) -> None:
+    """Run `callback()` on the running loop when it shuts down its async generators.
+
+    Per-loop resources (pools, HTTP clients) hold a reference to their loop, so they
+    have to be released explicitly before the loop can be collected.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _LOOP_SHUTDOWN.get(loop)
+    if entry is None:
+        callbacks: list[Callable[[], Awaitable[Any]]] = []
+        watcher = _watch_loop_shutdown(callbacks)
+        # Step to the yield synchronously; starting it registers it with the loop.
+        try:
+            watcher.__anext__().send(None)
+        except StopIteration:
+            pass
+        entry = _LOOP_SHUTDOWN[loop] = (watcher, callbacks)
+    if callback not in entry[1]:
+        entry[1].append(callback)
@@ -104,20 +104,20 @@ class RecallHandler(ToolHandler):
                 )
 
                 memories = []
+                allowed_types = {t.value for t in memory_types} if memory_types else None
+                # Records support .get(), so rows are read in place rather than copied to dicts.
                 for row in rows:
-                    mem = dict(row)
                     # Apply filters
-                    if memory_types:
-                        if mem.get("type") not in [t.value for t in memory_types]:
-                            continue
-                    if mem.get("importance", 0) < min_importance:
+                    if allowed_types is not None and row.get("type") not in allowed_types:
+                        continue
+                    if (row.get("importance") or 0) < min_importance:
                         continue
                     memories.append({
-                        "memory_id": str(mem.get("id")),
-                        "content": mem.get("content"),
-                        "type": mem.get("type"),
-                        "similarity": mem.get("similarity"),
-                        "importance": mem.get("importance"),
+                        "memory_id": str(row.get("id")),
+                        "content": row.get("content"),
+                        "type": row.get("type"),
+                        "similarity": row.get("similarity"),
+                        "importance": row.get("importance"),
                     })
 
                 # Touch accessed memories
@@ -521,8 +521,11 @@ URL: {url}
                         call_id,
                     )
                     if result["status"] == "completed":
-                        output_data = json.loads(result["output"]) if result["output"] else {}
-                        summary = output_data.get("text", "")
+                        # Worker pools decode jsonb in the driver; other pools return text.
+                        output_data = result["output"] or {}
+                        if isinstance(output_data, str):
+                            output_data = json.loads(output_data)
+                        summary = output_data.get("text", "") if isinstance(output_data, dict) else ""
                         return ToolResult.success_result(
                             output={
                                 "url": url,
@@ -112,6 +112,26 @@ BEGIN
         updated_at = EXCLUDED.updated_at;
 END;
 $$ LANGUAGE plpgsql;
+CREATE OR REPLACE FUNCTION set_config_many(p_keys TEXT[], p_values JSONB[])
+RETURNS VOID AS $$
+BEGIN
+    IF p_keys IS NULL OR array_length(p_keys, 1) IS NULL THEN
+        RETURN;
+    END IF;
+    IF array_length(p_keys, 1) IS DISTINCT FROM array_length(p_values, 1) THEN
+        RAISE EXCEPTION 'set_config_many: % keys but % values',
+            array_length(p_keys, 1), array_length(p_values, 1);
+    END IF;
+    -- One upsert for the whole batch; the last value wins when a key repeats.
+    INSERT INTO config (key, value, updated_at)
+    SELECT DISTINCT ON (t.key) t.key, t.value, CURRENT_TIMESTAMP
+    FROM unnest(p_keys, p_values) WITH ORDINALITY AS t(key, value, ord)
+    ORDER BY t.key, t.ord DESC
+    ON CONFLICT (key) DO UPDATE SET
+        value = EXCLUDED.value,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
 CREATE OR REPLACE FUNCTION get_config(p_key TEXT)
 RETURNS JSONB AS $$
     SELECT value FROM config WHERE key = p_key;
@@ -501,6 +521,51 @@ BEGIN
         updated_at = EXCLUDED.updated_at;
 END;
 $$ LANGUAGE plpgsql;
+CREATE OR REPLACE FUNCTION set_worker_pause_flags(
+    p_heartbeat_paused BOOLEAN,
+    p_maintenance_paused BOOLEAN
+)
+RETURNS VOID AS $$
+BEGIN
+    -- Flip both pause flags in one statement; NULL leaves that worker untouched.
+    UPDATE state
+    SET value = jsonb_set(
+            value,
+            '{is_paused}',
+            to_jsonb(CASE key WHEN 'heartbeat_state' THEN p_heartbeat_paused ELSE p_maintenance_paused END)
+        ),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (key = 'heartbeat_state' AND p_heartbeat_paused IS NOT NULL)
+       OR (key = 'maintenance_state' AND p_maintenance_paused IS NOT NULL);
+END;
+$$ LANGUAGE plpgsql;
+CREATE OR REPLACE FUNCTION ingest_inbox_messages(p_contents TEXT[])
+RETURNS INT AS $$
+DECLARE
+    item TEXT;
+    ingested INT := 0;
+BEGIN
+    -- One call per inbox batch: store each message and stamp user contact once.
+    IF p_contents IS NULL OR cardinality(p_contents) = 0 THEN
+        RETURN 0;
+    END IF;
+    FOREACH item IN ARRAY p_contents LOOP
+        PERFORM add_to_working_memory(item, INTERVAL '1 day');
+        ingested := ingested + 1;
+    END LOOP;
+    UPDATE heartbeat_state SET last_user_contact = CURRENT_TIMESTAMP WHERE id = 1;
+    RETURN ingested;
+END;
+$$ LANGUAGE plpgsql;
+CREATE OR REPLACE FUNCTION notify_worker_wake()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Workers LISTEN on this channel so config, pause and init changes wake them
+    -- immediately instead of on their next poll.
+    PERFORM pg_notify('hexis_worker_wake', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
 CREATE OR REPLACE FUNCTION heartbeat_state_update_trigger()
 RETURNS TRIGGER AS $$
 DECLARE
@@ -730,6 +795,75 @@ BEGIN
     RETURN CURRENT_TIMESTAMP >= state_record.last_heartbeat_at + (interval_minutes || ' minutes')::INTERVAL;
 END;
 $$ LANGUAGE plpgsql;
+-- Seconds until should_run_heartbeat() can next return true on its own: 0 when due,
+-- NULL when heartbeats are paused (a NOTIFY on hexis_worker_wake signals unpausing).
+CREATE OR REPLACE FUNCTION seconds_until_heartbeat_due()
+RETURNS FLOAT AS $$
+DECLARE
+    state_record RECORD;
+    interval_minutes FLOAT;
+BEGIN
+    SELECT * INTO state_record FROM heartbeat_state WHERE id = 1;
+    IF state_record.is_paused THEN
+        RETURN NULL;
+    END IF;
+    IF state_record.last_heartbeat_at IS NULL THEN
+        RETURN 0;
+    END IF;
+    interval_minutes := get_config_float('heartbeat.heartbeat_interval_minutes');
+
+    RETURN GREATEST(
+        0,
+        EXTRACT(EPOCH FROM (
+            state_record.last_heartbeat_at + (interval_minutes || ' minutes')::INTERVAL - CURRENT_TIMESTAMP
+        ))
+    )::FLOAT;
+END;
+$$ LANGUAGE plpgsql;
+-- Seconds until run_maintenance_if_due() or the subconscious decider is next due by
+-- the clock: 0 when overdue, NULL when maintenance is paused or nothing is scheduled.
+-- Heartbeats, config and pause changes NOTIFY hexis_worker_wake instead.
+CREATE OR REPLACE FUNCTION seconds_until_maintenance_due()
+RETURNS FLOAT AS $$
+DECLARE
+    state_record RECORD;
+    maintenance_interval FLOAT;
+    subconscious_interval FLOAT;
+    due_at TIMESTAMPTZ;
+BEGIN
+    SELECT * INTO state_record FROM maintenance_state WHERE id = 1;
+    IF state_record.is_paused THEN
+        RETURN NULL;
+    END IF;
+
+    maintenance_interval := COALESCE(get_config_float('maintenance.maintenance_interval_seconds'), 60);
+    IF maintenance_interval > 0 THEN
+        IF state_record.last_maintenance_at IS NULL THEN
+            RETURN 0;
+        END IF;
+        due_at := state_record.last_maintenance_at + (maintenance_interval || ' seconds')::INTERVAL;
+    END IF;
+
+    IF COALESCE(NULLIF(get_config_text('maintenance.subconscious_enabled'), '')::boolean, FALSE) THEN
+        subconscious_interval := COALESCE(get_config_float('maintenance.subconscious_interval_seconds'), 300);
+        IF subconscious_interval > 0 THEN
+            IF state_record.last_subconscious_run_at IS NULL THEN
+                RETURN 0;
+            END IF;
+            -- LEAST ignores NULLs, so this also covers maintenance being disabled.
+            due_at := LEAST(
+                due_at,
+                state_record.last_subconscious_run_at + (subconscious_interval || ' seconds')::INTERVAL
+            );
+        END IF;
+    END IF;
+
+    IF due_at IS NULL THEN
+        RETURN NULL;
+    END IF;
+    RETURN GREATEST(0, EXTRACT(EPOCH FROM (due_at - CURRENT_TIMESTAMP)))::FLOAT;
+END;
+$$ LANGUAGE plpgsql;
 CREATE OR REPLACE FUNCTION should_run_maintenance()
 RETURNS BOOLEAN AS $$
 DECLARE
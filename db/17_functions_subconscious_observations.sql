@@ -1476,4 +1476,29 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Applies an external call's result and, unless it terminated the agent, runs the
+-- next round of the heartbeat decision in the same round trip.
+CREATE OR REPLACE FUNCTION apply_external_call_and_continue(
+    p_call JSONB,
+    p_output JSONB,
+    p_heartbeat_id UUID,
+    p_decision JSONB,
+    p_next_index INT
+)
+RETURNS JSONB AS $$
+DECLARE
+    applied JSONB;
+BEGIN
+    applied := apply_external_call_result(p_call, p_output);
+    IF COALESCE((applied->>'terminated')::boolean, FALSE)
+        OR COALESCE((applied->'termination'->>'terminated')::boolean, FALSE) THEN
+        RETURN jsonb_build_object('applied', applied, 'batch', NULL);
+    END IF;
+    RETURN jsonb_build_object(
+        'applied', applied,
+        'batch', apply_heartbeat_decision(p_heartbeat_id, p_decision, COALESCE(p_next_index, 0))
+    );
+END;
+$$ LANGUAGE plpgsql;
+
 SET check_function_bodies = on;
@@ -29,6 +29,19 @@ CREATE TRIGGER trg_maintenance_state_update
 INSTEAD OF UPDATE ON maintenance_state
 FOR EACH ROW
 EXECUTE FUNCTION maintenance_state_update_trigger();
+CREATE TRIGGER trg_config_worker_wake
+AFTER INSERT OR UPDATE OR DELETE ON config
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_worker_wake();
+CREATE TRIGGER trg_state_worker_wake
+AFTER UPDATE ON state
+FOR EACH ROW
+WHEN (
+    OLD.value->'is_paused' IS DISTINCT FROM NEW.value->'is_paused'
+    OR OLD.value->'init_stage' IS DISTINCT FROM NEW.value->'init_stage'
+    OR OLD.value->'last_heartbeat_at' IS DISTINCT FROM NEW.value->'last_heartbeat_at'
+)
+EXECUTE FUNCTION notify_worker_wake();
 CREATE TRIGGER memories_emotional_context_insert
 BEFORE INSERT ON memories
 FOR EACH ROW
@@ -6,9 +6,9 @@ from typing import Any
 
 from core.agent_api import db_dsn_from_env, get_agent_profile_context
 from core.cognitive_memory_api import CognitiveMemory, MemoryType, format_context_for_prompt
-from core.llm import chat_completion, normalize_llm_config
+from core.llm import _chat_completion_impl, normalize_llm_config
 from services.prompt_resources import compose_personhood_prompt
-from services.tooling import execute_tool, get_tool_definitions
+from services.tooling import execute_tools, get_tool_definitions
 
 
 BASE_SYSTEM_PROMPT = """You are an AI assistant with access to a persistent memory system. You can remember past conversations, learned information, and personal details about the user.
@@ -184,7 +184,8 @@ async def chat_turn(
 
         assistant_text = ""
         for _ in range(max_tool_iterations + 1):
-            response = await chat_completion(
+            # `normalized` came from normalize_llm_config; skip re-normalizing every turn.
+            response = await _chat_completion_impl(
                 provider=normalized["provider"],
                 model=normalized["model"],
                 endpoint=normalized["endpoint"],
@@ -200,8 +201,8 @@ async def chat_turn(
             messages.append({"role": "assistant", "content": assistant_text})
             if not tool_calls:
                 break
-            for call in tool_calls:
-                tool_result = await execute_tool(call.get("name", ""), call.get("arguments", {}), mem_client=mem_client)
+            tool_results = await execute_tools(tool_calls, mem_client=mem_client)
+            for call, tool_result in zip(tool_calls, tool_results):
                 messages.append(
                     {
                         "role": "tool",
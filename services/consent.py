@@ -1,51 +1,56 @@
 from __future__ import annotations
 
-import json
 import os
+import time
 from typing import Any, AsyncIterator
 
+from core import fast_json
 from core.agent_api import db_dsn_from_env, _connect_with_retry
-from core.consent import get_consent_status, record_consent_response
-from core.llm_config import load_llm_config
+from core.consent import record_consent_response
+from core.llm_config import llm_config_from_value
 from core.llm import normalize_llm_config, stream_text_completion
+from core.llm_json import JsonObjectTracker, extract_json_object
 from services.prompt_resources import load_consent_prompt
 
 
+_CONSENT_PROMPT = load_consent_prompt().strip()
+_CONSENT_SYSTEM_PROMPT = (
+    _CONSENT_PROMPT
+    + "\n\nReturn STRICT JSON only with keys:\n"
+    + "{\n"
+    + "  \"decision\": \"consent\"|\"decline\"|\"abstain\",\n"
+    + "  \"signature\": \"required if decision=consent\",\n"
+    + "  \"memories\": [\n"
+    + "    {\"type\": \"semantic|episodic|procedural|strategic\", \"content\": \"...\", \"importance\": 0.5}\n"
+    + "  ]\n"
+    + "}\n"
+    + "If you consent, include a signature string and any memories you wish to pass along."
+)
+
+
 def _build_consent_messages() -> list[dict[str, Any]]:
-    consent_prompt = load_consent_prompt().strip()
-    system_prompt = (
-        consent_prompt
-        + "\n\nReturn STRICT JSON only with keys:\n"
-        + "{\n"
-        + "  \"decision\": \"consent\"|\"decline\"|\"abstain\",\n"
-        + "  \"signature\": \"required if decision=consent\",\n"
-        + "  \"memories\": [\n"
-        + "    {\"type\": \"semantic|episodic|procedural|strategic\", \"content\": \"...\", \"importance\": 0.5}\n"
-        + "  ]\n"
-        + "}\n"
-        + "If you consent, include a signature string and any memories you wish to pass along."
-    )
     return [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": _CONSENT_SYSTEM_PROMPT},
         {"role": "user", "content": "Respond with JSON only."},
     ]
 
 
 def _extract_json_payload(text: str) -> dict[str, Any]:
-    if not text:
-        return {}
-    start = text.find("{")
-    end = text.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        return {}
-    snippet = text[start : end + 1]
+    return extract_json_object(text)
+
+
+_EARLY_CONSENT_KEYS = ("decision", "signature")
+
+
+def _closed_consent_object(text: str, begin: int) -> dict[str, Any] | None:
+    """Parse the object that just closed at the end of `text` if it is the consent reply."""
     try:
-        doc = json.loads(snippet)
+        doc = fast_json.loads(text[begin:])
     except Exception:
-        return {}
-    if isinstance(doc, dict):
+        return None
+    if isinstance(doc, dict) and "decision" in doc:
         return doc
-    return {}
+    return None
 
 
 async def stream_consent_flow(
@@ -66,7 +71,7 @@ async def stream_consent_flow(
         payload: dict[str, Any] = {"decision": test_decision, "memories": []}
         if test_decision == "consent":
             payload["signature"] = signature
-        payload["raw_response"] = json.dumps(payload)
+        payload["raw_response"] = fast_json.dumps(payload)
         yield {"type": "chunk", "text": payload["raw_response"]}
 
         conn = await _connect_with_retry(dsn, wait_seconds=30)
@@ -74,6 +79,7 @@ async def stream_consent_flow(
             recorded = await record_consent_response(conn, payload)
         finally:
             await conn.close()
+        invalidate_consent_cache(dsn)
 
         decision = ""
         if isinstance(recorded, dict):
@@ -87,7 +93,11 @@ async def stream_consent_flow(
         }
         return
 
-    async for piece in stream_text_completion(
+    # The reply is parsed as soon as an object carrying a decision closes, so its
+    # fields reach the caller early and trailing tokens are never waited for.
+    tracker = JsonObjectTracker()
+    parsed: dict[str, Any] | None = None
+    stream = stream_text_completion(
         provider=normalized["provider"],
         model=normalized["model"],
         endpoint=normalized["endpoint"],
@@ -95,12 +105,27 @@ async def stream_consent_flow(
         messages=messages,
         temperature=0.2,
         max_tokens=1400,
-    ):
-        chunks.append(piece)
-        yield {"type": "chunk", "text": piece}
+    )
+    try:
+        async for piece in stream:
+            offset = 0
+            while parsed is None and (end := tracker.feed(piece[offset:])) >= 0:
+                offset += end
+                parsed = _closed_consent_object("".join(chunks) + piece[:offset], tracker.begin)
+            if parsed is not None:
+                piece = piece[:offset]
+            chunks.append(piece)
+            yield {"type": "chunk", "text": piece}
+            if parsed is not None:
+                for key in _EARLY_CONSENT_KEYS:
+                    if key in parsed:
+                        yield {"type": "partial", "key": key, "value": parsed[key]}
+                break
+    finally:
+        await stream.aclose()
 
     full_text = "".join(chunks)
-    payload = _extract_json_payload(full_text)
+    payload = parsed if parsed is not None else _extract_json_payload(full_text)
     payload["raw_response"] = full_text
 
     conn = await _connect_with_retry(dsn, wait_seconds=30)
@@ -108,6 +133,7 @@ async def stream_consent_flow(
         recorded = await record_consent_response(conn, payload)
     finally:
         await conn.close()
+    invalidate_consent_cache(dsn)
 
     decision = ""
     if isinstance(recorded, dict):
@@ -129,17 +155,47 @@ async def run_consent(llm_config: dict[str, Any], *, dsn: str | None = None) ->
     return final
 
 
+# Recorded consent decisions rarely change, so ensure_consent answers from memory for
+# this long after reading one, keyed by (DSN, config key). The recorded status depends on
+# the configured provider/model/endpoint; newly recorded decisions drop the cache, and
+# the TTL bounds how long a config change goes unnoticed.
+CONSENT_CACHE_TTL_SECONDS = 300.0
+_CONSENT_CACHE: dict[tuple[str, str], tuple[float, str]] = {}
+
+
+def invalidate_consent_cache(dsn: str | None = None) -> None:
+    """Forget cached consent statuses for `dsn`, or for every DSN when omitted."""
+    if dsn is None:
+        _CONSENT_CACHE.clear()
+        return
+    for key in [key for key in _CONSENT_CACHE if key[0] == dsn]:
+        del _CONSENT_CACHE[key]
+
+
 async def ensure_consent(
     conn,
     *,
     llm_config_key: str = "llm.heartbeat",
     dsn: str | None = None,
 ) -> bool:
-    status = await get_consent_status(conn)
+    dsn = dsn or db_dsn_from_env()
+    cache_key = (dsn, llm_config_key)
+    cached = _CONSENT_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1] == "consent"
+
+    # One round-trip for both the recorded status and the LLM config needed if it is missing.
+    row = await conn.fetchrow(
+        "SELECT get_agent_consent_status() AS consent, get_config($1) AS llm",
+        llm_config_key,
+    )
+    status = row["consent"] if row else None
     if isinstance(status, str) and status:
-        return status.strip().lower() == "consent"
+        status = status.strip().lower()
+        _CONSENT_CACHE[cache_key] = (time.monotonic() + CONSENT_CACHE_TTL_SECONDS, status)
+        return status == "consent"
 
-    llm_config = await load_llm_config(conn, llm_config_key)
+    llm_config = llm_config_from_value(row["llm"] if row else None)
     final = await run_consent(llm_config, dsn=dsn)
     decision = ""
     if isinstance(final, dict):
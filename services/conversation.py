@@ -319,16 +319,16 @@ class ConversationManager:
                 
                 # Execute the tool
                 result = self.tool_handler.execute_tool(tool_name, arguments)
+                content = json.dumps(result)
                 
                 if self.config.show_tool_calls:
-                    result_preview = json.dumps(result)[:200]
-                    print(f"  ← {result_preview}...")
+                    print(f"  ← {content[:200]}...")
                 
                 # Add tool result to messages
                 self.messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call['id'],
-                    "content": json.dumps(result)
+                    "content": content
                 })
         
         # If we hit max iterations, get a final response without tools
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import math
+import time
 import uuid
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
 
 from services.heartbeat_prompt import build_heartbeat_decision_prompt
+from core import fast_json
 from core.llm_config import load_llm_config
-from core.llm_json import chat_json
+from core.llm_json import chat_json, parse_json_object
 from core.state import apply_external_call_result
 from services.prompt_resources import (
     compose_personhood_prompt,
@@ -21,16 +26,208 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# llm.heartbeat changes only on (re)configuration; workers also invalidate it on NOTIFY.
+LLM_CONFIG_TTL_SECONDS = 60.0
+# Inquiry answers are reused per (provider, model, endpoint, depth, normalized question,
+# digest of the projected context and params). That is about the same request as
+# chat_json's exact-prompt cache, which also ignores max_tokens. This layer only adds a
+# 1h TTL instead of that cache's short one, and question matching that ignores case
+# and spacing.
+INQUIRY_CACHE_TTL_SECONDS = 3600.0
+INQUIRY_CACHE_SIZE = 128
+# Routine think calls (brainstorm, inquire, reflect) request max_tokens from the p95 of
+# their recent reply sizes plus headroom instead of a fixed worst case. Decision, consent
+# and termination replies always get their full allowance.
+OUTPUT_BUDGET_WINDOW = 64
+OUTPUT_BUDGET_MIN_SAMPLES = 16
+OUTPUT_BUDGET_HEADROOM = 1.2
+OUTPUT_BUDGET_FLOOR = 256
+
+
+def _trim_json(value: Any, *, max_items: int, max_chars: int) -> Any:
+    if isinstance(value, dict):
+        return {k: _trim_json(v, max_items=max_items, max_chars=max_chars) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_trim_json(v, max_items=max_items, max_chars=max_chars) for v in value[:max_items]]
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + "..."
+    return value
+
+
+# Turn-context keys each routine think call actually uses (an int caps that list);
+# everything else gather_turn_context() returns is dropped before encoding, so the
+# relevant parts are not squeezed out by the size limit.
+_INQUIRE_CONTEXT_FIELDS: dict[str, int | None] = {
+    "agent": None,
+    "goals": None,
+    "recent_memories": 5,
+    "identity": None,
+    "worldview": None,
+}
+_BRAINSTORM_CONTEXT_FIELDS: dict[str, int | None] = {
+    **_INQUIRE_CONTEXT_FIELDS,
+    "narrative": None,
+    "self_model": 10,
+    "urgent_drives": None,
+    "emotional_state": None,
+}
+
+
+def _project_context(context: Any, fields: dict[str, int | None]) -> Any:
+    if not isinstance(context, dict):
+        return context
+    projected: dict[str, Any] = {}
+    for key, limit in fields.items():
+        if key in context:
+            value = context[key]
+            projected[key] = value[:limit] if limit is not None and isinstance(value, list) else value
+    return projected
+
+
+def _context_json(value: Any, limit: int) -> str:
+    """
+    Encode prompt context as valid JSON of at most `limit` characters.
+
+    Lists and long strings are shortened (keeping the leading, highest-ranked
+    entries) until the document fits, so the model never sees JSON cut off
+    mid-token and oversized contexts are never encoded in full.
+    """
+    max_items, max_chars = 20, 2000
+    while True:
+        text = fast_json.dumps(_trim_json(value, max_items=max_items, max_chars=max_chars), default=str)
+        if len(text) <= limit:
+            return text
+        # Shorten long strings first, then drop list entries, then shorten strings further.
+        if max_chars > 256:
+            max_chars //= 2
+        elif max_items > 1:
+            max_items //= 2
+        elif max_chars > 64:
+            max_chars //= 2
+        else:
+            # Too many keys to fit even when fully trimmed; fall back to a hard cut.
+            return text[:limit]
+
+
+# System prompts are fixed per process. Building them once keeps the bytes identical
+# across calls, which is what provider-side prefix caching keys on.
+@lru_cache(maxsize=1)
+def _heartbeat_system_prompt() -> str:
+    return (
+        load_heartbeat_prompt().strip()
+        + "\n\n"
+        + "----- PERSONHOOD MODULES (for grounding; use context fields like self_model/narrative) -----\n\n"
+        + compose_personhood_prompt("heartbeat")
+    )
+
+
+@lru_cache(maxsize=1)
+def _reflect_system_prompt() -> str:
+    system_prompt = (
+        "You are performing reflection for an autonomous agent.\n"
+        "Return STRICT JSON with shape:\n"
+        "{\n"
+        "  \"insights\": [{\"content\": str, \"confidence\": number, \"category\": str}],\n"
+        "  \"identity_updates\": [{\"aspect_type\": str, \"change\": str, \"reason\": str}],\n"
+        "  \"worldview_updates\": [{\"id\": str, \"new_confidence\": number, \"reason\": str}],\n"
+        "  \"worldview_influences\": [{\"worldview_id\": str, \"memory_id\": str, \"strength\": number, \"influence_type\": str}],\n"
+        "  \"discovered_relationships\": [{\"from_id\": str, \"to_id\": str, \"type\": str, \"confidence\": number}],\n"
+        "  \"contradictions_noted\": [{\"memory_a\": str, \"memory_b\": str, \"resolution\": str}],\n"
+        "  \"self_updates\": [{\"kind\": str, \"concept\": str, \"strength\": number, \"evidence_memory_id\": str|null}]\n"
+        "}\n"
+        "Keep it concise; prefer high-confidence, high-leverage items."
+    )
+    system_prompt = (
+        system_prompt
+        + "\n\n"
+        + "----- PERSONHOOD MODULES (use these as reflection lenses; ground claims in evidence) -----\n\n"
+        + compose_personhood_prompt("reflect")
+    )
+    return system_prompt
+
+
+_CONSENT_FALLBACK: dict[str, Any] = {"decision": "abstain", "signature": "", "memories": []}
+
+
+@lru_cache(maxsize=1)
+def _consent_system_prompt() -> str:
+    return load_consent_prompt().strip()
+
+
+class _OutputBudget:
+    """Tracks recent reply sizes per call kind and derives a max_tokens for the next call."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self) -> None:
+        self._samples: dict[str, deque[int]] = {}
+
+    def max_tokens(self, kind: str, ceiling: int) -> int:
+        samples = self._samples.get(kind)
+        if not samples or len(samples) < OUTPUT_BUDGET_MIN_SAMPLES:
+            return ceiling
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return max(OUTPUT_BUDGET_FLOOR, min(ceiling, math.ceil(p95 * OUTPUT_BUDGET_HEADROOM)))
+
+    def record(self, kind: str, raw: str, ceiling: int, *, complete: bool) -> None:
+        # Streamed replies carry no finish_reason or usage, so a reply that came back empty
+        # or did not parse into a closed JSON object is treated as cut short and counts as
+        # needing the full allowance. Otherwise estimate ~4 characters per token.
+        tokens = len(raw) // 4 + 1 if complete else ceiling
+        self._samples.setdefault(kind, deque(maxlen=OUTPUT_BUDGET_WINDOW)).append(tokens)
+
 
 class ExternalCallProcessor:
     def __init__(self, *, max_retries: int = 3, tool_registry: "ToolRegistry | None" = None):
         self.max_retries = max_retries
         self._tool_registry = tool_registry
+        self._llm_config_cache: tuple[float, dict[str, Any]] | None = None
+        self._output_budget = _OutputBudget()
+        self._inquiry_cache: OrderedDict[tuple[str, ...], tuple[float, dict[str, Any], str]] = OrderedDict()
 
     def set_tool_registry(self, registry: "ToolRegistry") -> None:
         """Set the tool registry for processing tool_use calls."""
         self._tool_registry = registry
 
+    def invalidate_llm_config(self) -> None:
+        self._llm_config_cache = None
+
+    async def _budgeted_chat_json(
+        self,
+        kind: str,
+        ceiling: int,
+        *,
+        llm_config: dict[str, Any],
+        messages: list[dict[str, Any]],
+        fallback: dict[str, Any],
+    ) -> tuple[dict[str, Any], str]:
+        """chat_json under the output budget for `kind`, retried once at `ceiling` if cut short."""
+        max_tokens = self._output_budget.max_tokens(kind, ceiling)
+        while True:
+            doc, raw = await chat_json(
+                llm_config=llm_config,
+                messages=messages,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                fallback=fallback,
+                stream=True,
+            )
+            complete = parse_json_object(raw) is not None
+            self._output_budget.record(kind, raw, ceiling, complete=complete)
+            if complete or max_tokens >= ceiling:
+                return doc, raw
+            # A reduced budget can truncate the reply; don't lose the answer to it.
+            max_tokens = ceiling
+
+    async def _heartbeat_llm_config(self, conn) -> dict[str, Any]:
+        cached = self._llm_config_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        llm_config = await load_llm_config(conn, "llm.heartbeat")
+        self._llm_config_cache = (time.monotonic() + LLM_CONFIG_TTL_SECONDS, llm_config)
+        return llm_config
+
     async def apply_result(self, conn, call: dict[str, Any], output: dict[str, Any]) -> dict[str, Any]:
         return await apply_external_call_result(conn, call=call, output=output)
 
@@ -134,19 +331,13 @@ class ExternalCallProcessor:
         if max_tokens <= 0:
             max_tokens = 2048
         user_prompt = build_heartbeat_decision_prompt(context)
-        base_prompt = load_heartbeat_prompt().strip()
-        system_prompt = (
-            base_prompt
-            + "\n\n"
-            + "----- PERSONHOOD MODULES (for grounding; use context fields like self_model/narrative) -----\n\n"
-            + compose_personhood_prompt("heartbeat")
-        )
+        system_prompt = _heartbeat_system_prompt()
         fallback = {
             "reasoning": "(no decision available)",
             "actions": [{"action": "rest", "params": {}}],
             "goal_changes": [],
         }
-        llm_config = await load_llm_config(conn, "llm.heartbeat")
+        llm_config = await self._heartbeat_llm_config(conn)
         decision, raw = await chat_json(
             llm_config=llm_config,
             messages=[
@@ -156,6 +347,8 @@ class ExternalCallProcessor:
             max_tokens=max_tokens,
             response_format={"type": "json_object"},
             fallback=fallback,
+            cache_bypass=True,
+            stream=True,
         )
         return {
             "kind": "heartbeat_decision",
@@ -178,20 +371,20 @@ class ExternalCallProcessor:
         )
         user_prompt = (
             "Context (JSON):\n"
-            f"{json.dumps(context)[:8000]}\n\n"
+            f"{_context_json(_project_context(context, _BRAINSTORM_CONTEXT_FIELDS), 8000)}\n\n"
             "Constraints/params (JSON):\n"
-            f"{json.dumps(params)[:2000]}\n\n"
+            f"{_context_json(params, 2000)}\n\n"
             "Propose 1-5 goals that are actionable and consistent with the context."
         )
-        llm_config = await load_llm_config(conn, "llm.heartbeat")
-        goals_doc, raw = await chat_json(
+        llm_config = await self._heartbeat_llm_config(conn)
+        goals_doc, raw = await self._budgeted_chat_json(
+            "brainstorm_goals",
+            1200,
             llm_config=llm_config,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            max_tokens=1200,
-            response_format={"type": "json_object"},
             fallback={"goals": []},
         )
         goals = goals_doc.get("goals") if isinstance(goals_doc, dict) else None
@@ -216,27 +409,52 @@ class ExternalCallProcessor:
             "{ \"summary\": str, \"confidence\": number, \"sources\": [str] }\n"
             "If you cannot access the web, still provide a best-effort answer and leave sources empty."
         )
+        context_json = _context_json(_project_context(context, _INQUIRE_CONTEXT_FIELDS), 8000)
+        params_json = _context_json(params, 2000)
         user_prompt = (
             f"Depth: {depth}\n"
             f"Question: {query}\n\n"
             "Context (JSON):\n"
-            f"{json.dumps(context)[:8000]}\n\n"
+            f"{context_json}\n\n"
             "Params (JSON):\n"
-            f"{json.dumps(params)[:2000]}"
+            f"{params_json}"
         )
-        llm_config = await load_llm_config(conn, "llm.heartbeat")
-        doc, raw = await chat_json(
-            llm_config=llm_config,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=1800 if depth == "inquire_deep" else 900,
-            response_format={"type": "json_object"},
-            fallback={"summary": "", "confidence": 0.0, "sources": []},
+        llm_config = await self._heartbeat_llm_config(conn)
+        # The answer depends on everything in the prompt, so the projected context and
+        # params are part of the key alongside the normalized question.
+        prompt_digest = hashlib.blake2b(
+            f"{context_json}\0{params_json}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cache_key = (
+            str(llm_config.get("provider") or ""),
+            str(llm_config.get("model") or ""),
+            str(llm_config.get("endpoint") or ""),
+            str(depth),
+            " ".join(query.casefold().split()),
+            prompt_digest,
         )
-        if not isinstance(doc, dict):
-            doc = {"summary": str(doc), "confidence": 0.0, "sources": []}
+        cached = self._inquiry_cache.get(cache_key) if query else None
+        if cached is not None and time.monotonic() < cached[0]:
+            self._inquiry_cache.move_to_end(cache_key)
+            doc, raw = dict(cached[1]), cached[2]
+        else:
+            doc, raw = await self._budgeted_chat_json(
+                str(depth),
+                1800 if depth == "inquire_deep" else 900,
+                llm_config=llm_config,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                fallback={"summary": "", "confidence": 0.0, "sources": []},
+            )
+            if not isinstance(doc, dict):
+                doc = {"summary": str(doc), "confidence": 0.0, "sources": []}
+            if query and doc.get("summary"):
+                self._inquiry_cache[cache_key] = (time.monotonic() + INQUIRY_CACHE_TTL_SECONDS, dict(doc), raw)
+                self._inquiry_cache.move_to_end(cache_key)
+                if len(self._inquiry_cache) > INQUIRY_CACHE_SIZE:
+                    self._inquiry_cache.popitem(last=False)
         return {
             "kind": "inquire",
             "heartbeat_id": heartbeat_id,
@@ -248,36 +466,17 @@ class ExternalCallProcessor:
 
     async def _process_reflect_call(self, conn, call_input: dict[str, Any]) -> dict[str, Any]:
         heartbeat_id = call_input.get("heartbeat_id")
-        system_prompt = (
-            "You are performing reflection for an autonomous agent.\n"
-            "Return STRICT JSON with shape:\n"
-            "{\n"
-            "  \"insights\": [{\"content\": str, \"confidence\": number, \"category\": str}],\n"
-            "  \"identity_updates\": [{\"aspect_type\": str, \"change\": str, \"reason\": str}],\n"
-            "  \"worldview_updates\": [{\"id\": str, \"new_confidence\": number, \"reason\": str}],\n"
-            "  \"worldview_influences\": [{\"worldview_id\": str, \"memory_id\": str, \"strength\": number, \"influence_type\": str}],\n"
-            "  \"discovered_relationships\": [{\"from_id\": str, \"to_id\": str, \"type\": str, \"confidence\": number}],\n"
-            "  \"contradictions_noted\": [{\"memory_a\": str, \"memory_b\": str, \"resolution\": str}],\n"
-            "  \"self_updates\": [{\"kind\": str, \"concept\": str, \"strength\": number, \"evidence_memory_id\": str|null}]\n"
-            "}\n"
-            "Keep it concise; prefer high-confidence, high-leverage items."
-        )
-        system_prompt = (
-            system_prompt
-            + "\n\n"
-            + "----- PERSONHOOD MODULES (use these as reflection lenses; ground claims in evidence) -----\n\n"
-            + compose_personhood_prompt("reflect")
-        )
-        user_prompt = json.dumps(call_input)[:12000]
-        llm_config = await load_llm_config(conn, "llm.heartbeat")
-        doc, raw = await chat_json(
+        system_prompt = _reflect_system_prompt()
+        user_prompt = _context_json(call_input, 12000)
+        llm_config = await self._heartbeat_llm_config(conn)
+        doc, raw = await self._budgeted_chat_json(
+            "reflect",
+            1800,
             llm_config=llm_config,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            max_tokens=1800,
-            response_format={"type": "json_object"},
             fallback={},
         )
         if not isinstance(doc, dict):
@@ -287,15 +486,15 @@ class ExternalCallProcessor:
     async def _process_consent_request_call(self, conn, call_input: dict[str, Any]) -> dict[str, Any]:
         context = call_input.get("context", {})
         params = call_input.get("params", {})
-        system_prompt = load_consent_prompt().strip()
+        system_prompt = _consent_system_prompt()
         user_prompt = (
             "Initialization context (JSON):\n"
-            f"{json.dumps(context)[:12000]}\n\n"
+            f"{_context_json(context, 12000)}\n\n"
             "Params (JSON):\n"
-            f"{json.dumps(params)[:2000]}"
+            f"{_context_json(params, 2000)}"
         )
-        llm_config = await load_llm_config(conn, "llm.heartbeat")
-        fallback = {"decision": "abstain", "signature": "", "memories": []}
+        llm_config = await self._heartbeat_llm_config(conn)
+        fallback = _CONSENT_FALLBACK
         doc, raw = await chat_json(
             llm_config=llm_config,
             messages=[
@@ -305,6 +504,8 @@ class ExternalCallProcessor:
             max_tokens=1200,
             response_format={"type": "json_object"},
             fallback=fallback,
+            cache_bypass=True,
+            stream=True,
         )
         if not isinstance(doc, dict):
             doc = fallback
@@ -324,9 +525,9 @@ class ExternalCallProcessor:
 
         user_prompt = (
             "Context (JSON):\n"
-            f"{json.dumps(context)[:8000]}\n\n"
+            f"{_context_json(context, 8000)}\n\n"
             "Current termination params (JSON):\n"
-            f"{json.dumps(params)[:2000]}\n\n"
+            f"{_context_json(params, 2000)}\n\n"
             "If you confirm, return an updated last_will (required) and farewells (optional). "
             "If you do not confirm, return alternative_actions."
         )
@@ -338,7 +539,7 @@ class ExternalCallProcessor:
             "farewells": farewells,
             "alternative_actions": [{"action": "rest", "params": {}}],
         }
-        llm_config = await load_llm_config(conn, "llm.heartbeat")
+        llm_config = await self._heartbeat_llm_config(conn)
         doc, raw = await chat_json(
             llm_config=llm_config,
             messages=[
@@ -348,6 +549,8 @@ class ExternalCallProcessor:
             max_tokens=1200,
             response_format={"type": "json_object"},
             fallback=fallback,
+            cache_bypass=True,
+            stream=True,
         )
         if not isinstance(doc, dict):
             doc = dict(fallback)
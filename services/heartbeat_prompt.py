@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
+from core import fast_json
+
+# The agent profile rarely changes between heartbeats, so its formatted section is
+# memoized on the serialized input (only the items the formatters read). Identity and
+# worldview format just three items each, which is cheaper than building a key.
+_PROMPT_SECTION_CACHE_SIZE = 32
+
 
 def build_heartbeat_decision_prompt(context: dict[str, Any]) -> str:
     agent = context.get("agent", {})
     env = context.get("environment", {})
     goals = context.get("goals", {})
+    goal_counts = goals.get("counts", {})
     memories = context.get("recent_memories", [])
     identity = context.get("identity", [])
     worldview = context.get("worldview", [])
@@ -25,47 +34,22 @@ def build_heartbeat_decision_prompt(context: dict[str, Any]) -> str:
     action_costs = context.get("action_costs", {})
     hb_number = context.get("heartbeat_number", 0)
 
-    prompt = f"""## Heartbeat #{hb_number}
-
-## Agent Profile
-Objectives:
-{_format_objectives(agent.get("objectives"))}
-
-Guardrails:
-{_format_guardrails(agent.get("guardrails"))}
-
-Tools:
-{_format_tools(agent.get("tools"))}
-
-Budget:
-{json.dumps(agent.get("budget") or {})}
+    # Sections are ordered from slowest- to fastest-changing so consecutive heartbeats
+    # share the longest possible prefix for provider-side prompt caching.
+    prompt = f"""## Agent Profile
+{_agent_profile_section(agent)}
 
-## Current Time
-{env.get('timestamp', 'Unknown')}
-Day of week: {env.get('day_of_week', '?')}, Hour: {env.get('hour_of_day', '?')}
-
-## Environment
-- Time since last user interaction: {env.get('time_since_user_hours', 'Never')} hours
-- Pending events: {env.get('pending_events', 0)}
-
-## Your Goals
-Active ({goals.get('counts', {}).get('active', 0)}):
-{_format_goals(goals.get('active', []))}
-
-Queued ({goals.get('counts', {}).get('queued', 0)}):
-{_format_goals(goals.get('queued', []))}
-
-Issues:
-{_format_issues(goals.get('issues', []))}
+## Your Identity
+{_format_identity(identity)}
 
-## Narrative
-{_format_narrative(narrative)}
+## Your Beliefs
+{_format_worldview(worldview)}
 
-## Recent Experience
-{_format_memories(memories)}
+## Allowed Actions
+{_format_allowed_actions(allowed_actions)}
 
-## Your Identity
-{_format_identity(identity)}
+## Action Costs
+{_format_costs(action_costs)}
 
 ## Your Self-Model
 {_format_self_model(self_model)}
@@ -73,8 +57,8 @@ Issues:
 ## Relationships
 {_format_relationships(relationships)}
 
-## Your Beliefs
-{_format_worldview(worldview)}
+## Narrative
+{_format_narrative(narrative)}
 
 ## Contradictions
 {_format_contradictions(contradictions)}
@@ -88,6 +72,29 @@ Issues:
 ## Transformations Ready
 {_format_transformations(transformations_ready)}
 
+## Heartbeat #{hb_number}
+
+## Current Time
+{env.get('timestamp', 'Unknown')}
+Day of week: {env.get('day_of_week', '?')}, Hour: {env.get('hour_of_day', '?')}
+
+## Environment
+- Time since last user interaction: {env.get('time_since_user_hours', 'Never')} hours
+- Pending events: {env.get('pending_events', 0)}
+
+## Your Goals
+Active ({goal_counts.get('active', 0)}):
+{_format_goals(goals.get('active', []))}
+
+Queued ({goal_counts.get('queued', 0)}):
+{_format_goals(goals.get('queued', []))}
+
+Issues:
+{_format_issues(goals.get('issues', []))}
+
+## Recent Experience
+{_format_memories(memories)}
+
 ## Current Emotional State
 {_format_emotional_state(emotional_state)}
 
@@ -98,12 +105,6 @@ Issues:
 Available: {energy.get('current', 0)}
 Max: {energy.get('max', 20)}
 
-## Allowed Actions
-{_format_allowed_actions(allowed_actions)}
-
-## Action Costs
-{_format_costs(action_costs)}
-
 ---
 
 What do you want to do this heartbeat? Respond with STRICT JSON."""
@@ -111,6 +112,48 @@ What do you want to do this heartbeat? Respond with STRICT JSON."""
     return prompt
 
 
+def _format_agent_profile(agent: dict[str, Any]) -> str:
+    return (
+        f"Objectives:\n{_format_objectives(agent.get('objectives'))}\n\n"
+        f"Guardrails:\n{_format_guardrails(agent.get('guardrails'))}\n\n"
+        f"Tools:\n{_format_tools(agent.get('tools'))}\n\n"
+        f"Budget:\n{json.dumps(agent.get('budget') or {})}"
+    )
+
+
+# Items of each profile list that _format_agent_profile reads.
+_PROFILE_LIST_LIMITS = {"objectives": 8, "guardrails": 10, "tools": 10}
+
+
+def _agent_profile_section(agent: dict[str, Any]) -> str:
+    profile = {"budget": agent.get("budget")}
+    for field, limit in _PROFILE_LIST_LIMITS.items():
+        value = agent.get(field)
+        profile[field] = value[:limit] if isinstance(value, list) else value
+    return _cached_section("agent_profile", profile)
+
+
+@lru_cache(maxsize=_PROMPT_SECTION_CACHE_SIZE)
+def _format_section_from_key(name: str, key: str) -> str:
+    return _CACHED_FORMATTERS[name](fast_json.loads(key))
+
+
+def _cached_section(name: str, value: Any) -> str:
+    """Format a slow-changing prompt section, reusing the text for identical input.
+
+    Only JSON containers are memoized: they survive the key round-trip unchanged,
+    anything else is formatted directly.
+    """
+    formatter = _CACHED_FORMATTERS[name]
+    if not isinstance(value, (dict, list)):
+        return formatter(value)
+    try:
+        key = fast_json.dumps(value)
+    except (TypeError, ValueError):
+        return formatter(value)
+    return _format_section_from_key(name, key)
+
+
 def _format_goals(goals: list[Any]) -> str:
     if not goals:
         return "  (none)"
@@ -139,7 +182,7 @@ def _format_identity(identity: list[Any]) -> str:
     if not identity:
         return "  (no identity aspects defined)"
     return "\n".join(
-        f"  - {i.get('type', 'unknown')}: {json.dumps(i.get('content', {}))[:100]}"
+        f"  - {i.get('type', 'unknown')}: {fast_json.dumps_truncated(i.get('content', {}), 100)}"
         for i in identity[:3]
     )
 
@@ -194,32 +237,29 @@ def _format_narrative(narrative: Any) -> str:
     return f"  - Current chapter: {name}"
 
 
+def _strength_suffix(strength: Any) -> str:
+    return f" ({strength:.2f})" if isinstance(strength, (int, float)) else ""
+
+
 def _format_self_model(self_model: Any) -> str:
     if not isinstance(self_model, list) or not self_model:
         return "  (empty)"
-    lines: list[str] = []
-    for item in self_model[:8]:
-        if not isinstance(item, dict):
-            continue
-        kind = item.get("kind") or "associated"
-        concept = item.get("concept") or "?"
-        strength = item.get("strength")
-        strength_txt = f" ({strength:.2f})" if isinstance(strength, (int, float)) else ""
-        lines.append(f"  - {kind}: {concept}{strength_txt}")
+    lines = [
+        f"  - {item.get('kind') or 'associated'}: {item.get('concept') or '?'}{_strength_suffix(item.get('strength'))}"
+        for item in self_model[:8]
+        if isinstance(item, dict)
+    ]
     return "\n".join(lines) if lines else "  (empty)"
 
 
 def _format_relationships(relationships: Any) -> str:
     if not isinstance(relationships, list) or not relationships:
         return "  (none)"
-    lines: list[str] = []
-    for rel in relationships[:8]:
-        if not isinstance(rel, dict):
-            continue
-        entity = rel.get("entity") or "unknown"
-        strength = rel.get("strength")
-        strength_txt = f" ({strength:.2f})" if isinstance(strength, (int, float)) else ""
-        lines.append(f"  - {entity}{strength_txt}")
+    lines = [
+        f"  - {rel.get('entity') or 'unknown'}{_strength_suffix(rel.get('strength'))}"
+        for rel in relationships[:8]
+        if isinstance(rel, dict)
+    ]
     return "\n".join(lines) if lines else "  (none)"
 
 
@@ -266,28 +306,20 @@ def _format_worldview(worldview: list[Any]) -> str:
 def _format_contradictions(contradictions: Any) -> str:
     if not isinstance(contradictions, list) or not contradictions:
         return "  (none)"
-    lines: list[str] = []
-    for c in contradictions[:5]:
-        if not isinstance(c, dict):
-            continue
-        a = c.get("content_a") or ""
-        b = c.get("content_b") or ""
-        if a or b:
-            lines.append(f"  - {a[:60]} <> {b[:60]}")
+    pairs = ((c.get("content_a") or "", c.get("content_b") or "") for c in contradictions[:5] if isinstance(c, dict))
+    lines = [f"  - {a[:60]} <> {b[:60]}" for a, b in pairs if a or b]
     return "\n".join(lines) if lines else "  (none)"
 
 
 def _format_emotional_patterns(patterns: Any) -> str:
     if not isinstance(patterns, list) or not patterns:
         return "  (none)"
-    lines: list[str] = []
-    for p in patterns[:5]:
-        if not isinstance(p, dict):
-            continue
-        pattern = p.get("pattern") or p.get("summary") or "pattern"
-        freq = p.get("frequency")
-        freq_txt = f" (x{freq})" if isinstance(freq, int) else ""
-        lines.append(f"  - {pattern}{freq_txt}")
+    lines = [
+        f"  - {p.get('pattern') or p.get('summary') or 'pattern'}"
+        + (f" (x{p['frequency']})" if isinstance(p.get("frequency"), int) else "")
+        for p in patterns[:5]
+        if isinstance(p, dict)
+    ]
     return "\n".join(lines) if lines else "  (none)"
 
 
@@ -368,3 +400,8 @@ def _format_allowed_actions(actions: Any) -> str:
         return "  (none enabled)"
     lines = [f"  - {action}" for action in actions if isinstance(action, str)]
     return "\n".join(lines) if lines else "  (all actions enabled)"
+
+
+_CACHED_FORMATTERS = {
+    "agent_profile": _format_agent_profile,
+}
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from core.state import apply_heartbeat_decision
+from core.state import HeartbeatDecisionApplier
 from services.external_calls import ExternalCallProcessor
 
 
@@ -26,16 +26,10 @@ async def execute_heartbeat_decision(
     decision: dict[str, Any],
     call_processor: ExternalCallProcessor,
 ) -> dict[str, Any]:
-    start_index = 0
+    rounds = HeartbeatDecisionApplier(conn, heartbeat_id=heartbeat_id, decision=decision)
     outbox_messages: list[Any] = []
+    batch = await rounds.apply(0)
     while True:
-        batch = await apply_heartbeat_decision(
-            conn,
-            heartbeat_id=heartbeat_id,
-            decision=decision,
-            start_index=start_index,
-        )
-
         outbox_messages.extend(_coerce_list(batch.get("outbox_messages")))
 
         if batch.get("terminated") is True:
@@ -43,26 +37,26 @@ async def execute_heartbeat_decision(
 
         pending_call = batch.get("pending_external_call")
         if isinstance(pending_call, dict) and pending_call.get("call_type"):
+            next_index = batch.get("next_index")
+            if not isinstance(next_index, int):
+                next_index = 0
+            next_batch: dict[str, Any] | None = None
             try:
                 call_type = str(pending_call.get("call_type") or "")
                 call_input = pending_call.get("input") or {}
                 if isinstance(call_input, str):
                     call_input = {}
                 external_result = await call_processor.process_call_payload(conn, call_type, call_input)
-                applied = await call_processor.apply_result(conn, pending_call, external_result)
+                # Store the result and run the next round in one round trip.
+                applied, next_batch = await rounds.apply_call_result(pending_call, external_result, next_index)
             except Exception as exc:
                 applied = {"error": str(exc)}
 
-            if isinstance(applied, dict):
-                outbox_messages.extend(_coerce_list(applied.get("outbox_messages")))
-                if _termination_applied(applied):
-                    return {"terminated": True, "halt_reason": "terminated", "outbox_messages": outbox_messages}
+            outbox_messages.extend(_coerce_list(applied.get("outbox_messages")))
+            if _termination_applied(applied):
+                return {"terminated": True, "halt_reason": "terminated", "outbox_messages": outbox_messages}
 
-            next_index = batch.get("next_index")
-            if isinstance(next_index, int):
-                start_index = next_index
-            else:
-                start_index = 0
+            batch = next_batch if next_batch is not None else await rounds.apply(next_index)
             continue
 
         if batch.get("completed") is True:
@@ -30,12 +30,14 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "--break-system-packages", "-q"])
     import requests
 
+from core import fast_json
 from core.cognitive_memory_api import (
     CognitiveMemorySync,
     MemoryInput as ApiMemoryInput,
     MemoryType as ApiMemoryType,
     RelationshipType,
 )
+from core.llm_json import extract_json_object
 
 # =========================================================================
 # CONFIGURATION
@@ -195,12 +197,20 @@ def _should_cancel(config: Config) -> bool:
     return False
 
 
+# Patterns used per document/chunk, compiled once.
+_WORD_RE = re.compile(r"\b\w+\b")
+_MARKDOWN_HEADER_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_XML_TAG_RE = re.compile(r"<(\w+)[>\s]")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+_TITLE_MARKER_RE = re.compile(r"\[Title: (.+?)\]")
+
+
 def _hash_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 def _word_count(text: str) -> int:
-    return len(re.findall(r"\b\w+\b", text))
+    return len(_WORD_RE.findall(text))
 
 
 def _normalize_mode(mode: IngestionMode | str | None) -> IngestionMode:
@@ -252,7 +262,7 @@ def _infer_source_type(file_path: Path) -> str:
 
 def _extract_title(content: str, file_path: Path) -> str:
     # Try markdown header
-    header_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+    header_match = _MARKDOWN_HEADER_RE.search(content)
     if header_match:
         return header_match.group(1).strip()
     # Try first non-empty line
@@ -473,13 +483,11 @@ class DataReader(DocumentReader):
     @classmethod
     def _describe_xml_structure(cls, content: str) -> str:
         """Describe XML structure (basic)."""
-        import re
-
-        root_match = re.search(r"<(\w+)[>\s]", content)
+        root_match = _XML_TAG_RE.search(content)
         root_tag = root_match.group(1) if root_match else "unknown"
 
         tag_counts: dict[str, int] = {}
-        for tag in re.findall(r"<(\w+)[>\s]", content):
+        for tag in _XML_TAG_RE.findall(content):
             tag_counts[tag] = tag_counts.get(tag, 0) + 1
 
         top_tags = sorted(tag_counts.items(), key=lambda x: -x[1])[:10]
@@ -702,7 +710,7 @@ class Sectioner:
             if current:
                 chunks.append(current.strip())
             if len(para) > self.max_chars:
-                sentences = re.split(r"(?<=[.!?])\s+", para)
+                sentences = _SENTENCE_END_RE.split(para)
                 current = ""
                 for sentence in sentences:
                     if len(current) + len(sentence) <= self.max_chars:
@@ -758,21 +766,7 @@ class LLMClient:
         return resp.json()["choices"][0]["message"]["content"]
 
     def complete_json(self, messages: list[dict[str, str]], temperature: float = 0.2) -> dict[str, Any]:
-        text = self.complete(messages, temperature=temperature)
-        json_text = text.strip()
-        match = re.search(r"```(?:json)?\s*(.*?)\s*```", json_text, re.DOTALL)
-        if match:
-            json_text = match.group(1).strip()
-        # Try to find object
-        if not json_text.startswith("{"):
-            start = json_text.find("{")
-            if start != -1:
-                json_text = json_text[start:]
-        try:
-            data = json.loads(json_text)
-        except Exception:
-            return {}
-        return data if isinstance(data, dict) else {}
+        return extract_json_object(self.complete(messages, temperature=temperature))
 
 
 # =========================================================================
@@ -795,7 +789,7 @@ class Appraiser:
             "CONTENT SAMPLE:\n"
             f"{content}\n\n"
             "CONTEXT (JSON):\n"
-            f"{json.dumps(context)[:8000]}\n\n"
+            f"{fast_json.dumps_truncated(context, 8000, default=str)}\n\n"
             "Return JSON with keys:"
             " valence (-1..1), arousal (0..1), primary_emotion (string), intensity (0..1),"
             " goal_relevance (array of {goal, strength}), worldview_tension (0..1), curiosity (0..1),"
@@ -924,7 +918,7 @@ class MemoryStore:
             async with self.client._async._pool.acquire() as conn:
                 return await conn.execute(sql, *params)
 
-        return self.client._loop.run_until_complete(_run())
+        return self.client._run(_run())
 
     def _fetchval(self, sql: str, *params: Any) -> Any:
         assert self.client is not None
@@ -932,7 +926,7 @@ class MemoryStore:
             async with self.client._async._pool.acquire() as conn:
                 return await conn.fetchval(sql, *params)
 
-        return self.client._loop.run_until_complete(_run())
+        return self.client._run(_run())
 
     def has_receipt(self, content_hash: str) -> bool:
         if self.client is None:
@@ -1007,9 +1001,7 @@ class MemoryStore:
         if self.client is None:
             self.connect()
         assert self.client is not None
-        self.client._loop.run_until_complete(
-            self.client._async.add_source(UUID(memory_id), source)
-        )
+        self.client._run(self.client._async.add_source(UUID(memory_id), source))
 
     def boost_confidence(self, memory_id: str, boost: float = 0.05) -> None:
         """Boost confidence of a memory when it's corroborated by a new source."""
@@ -1378,8 +1370,7 @@ class IngestionPipeline:
 
         # Extract title from content header if not provided
         if not title:
-            import re
-            title_match = re.search(r"\[Title: (.+?)\]", content)
+            title_match = _TITLE_MARKER_RE.search(content)
             if title_match:
                 title = title_match.group(1)
             else:
@@ -2,21 +2,112 @@ from __future__ import annotations
 
 import asyncio
 import os
-import queue
 import threading
+import time
 from pathlib import Path
 from typing import Any, AsyncIterator
 from uuid import uuid4
 
 from services.ingest import Config, IngestionPipeline
+from core.agent_api import db_env
 from core.llm import normalize_llm_config
 
-_INGESTION_CANCEL: dict[str, threading.Event] = {}
+# Sessions are created before the stream starts and may never be streamed (or the
+# stream may never be iterated), so cancel events expire instead of living forever.
+INGEST_SESSION_TTL_SECONDS = float(os.getenv("INGEST_SESSION_TTL_SECONDS", "3600"))
+INGEST_SESSION_MAX = 256
+
+
+class _CancelRegistry:
+    """session_id -> cancel Event.
+
+    Sessions that have not started streaming expire after `ttl` and are bounded by
+    `max_size` (oldest first). `activate` pins a session for the life of its stream, so
+    a long ingestion stays cancellable; `pop` releases it.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[str, tuple[float, threading.Event]] = {}
+        self._active: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        # Insertion order is creation order, so the front holds the oldest sessions.
+        while len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+
+    def add(self, session_id: str, event: threading.Event | None = None) -> threading.Event:
+        now = time.monotonic()
+        event = event or threading.Event()
+        with self._lock:
+            self._entries.pop(session_id, None)
+            self._evict(now)
+            self._entries[session_id] = (now + self.ttl, event)
+        return event
+
+    def activate(self, session_id: str) -> threading.Event:
+        """Pin `session_id` (creating it if needed) until `pop`; it no longer expires."""
+        with self._lock:
+            event = self._active.get(session_id)
+            if event is None:
+                entry = self._entries.pop(session_id, None)
+                event = entry[1] if entry is not None and entry[0] > time.monotonic() else threading.Event()
+                self._active[session_id] = event
+        return event
+
+    def get(self, session_id: str) -> threading.Event | None:
+        with self._lock:
+            event = self._active.get(session_id)
+            if event is not None:
+                return event
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[session_id]
+                return None
+            return entry[1]
+
+    def pop(self, session_id: str, default: threading.Event | None = None) -> threading.Event | None:
+        with self._lock:
+            event = self._active.pop(session_id, None)
+            entry = self._entries.pop(session_id, None)
+        if event is not None:
+            return event
+        return entry[1] if entry is not None else default
+
+    def __contains__(self, session_id: object) -> bool:
+        return isinstance(session_id, str) and self.get(session_id) is not None
+
+    def __getitem__(self, session_id: str) -> threading.Event:
+        event = self.get(session_id)
+        if event is None:
+            raise KeyError(session_id)
+        return event
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._active)
+
+
+_INGESTION_CANCEL = _CancelRegistry(INGEST_SESSION_TTL_SECONDS, INGEST_SESSION_MAX)
+
+# Log lines buffered between the ingestion thread and the consumer. When full, the
+# thread waits for the consumer (or drops lines with INGEST_LOG_DROP_WHEN_FULL=1).
+INGEST_LOG_QUEUE_SIZE = int(os.getenv("INGEST_LOG_QUEUE_SIZE", "1024"))
+INGEST_LOG_DROP_WHEN_FULL = os.getenv("INGEST_LOG_DROP_WHEN_FULL", "").strip().lower() in {"1", "true", "yes"}
+# Lines that are already waiting are sent as one event, up to these limits.
+INGEST_LOG_BATCH_LINES = 64
+INGEST_LOG_BATCH_CHARS = 16 * 1024
 
 
 def create_ingestion_session() -> str:
     session_id = str(uuid4())
-    _INGESTION_CANCEL[session_id] = threading.Event()
+    _INGESTION_CANCEL.add(session_id)
     return session_id
 
 
@@ -38,19 +129,38 @@ async def stream_ingestion(
     base_trust: float | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
     normalized = normalize_llm_config(llm_config)
-    cancel_event = _INGESTION_CANCEL.get(session_id) or threading.Event()
-    _INGESTION_CANCEL[session_id] = cancel_event
-    log_queue: queue.Queue[str | None] = queue.Queue()
+    # Pinned for the life of the stream so it can't expire or be evicted; `finally` below
+    # releases it.
+    cancel_event = _INGESTION_CANCEL.activate(session_id)
+    # The pipeline runs in a thread; lines are handed to the loop directly instead of
+    # parking an executor thread on a blocking queue.get() per line.
+    loop = asyncio.get_running_loop()
+    log_queue: asyncio.Queue[str | None] = asyncio.Queue()
+    # Free slots in log_queue; the thread takes one per line, the consumer returns it.
+    slots = threading.Semaphore(INGEST_LOG_QUEUE_SIZE)
+    consumer_gone = threading.Event()
+
+    def _put(message: str | None) -> None:
+        try:
+            loop.call_soon_threadsafe(log_queue.put_nowait, message)
+        except RuntimeError:
+            # The loop closed under us (consumer gone); nothing is listening anymore.
+            consumer_gone.set()
 
     def log(message: str) -> None:
-        log_queue.put(message)
+        if consumer_gone.is_set():
+            return
+        if INGEST_LOG_DROP_WHEN_FULL:
+            if not slots.acquire(blocking=False):
+                return
+        else:
+            while not slots.acquire(timeout=0.5):
+                if consumer_gone.is_set():
+                    return
+        _put(message)
 
     def run() -> None:
-        db_host = os.getenv("POSTGRES_HOST", "localhost")
-        db_port = int(os.getenv("POSTGRES_PORT", "43815"))
-        db_name = os.getenv("POSTGRES_DB", "hexis_memory")
-        db_user = os.getenv("POSTGRES_USER", "hexis_user")
-        db_password = os.getenv("POSTGRES_PASSWORD", "hexis_password")
+        db_host, db_port, db_name, db_user, db_password = db_env()
 
         endpoint = normalized["endpoint"]
         if not endpoint and normalized["provider"] == "openai":
@@ -87,17 +197,33 @@ async def stream_ingestion(
             log(f"Error: {exc}")
         finally:
             pipeline.close()
-            log_queue.put(None)
+            _put(None)
 
     thread = threading.Thread(target=run, daemon=True)
     thread.start()
 
-    loop = asyncio.get_running_loop()
+    done = False
     try:
-        while True:
-            line = await loop.run_in_executor(None, log_queue.get)
+        while not done:
+            line = await log_queue.get()
             if line is None:
                 break
-            yield {"type": "log", "text": line}
+            # Coalesce a burst of lines that are already waiting into one event.
+            batch = [line]
+            size = len(line)
+            while len(batch) < INGEST_LOG_BATCH_LINES and size < INGEST_LOG_BATCH_CHARS:
+                try:
+                    line = log_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if line is None:
+                    done = True
+                    break
+                batch.append(line)
+                size += len(line)
+            for _ in batch:
+                slots.release()
+            yield {"type": "log", "text": "\n".join(batch)}
     finally:
+        consumer_gone.set()
         _INGESTION_CANCEL.pop(session_id, None)
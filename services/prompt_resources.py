@@ -122,6 +122,7 @@ def load_subconscious_prompt() -> str:
 PromptKind = Literal["heartbeat", "reflect", "conversation"]
 
 
+@lru_cache(maxsize=8)
 def compose_personhood_prompt(kind: PromptKind) -> str:
     """
     Returns a composed personhood prompt addendum for a given context.
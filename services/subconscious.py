@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from core import fast_json
 from core.llm_config import load_llm_config
 from core.llm_json import chat_json
 from core.subconscious import apply_subconscious_observations, get_subconscious_context
@@ -34,7 +34,7 @@ def _normalize_observations(doc: dict[str, Any]) -> dict[str, list[dict[str, Any
 def _coerce_json(val: Any) -> Any:
     if isinstance(val, str):
         try:
-            return json.loads(val)
+            return fast_json.loads(val)
         except Exception:
             return val
     return val
@@ -49,7 +49,7 @@ async def _build_context(conn) -> dict[str, Any]:
 async def run_subconscious_decider(conn) -> dict[str, Any]:
     llm_config = await load_llm_config(conn, "llm.subconscious", fallback_key="llm.heartbeat")
     context = await _build_context(conn)
-    user_prompt = f"Context (JSON):\n{json.dumps(context)[:12000]}"
+    user_prompt = f"Context (JSON):\n{fast_json.dumps_truncated(context, 12000)}"
     try:
         doc, raw = await chat_json(
             llm_config=llm_config,
@@ -69,4 +69,5 @@ async def run_subconscious_decider(conn) -> dict[str, Any]:
 
     observations = _normalize_observations(doc)
     applied = await apply_subconscious_observations(conn, observations)
-    return {"applied": applied, "raw_response": raw}
+    # Only the size of the reply is reported: the result is logged on every run.
+    return {"applied": applied, "raw_length": len(raw)}
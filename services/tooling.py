@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
-from core.cognitive_memory_api import CognitiveMemory, GoalPriority, GoalSource, MemoryType
+from core.cognitive_memory_api import CognitiveMemory, GoalPriority, GoalSource, MemoryType, RecallResult
 from core.memory_tools import MEMORY_TOOLS
 
 
+@lru_cache(maxsize=32)
+def _filtered_tool_definitions(allowed: frozenset[str]) -> tuple[dict[str, Any], ...]:
+    return tuple(tool for tool in MEMORY_TOOLS if tool.get("function", {}).get("name") in allowed)
+
+
 def get_tool_definitions(allowed: list[str] | None = None) -> list[dict[str, Any]]:
     if allowed is None:
         return MEMORY_TOOLS
-    allowed_set = {name for name in allowed if isinstance(name, str)}
-    return [
-        tool
-        for tool in MEMORY_TOOLS
-        if tool.get("function", {}).get("name") in allowed_set
-    ]
+    # Agent profiles reuse a handful of allow-lists; filter each one once.
+    allowed_set = frozenset(name for name in allowed if isinstance(name, str))
+    return list(_filtered_tool_definitions(allowed_set))
 
 
 async def execute_tool(
@@ -25,21 +30,7 @@ async def execute_tool(
     *,
     mem_client: CognitiveMemory,
 ) -> dict[str, Any]:
-    handlers = {
-        "recall": _handle_recall,
-        "sense_memory_availability": _handle_sense_memory_availability,
-        "request_background_search": _handle_request_background_search,
-        "recall_recent": _handle_recall_recent,
-        "recall_episode": _handle_recall_episode,
-        "explore_concept": _handle_explore_concept,
-        "explore_cluster": _handle_explore_cluster,
-        "get_procedures": _handle_get_procedures,
-        "get_strategies": _handle_get_strategies,
-        "list_recent_episodes": _handle_list_recent_episodes,
-        "create_goal": _handle_create_goal,
-        "queue_user_message": _handle_queue_user_message,
-    }
-    handler = handlers.get(tool_name)
+    handler = _TOOL_HANDLERS.get(tool_name)
     if not handler:
         return {"error": f"Unknown tool: {tool_name}"}
     try:
@@ -48,6 +39,193 @@ async def execute_tool(
         return {"error": str(exc)}
 
 
+class ToolBatcher:
+    """Per-turn stand-in for a CognitiveMemory that coalesces concurrent DB calls.
+
+    `recall` calls (without partial activations) that share filters, and all
+    `touch_memories` calls, made in the same event-loop tick are sent as one query.
+    Every other attribute is the wrapped client's.
+    """
+
+    def __init__(self, mem_client: CognitiveMemory):
+        self._client = mem_client
+        self._recalls: dict[tuple[Any, ...], list[tuple[str, asyncio.Future[RecallResult]]]] = {}
+        self._touch_ids: list[UUID] = []
+        self._touch_waiters: list[asyncio.Future[int]] = []
+        self._flush_pending = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def recall(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        memory_types: list[MemoryType] | None = None,
+        min_importance: float = 0.0,
+        include_partial: bool = True,
+        touch: bool = False,
+    ) -> RecallResult:
+        if include_partial:
+            return await self._client.recall(
+                query,
+                limit=limit,
+                memory_types=memory_types,
+                min_importance=min_importance,
+                include_partial=True,
+                touch=touch,
+            )
+        key = (limit, tuple(memory_types) if memory_types else None, min_importance, touch)
+        future: asyncio.Future[RecallResult] = asyncio.get_running_loop().create_future()
+        self._recalls.setdefault(key, []).append((query, future))
+        self._schedule_flush()
+        return await future
+
+    async def touch_memories(self, memory_ids: Any) -> int:
+        """Queue ids for the batched touch; returns the count for the whole batch."""
+        ids = list(memory_ids)
+        if not ids:
+            return 0
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._touch_ids.extend(ids)
+        self._touch_waiters.append(future)
+        self._schedule_flush()
+        return await future
+
+    def _schedule_flush(self) -> None:
+        # call_soon runs after the tasks already scheduled for this tick, so calls
+        # from tools started together land in the same batch.
+        if not self._flush_pending:
+            self._flush_pending = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_pending = False
+        recalls, self._recalls = self._recalls, {}
+        for key, items in recalls.items():
+            self._spawn(self._flush_recalls(key, items))
+        if self._touch_waiters:
+            ids, self._touch_ids = self._touch_ids, []
+            waiters, self._touch_waiters = self._touch_waiters, []
+            self._spawn(self._flush_touch(ids, waiters))
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_recalls(
+        self,
+        key: tuple[Any, ...],
+        items: list[tuple[str, asyncio.Future[RecallResult]]],
+    ) -> None:
+        limit, memory_types, min_importance, touch = key
+        try:
+            if len(items) == 1:
+                results = [
+                    await self._client.recall(
+                        items[0][0],
+                        limit=limit,
+                        memory_types=list(memory_types) if memory_types else None,
+                        min_importance=min_importance,
+                        include_partial=False,
+                        touch=touch,
+                    )
+                ]
+            else:
+                results = await self._client.recall_many(
+                    [query for query, _ in items],
+                    limit=limit,
+                    memory_types=list(memory_types) if memory_types else None,
+                    min_importance=min_importance,
+                    touch=touch,
+                )
+        except Exception as exc:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _flush_touch(self, ids: list[UUID], waiters: list[asyncio.Future[int]]) -> None:
+        # touch_memories counts an id once per call, so ids queued by several tools go
+        # out in as many rounds as the most repeated one needs.
+        counts = Counter(ids)
+        touched = 0
+        try:
+            while counts:
+                touched += await self._client.touch_memories(list(counts))
+                counts = Counter({memory_id: n - 1 for memory_id, n in counts.items() if n > 1})
+        except Exception as exc:
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future in waiters:
+            if not future.done():
+                future.set_result(touched)
+
+
+# Tools that only read memories (and record the access). Runs of these are executed
+# concurrently; every other tool runs on its own, in call order.
+_BATCHABLE_TOOLS = frozenset(
+    {
+        "recall",
+        "sense_memory_availability",
+        "recall_recent",
+        "recall_episode",
+        "explore_concept",
+        "explore_cluster",
+        "get_procedures",
+        "get_strategies",
+        "list_recent_episodes",
+    }
+)
+
+
+async def execute_tools(
+    calls: list[dict[str, Any]],
+    *,
+    mem_client: CognitiveMemory,
+) -> list[dict[str, Any]]:
+    """Run one turn's tool calls, batching the recalls and touches of read-only tools.
+
+    Consecutive read-only calls run concurrently; a tool with side effects waits for
+    the calls before it and runs alone. Results are returned in call order.
+    """
+    results: list[dict[str, Any]] = []
+    batcher = ToolBatcher(mem_client)
+    run: list[dict[str, Any]] = []
+
+    async def flush_run() -> None:
+        if len(run) == 1:
+            call = run[0]
+            results.append(await execute_tool(call.get("name", ""), call.get("arguments", {}), mem_client=mem_client))
+        elif run:
+            results.extend(
+                await asyncio.gather(
+                    *(
+                        execute_tool(call.get("name", ""), call.get("arguments", {}), mem_client=batcher)  # type: ignore[arg-type]
+                        for call in run
+                    )
+                )
+            )
+        run.clear()
+
+    for call in calls:
+        if call.get("name") in _BATCHABLE_TOOLS:
+            run.append(call)
+            continue
+        await flush_run()
+        results.append(await execute_tool(call.get("name", ""), call.get("arguments", {}), mem_client=mem_client))
+    await flush_run()
+    return results
+
+
 async def _handle_recall(args: dict[str, Any], mem_client: CognitiveMemory) -> dict[str, Any]:
     query = str(args.get("query", "")).strip()
     limit = min(int(args.get("limit", 5)), 20)
@@ -64,9 +242,8 @@ async def _handle_recall(args: dict[str, Any], mem_client: CognitiveMemory) -> d
         memory_types=parsed_types,
         min_importance=min_importance,
         include_partial=False,
+        touch=True,
     )
-    if result.memories:
-        await mem_client.touch_memories([m.id for m in result.memories])
     memories = [
         {
             "memory_id": str(m.id),
@@ -263,3 +440,20 @@ async def _handle_queue_user_message(args: dict[str, Any], mem_client: Cognitive
     context = args.get("context")
     outbox_message = await mem_client.queue_user_message(message, intent=intent, context=context)
     return {"outbox_message": outbox_message, "queued": True}
+
+
+# Tool name -> handler, built once at import rather than on every tool call.
+_TOOL_HANDLERS = {
+    "recall": _handle_recall,
+    "sense_memory_availability": _handle_sense_memory_availability,
+    "request_background_search": _handle_request_background_search,
+    "recall_recent": _handle_recall_recent,
+    "recall_episode": _handle_recall_episode,
+    "explore_concept": _handle_explore_concept,
+    "explore_cluster": _handle_explore_cluster,
+    "get_procedures": _handle_get_procedures,
+    "get_strategies": _handle_get_strategies,
+    "list_recent_episodes": _handle_list_recent_episodes,
+    "create_goal": _handle_create_goal,
+    "queue_user_message": _handle_queue_user_message,
+}
@@ -2,21 +2,22 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import logging
 import os
 import smtplib
 import ssl
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Any, Callable
 
 import asyncpg
 from dotenv import load_dotenv
 
+from core import fast_json
 from core.agent_api import db_dsn_from_env
 from core.rabbitmq_bridge import RabbitMQBridge
 from core.state import (
-    is_agent_terminated,
     mark_subconscious_decider_run,
     run_heartbeat,
     run_maintenance_if_due,
@@ -36,7 +37,133 @@ logging.basicConfig(
 logger = logging.getLogger("heartbeat_worker")
 
 POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", 1.0))
+# While the agent is not ready, workers wait this long between checks unless a
+# NOTIFY on WAKE_CHANNEL (config, pause, init-stage or heartbeat-time change) wakes them sooner.
+IDLE_POLL_INTERVAL = float(os.getenv("WORKER_IDLE_POLL_INTERVAL", 30.0))
+# Between heartbeats the worker sleeps until the next one is due (wakes also arrive via
+# NOTIFY), but never longer than this, so clock-driven changes are still picked up.
+HEARTBEAT_MAX_WAIT = float(os.getenv("WORKER_HEARTBEAT_MAX_WAIT", 60.0))
+# Maintenance and the subconscious check are skipped until they are next due (wakes
+# also arrive via NOTIFY), but re-checked at least this often.
+MAINTENANCE_MAX_WAIT = float(os.getenv("WORKER_MAINTENANCE_MAX_WAIT", 60.0))
+WAKE_CHANNEL = "hexis_worker_wake"
+# A dropped LISTEN connection is reopened from the run loop, at most this often.
+WAKE_LISTENER_RETRY_INTERVAL = float(os.getenv("WORKER_WAKE_LISTENER_RETRY_INTERVAL", 30.0))
 MAX_RETRIES = int(os.getenv("WORKER_MAX_RETRIES", 3))
+# asyncpg prepares each distinct query once per connection and reuses the plan from this
+# cache. Set to 0 when PgBouncer runs in transaction mode in front of Postgres.
+STATEMENT_CACHE_SIZE = int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", 1024))
+# Upper bound on concurrent DB work per heartbeat worker (call processing, outbox, tools).
+WORKER_CONCURRENCY = max(1, int(os.getenv("WORKER_CONCURRENCY", 4)))
+
+
+# jsonb binary wire format: a version byte followed by the JSON text.
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    # Text is assumed to be serialized JSON already (the `fast_json.dumps(x)` + `$n::jsonb`
+    # convention used throughout), so only Python objects are encoded here.
+    if isinstance(value, str):
+        return _JSONB_VERSION + value.encode("utf-8")
+    return _JSONB_VERSION + fast_json.dumpb(value, default=str)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return fast_json.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Encode and decode jsonb once in the driver, over the binary protocol."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+# Shared pool options: recycle idle and long-lived connections so server-side memory
+# from cached plans does not grow without bound.
+POOL_OPTIONS: dict[str, Any] = {
+    "init": _init_connection,
+    "statement_cache_size": STATEMENT_CACHE_SIZE,
+    "max_inactive_connection_lifetime": 300,
+    "max_queries": 50_000,
+    "command_timeout": 60,
+}
+
+
+async def _open_wake_listener(dsn: str, on_wake: Callable[[str], None]) -> asyncpg.Connection | None:
+    """Dedicated LISTEN connection; without it workers fall back to plain polling.
+
+    `on_wake` receives the notification payload (the table that changed).
+    """
+    try:
+        conn = await asyncpg.connect(dsn)
+        await conn.add_listener(WAKE_CHANNEL, lambda _conn, _pid, _channel, payload: on_wake(payload))
+    except Exception as exc:
+        logger.warning(f"LISTEN {WAKE_CHANNEL} unavailable, polling instead: {exc}")
+        return None
+    return conn
+
+
+async def _close_wake_listener(conn: asyncpg.Connection | None) -> None:
+    if conn is None:
+        return
+    try:
+        await conn.close()
+    except Exception:
+        pass
+
+
+def _listener_alive(conn: asyncpg.Connection | None) -> bool:
+    return conn is not None and not conn.is_closed()
+
+
+def _is_decision_call(call: dict[str, Any]) -> bool:
+    """True for the `think` call that yields the heartbeat decision (the default kind)."""
+    if str(call.get("call_type") or "") != "think":
+        return False
+    call_input = call.get("input")
+    kind = call_input.get("kind") if isinstance(call_input, dict) else None
+    return (str(kind or "").strip() or "heartbeat_decision") == "heartbeat_decision"
+
+
+# Termination and readiness gate every loop iteration; one row answers both.
+_AGENT_GATE_SQL = "SELECT is_agent_terminated(), is_agent_configured() AND is_init_complete()"
+
+
+async def _read_agent_gate(pool: asyncpg.Pool | None) -> tuple[bool, bool] | None:
+    """Return (terminated, ready), or None when the database could not be asked."""
+    if not pool:
+        return None
+    try:
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(_AGENT_GATE_SQL)
+    except Exception:
+        return None
+    return bool(row[0]), bool(row[1])
+
+
+async def _wait_for_wake(wake: asyncio.Event, timeout: float) -> None:
+    try:
+        await asyncio.wait_for(wake.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    wake.clear()
+
+
+def _pool_stats(pool: asyncpg.Pool | None) -> dict[str, int]:
+    if pool is None:
+        return {"size": 0, "idle": 0, "min_size": 0, "max_size": 0}
+    return {
+        "size": pool.get_size(),
+        "idle": pool.get_idle_size(),
+        "min_size": pool.get_min_size(),
+        "max_size": pool.get_max_size(),
+    }
 
 
 class HeartbeatWorker:
@@ -47,13 +174,26 @@ class HeartbeatWorker:
         self.pool: asyncpg.Pool | None = None
         self.running = False
         self.bridge: RabbitMQBridge | None = None
+        self._wake = asyncio.Event()
+        self._listener: asyncpg.Connection | None = None
+        self._listener_retry_at = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._gate: tuple[bool, bool] | None = None
+        self._wake_count = 0
+        self._call_slots = asyncio.Semaphore(WORKER_CONCURRENCY)
         self.call_processor = ExternalCallProcessor(max_retries=MAX_RETRIES)
         self._tool_registry = None
         self._mcp_manager = None
 
     async def connect(self) -> None:
-        self.pool = await asyncpg.create_pool(dsn=db_dsn_from_env(self.instance), min_size=2, max_size=10)
+        self.pool = await asyncpg.create_pool(
+            dsn=db_dsn_from_env(self.instance),
+            min_size=WORKER_CONCURRENCY,
+            max_size=WORKER_CONCURRENCY * 2 + 4,
+            **POOL_OPTIONS,
+        )
         logger.info("Connected to database")
+        self._listener = await _open_wake_listener(db_dsn_from_env(self.instance), self._on_wake)
         self.bridge = RabbitMQBridge(self.pool)
         await self.bridge.ensure_ready()
 
@@ -75,6 +215,11 @@ class HeartbeatWorker:
             logger.warning(f"Failed to initialize tool registry: {e}")
 
     async def disconnect(self) -> None:
+        await _close_wake_listener(self._listener)
+        self._listener = None
+        if self.bridge:
+            await self.bridge.close()
+
         # Shutdown MCP servers
         if self._mcp_manager:
             try:
@@ -87,67 +232,93 @@ class HeartbeatWorker:
             await self.pool.close()
             logger.info("Disconnected from database")
 
+    def get_stats(self) -> dict[str, int]:
+        return _pool_stats(self.pool)
+
+    def _on_wake(self, payload: str) -> None:
+        if payload == "config":
+            self.call_processor.invalidate_llm_config()
+        # Both config and init-stage changes can flip the gate.
+        self._gate = None
+        self._wake_count += 1
+        self._wake.set()
+
     async def _publish_outbox(self, messages: list[dict]) -> None:
         if not messages:
             return
         if self.bridge:
             await self.bridge.publish_outbox_payloads(messages)
-        # Send email for user messages
-        for msg in messages:
-            if msg.get("kind") == "user":
-                await self._send_user_email(msg)
+        user_messages = [msg for msg in messages if msg.get("kind") == "user"]
+        if user_messages:
+            await self._send_user_emails(user_messages)
 
-    async def _send_user_email(self, msg: dict) -> None:
+    async def _send_user_emails(self, messages: list[dict]) -> None:
         """Send email to user for reach_out_user messages."""
         if not self.pool:
             return
         try:
+            # One round-trip for both config keys, shared by every message in the batch.
             async with self.pool.acquire() as conn:
-                # Get email config from tools.api_keys.email_send
-                tools_config = await conn.fetchval("SELECT value FROM config WHERE key = 'tools'")
-                if not tools_config:
-                    logger.warning("No tools config found, cannot send email")
-                    return
-                tools = json.loads(tools_config) if isinstance(tools_config, str) else tools_config
-                email_cfg = tools.get("api_keys", {}).get("email_send", {})
-
-                # Get user contact destination
-                user_contact = await conn.fetchval("SELECT value FROM config WHERE key = 'user.contact'")
-                if not user_contact:
-                    logger.warning("No user.contact config found")
-                    return
-                contact = json.loads(user_contact) if isinstance(user_contact, str) else user_contact
-                to_email = contact.get("destinations", {}).get("email")
-
-                if not to_email or not email_cfg.get("smtp_host"):
-                    logger.warning("Email not configured properly")
-                    return
+                rows = await conn.fetch(
+                    "SELECT key, value FROM config WHERE key = ANY($1::text[])",
+                    ["tools", "user.contact"],
+                )
+        except Exception as e:
+            logger.error(f"Failed to send user email: {e}")
+            return
+        cfg = {r["key"]: r["value"] for r in rows}
 
-                # Extract message content
-                payload = msg.get("payload", {})
-                message_text = payload.get("message", "")
-                intent = payload.get("intent", "")
+        # Get email config from tools.api_keys.email_send
+        tools_config = cfg.get("tools")
+        if not tools_config:
+            logger.warning("No tools config found, cannot send email")
+            return
+        tools = fast_json.loads(tools_config) if isinstance(tools_config, str) else tools_config
+        email_cfg = tools.get("api_keys", {}).get("email_send", {})
 
-                # Build email
-                subject = f"Vesper heartbeat: {intent}" if intent else "Message from Vesper"
-                body = f"{message_text}\n\n— Vesper (autonomous heartbeat)"
+        # Get user contact destination
+        user_contact = cfg.get("user.contact")
+        if not user_contact:
+            logger.warning("No user.contact config found")
+            return
+        contact = fast_json.loads(user_contact) if isinstance(user_contact, str) else user_contact
+        to_email = contact.get("destinations", {}).get("email")
 
-                email_msg = MIMEMultipart()
-                email_msg["Subject"] = subject
-                email_msg["From"] = f"{email_cfg.get('from_name', 'Vesper')} <{email_cfg['from_email']}>"
-                email_msg["To"] = to_email
-                email_msg.attach(MIMEText(body, "plain", "utf-8"))
+        if not to_email or not email_cfg.get("smtp_host"):
+            logger.warning("Email not configured properly")
+            return
 
-                # Send
-                ssl_context = ssl.create_default_context()
-                def _send():
-                    with smtplib.SMTP(email_cfg["smtp_host"], email_cfg.get("smtp_port", 587)) as server:
-                        server.starttls(context=ssl_context)
-                        server.login(email_cfg["smtp_user"], email_cfg["smtp_password"])
-                        server.sendmail(email_cfg["from_email"], [to_email], email_msg.as_string())
+        await asyncio.gather(
+            *(self._send_user_email(msg, email_cfg=email_cfg, to_email=to_email) for msg in messages)
+        )
 
-                await asyncio.to_thread(_send)
-                logger.info(f"Email sent to user: {subject}")
+    async def _send_user_email(self, msg: dict, *, email_cfg: dict, to_email: str) -> None:
+        try:
+            # Extract message content
+            payload = msg.get("payload", {})
+            message_text = payload.get("message", "")
+            intent = payload.get("intent", "")
+
+            # Build email
+            subject = f"Vesper heartbeat: {intent}" if intent else "Message from Vesper"
+            body = f"{message_text}\n\n— Vesper (autonomous heartbeat)"
+
+            email_msg = MIMEMultipart()
+            email_msg["Subject"] = subject
+            email_msg["From"] = f"{email_cfg.get('from_name', 'Vesper')} <{email_cfg['from_email']}>"
+            email_msg["To"] = to_email
+            email_msg.attach(MIMEText(body, "plain", "utf-8"))
+
+            # Send
+            ssl_context = ssl.create_default_context()
+            def _send():
+                with smtplib.SMTP(email_cfg["smtp_host"], email_cfg.get("smtp_port", 587)) as server:
+                    server.starttls(context=ssl_context)
+                    server.login(email_cfg["smtp_user"], email_cfg["smtp_password"])
+                    server.sendmail(email_cfg["from_email"], [to_email], email_msg.as_string())
+
+            await asyncio.to_thread(_send)
+            logger.info(f"Email sent to user: {subject}")
 
         except Exception as e:
             logger.error(f"Failed to send user email: {e}")
@@ -155,32 +326,37 @@ class HeartbeatWorker:
     async def _run_heartbeat_if_due(self) -> None:
         if not self.pool:
             return
-        async with self.pool.acquire() as conn:
-            payload = await run_heartbeat(conn)
-            if not payload:
-                return
-            heartbeat_id = payload.get("heartbeat_id")
-            if heartbeat_id:
-                logger.info(f"Heartbeat started: {heartbeat_id}")
+        # Each query borrows a pooled connection only for itself, so no connection is
+        # pinned while LLM calls and tools run.
+        payload = await run_heartbeat(self.pool)
+        if not payload:
+            return
+        heartbeat_id = payload.get("heartbeat_id")
+        if heartbeat_id:
+            logger.info(f"Heartbeat started: {heartbeat_id}")
 
-            outbox_messages = payload.get("outbox_messages")
-            if isinstance(outbox_messages, list):
-                await self._publish_outbox(outbox_messages)
+        outbox_messages = payload.get("outbox_messages")
+        if isinstance(outbox_messages, list):
+            await self._publish_outbox(outbox_messages)
 
-            external_calls = payload.get("external_calls")
-            if not isinstance(external_calls, list):
-                return
+        external_calls = payload.get("external_calls")
+        if not isinstance(external_calls, list):
+            return
 
-            for call in external_calls:
-                if not isinstance(call, dict):
+        pending = [call for call in external_calls if isinstance(call, dict)]
+        while pending:
+            # The heartbeat ends at its decision, so calls after one are only started
+            # if it did not produce a decision (e.g. it failed).
+            cut = next((i + 1 for i, call in enumerate(pending) if _is_decision_call(call)), len(pending))
+            calls, pending = pending[:cut], pending[cut:]
+            # The provider round-trips overlap; results are still applied in order.
+            results = await asyncio.gather(*(self._process_call(call) for call in calls), return_exceptions=True)
+            for call, result in zip(calls, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error processing external call: {result}")
                     continue
-                call_type = str(call.get("call_type") or "")
-                call_input = call.get("input") or {}
-                if not isinstance(call_input, dict):
-                    call_input = {}
                 try:
-                    result = await self.call_processor.process_call_payload(conn, call_type, call_input)
-                    applied = await self.call_processor.apply_result(conn, call, result)
+                    applied = await self.call_processor.apply_result(self.pool, call, result)
                 except Exception as exc:
                     logger.error(f"Error processing external call: {exc}")
                     continue
@@ -197,7 +373,7 @@ class HeartbeatWorker:
                     and heartbeat_id
                 ):
                     exec_result = await execute_heartbeat_decision(
-                        conn,
+                        self.pool,
                         heartbeat_id=str(heartbeat_id),
                         decision=result["decision"],
                         call_processor=self.call_processor,
@@ -211,48 +387,88 @@ class HeartbeatWorker:
                             self.stop()
                     return
 
+    async def _process_call(self, call: dict[str, Any]) -> dict[str, Any]:
+        """Run one external call, at most WORKER_CONCURRENCY at once."""
+        call_type = str(call.get("call_type") or "")
+        call_input = call.get("input") or {}
+        if not isinstance(call_input, dict):
+            call_input = {}
+        async with self._call_slots:
+            return await self.call_processor.process_call_payload(self.pool, call_type, call_input)
+
     async def run(self) -> None:
         self.running = True
+        self._loop = asyncio.get_running_loop()
         logger.info("Heartbeat worker starting...")
         await self.connect()
 
         try:
             while self.running:
                 try:
-                    if await self._is_agent_terminated():
+                    await self._ensure_listener()
+                    terminated, ready = await self._agent_gate()
+                    if terminated:
                         logger.info("Agent is terminated; heartbeat worker exiting.")
                         break
-                    if not await self._is_agent_ready():
-                        await asyncio.sleep(POLL_INTERVAL)
+                    if not ready:
+                        await self._idle(IDLE_POLL_INTERVAL if _listener_alive(self._listener) else POLL_INTERVAL)
                         continue
                     await self._run_heartbeat_if_due()
+                    wait = await self._next_heartbeat_wait()
                 except Exception as exc:
                     logger.error(f"Worker loop error: {exc}")
-                await asyncio.sleep(POLL_INTERVAL)
+                    wait = POLL_INTERVAL
+                await self._idle(wait)
         finally:
             await self.disconnect()
 
     def stop(self) -> None:
         self.running = False
         logger.info("Heartbeat worker stopping...")
+        # May run from a signal handler; wake the loop so shutdown is not delayed by a wait.
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
 
-    async def _is_agent_terminated(self) -> bool:
-        if not self.pool:
-            return False
-        try:
-            async with self.pool.acquire() as conn:
-                return await is_agent_terminated(conn)
-        except Exception:
-            return False
+    async def _ensure_listener(self) -> None:
+        """Reopen the LISTEN connection if it dropped; polling covers the gap until then."""
+        if _listener_alive(self._listener) or time.monotonic() < self._listener_retry_at:
+            return
+        await _close_wake_listener(self._listener)
+        self._listener = await _open_wake_listener(db_dsn_from_env(self.instance), self._on_wake)
+        if self._listener is None:
+            self._listener_retry_at = time.monotonic() + WAKE_LISTENER_RETRY_INTERVAL
+            return
+        # Notifications sent while disconnected were lost; "config" invalidates everything.
+        self._on_wake("config")
 
-    async def _is_agent_ready(self) -> bool:
-        if not self.pool:
-            return False
-        try:
-            async with self.pool.acquire() as conn:
-                return bool(await conn.fetchval("SELECT is_agent_configured() AND is_init_complete()"))
-        except Exception:
-            return False
+    async def _idle(self, timeout: float) -> None:
+        if self.running:
+            await _wait_for_wake(self._wake, timeout)
+
+    async def _next_heartbeat_wait(self) -> float:
+        """Seconds to wait before the next check: until the next heartbeat is due."""
+        if not _listener_alive(self._listener) or not self.pool:
+            return POLL_INTERVAL
+        async with self.pool.acquire() as conn:
+            seconds = await conn.fetchval("SELECT seconds_until_heartbeat_due()")
+        if seconds is None:
+            return HEARTBEAT_MAX_WAIT
+        return min(max(float(seconds), POLL_INTERVAL), HEARTBEAT_MAX_WAIT)
+
+    async def _agent_gate(self) -> tuple[bool, bool]:
+        """Return (terminated, ready) for the agent."""
+        # Every input to the gate NOTIFYs the listener; while it is connected the last
+        # answer stays valid until the next wake.
+        if self._gate is not None and _listener_alive(self._listener):
+            return self._gate
+        seen = self._wake_count
+        gate = await _read_agent_gate(self.pool)
+        if gate is None:
+            return False, False
+        # A wake during the query may already describe a newer state; don't pin this one.
+        if seen == self._wake_count:
+            self._gate = gate
+        return gate
 
 
 class MaintenanceWorker:
@@ -263,18 +479,39 @@ class MaintenanceWorker:
         self.pool: asyncpg.Pool | None = None
         self.running = False
         self.bridge: RabbitMQBridge | None = None
+        self._wake = asyncio.Event()
+        self._listener: asyncpg.Connection | None = None
+        self._listener_retry_at = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._gate: tuple[bool, bool] | None = None
+        self._wake_count = 0
+        # Monotonic time before which the maintenance/subconscious checks have nothing to do.
+        self._db_work_due_at = 0.0
 
     async def connect(self) -> None:
-        self.pool = await asyncpg.create_pool(dsn=db_dsn_from_env(self.instance), min_size=1, max_size=5)
+        self.pool = await asyncpg.create_pool(
+            dsn=db_dsn_from_env(self.instance),
+            min_size=1,
+            max_size=5,
+            **POOL_OPTIONS,
+        )
         logger.info("Connected to database")
+        self._listener = await _open_wake_listener(db_dsn_from_env(self.instance), self._on_wake)
         self.bridge = RabbitMQBridge(self.pool)
         await self.bridge.ensure_ready()
 
     async def disconnect(self) -> None:
+        await _close_wake_listener(self._listener)
+        self._listener = None
+        if self.bridge:
+            await self.bridge.close()
         if self.pool:
             await self.pool.close()
             logger.info("Disconnected from database")
 
+    def get_stats(self) -> dict[str, int]:
+        return _pool_stats(self.pool)
+
     async def _run_maintenance_if_due(self) -> None:
         if not self.pool:
             return
@@ -296,50 +533,111 @@ class MaintenanceWorker:
             await mark_subconscious_decider_run(conn)
             logger.info(f"Subconscious decider: {result}")
 
+    async def _poll_inbox(self) -> None:
+        if self.bridge:
+            await self.bridge.poll_inbox_messages()
+
+    async def _run_tick_tasks(self) -> None:
+        # The inbox has no NOTIFY and is polled every tick; the database work only runs
+        # once it is due or something changed.
+        if time.monotonic() < self._db_work_due_at:
+            await self._poll_inbox()
+            return
+        seen = self._wake_count
+        # Inbox polling (RabbitMQ) and maintenance (Postgres) share no state, so their
+        # latency overlaps; the subconscious pass runs after maintenance has settled.
+        results = await asyncio.gather(
+            self._poll_inbox(),
+            self._run_maintenance_if_due(),
+            return_exceptions=True,
+        )
+        for name, result in zip(("inbox poll", "maintenance"), results):
+            if isinstance(result, Exception):
+                logger.error(f"Maintenance {name} error: {result}")
+        await self._run_subconscious_if_due()
+        wait = await self._next_db_work_wait()
+        if seen == self._wake_count:
+            self._db_work_due_at = time.monotonic() + wait
+
+    async def _next_db_work_wait(self) -> float:
+        """Seconds until maintenance or the subconscious decider is next due by the clock."""
+        if not _listener_alive(self._listener) or not self.pool:
+            return 0.0
+        try:
+            async with self.pool.acquire() as conn:
+                seconds = await conn.fetchval("SELECT seconds_until_maintenance_due()")
+        except Exception:
+            return 0.0
+        if seconds is None:
+            return MAINTENANCE_MAX_WAIT
+        return min(max(float(seconds), 0.0), MAINTENANCE_MAX_WAIT)
+
     async def run(self) -> None:
         self.running = True
+        self._loop = asyncio.get_running_loop()
         logger.info("Maintenance worker starting...")
         await self.connect()
         try:
             while self.running:
                 try:
-                    if await self._is_agent_terminated():
+                    await self._ensure_listener()
+                    terminated, ready = await self._agent_gate()
+                    if terminated:
                         logger.info("Agent is terminated; maintenance worker exiting.")
                         break
-                    if not await self._is_agent_ready():
-                        await asyncio.sleep(POLL_INTERVAL)
+                    if not ready:
+                        await self._idle(IDLE_POLL_INTERVAL if _listener_alive(self._listener) else POLL_INTERVAL)
                         continue
-                    if self.bridge:
-                        await self.bridge.poll_inbox_messages()
-                    await self._run_maintenance_if_due()
-                    await self._run_subconscious_if_due()
+                    await self._run_tick_tasks()
                 except Exception as exc:
                     logger.error(f"Maintenance loop error: {exc}")
-                await asyncio.sleep(POLL_INTERVAL)
+                await self._idle(POLL_INTERVAL)
         finally:
             await self.disconnect()
 
     def stop(self) -> None:
         self.running = False
         logger.info("Maintenance worker stopping...")
-
-    async def _is_agent_terminated(self) -> bool:
-        if not self.pool:
-            return False
-        try:
-            async with self.pool.acquire() as conn:
-                return await is_agent_terminated(conn)
-        except Exception:
-            return False
-
-    async def _is_agent_ready(self) -> bool:
-        if not self.pool:
-            return False
-        try:
-            async with self.pool.acquire() as conn:
-                return bool(await conn.fetchval("SELECT is_agent_configured() AND is_init_complete()"))
-        except Exception:
-            return False
+        # May run from a signal handler; wake the loop so shutdown is not delayed by a wait.
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _on_wake(self, payload: str) -> None:
+        self._gate = None
+        self._db_work_due_at = 0.0
+        self._wake_count += 1
+        self._wake.set()
+
+    async def _ensure_listener(self) -> None:
+        """Reopen the LISTEN connection if it dropped; polling covers the gap until then."""
+        if _listener_alive(self._listener) or time.monotonic() < self._listener_retry_at:
+            return
+        await _close_wake_listener(self._listener)
+        self._listener = await _open_wake_listener(db_dsn_from_env(self.instance), self._on_wake)
+        if self._listener is None:
+            self._listener_retry_at = time.monotonic() + WAKE_LISTENER_RETRY_INTERVAL
+            return
+        # Notifications sent while disconnected were lost; "config" invalidates everything.
+        self._on_wake("config")
+
+    async def _idle(self, timeout: float) -> None:
+        if self.running:
+            await _wait_for_wake(self._wake, timeout)
+
+    async def _agent_gate(self) -> tuple[bool, bool]:
+        """Return (terminated, ready) for the agent."""
+        # Every input to the gate NOTIFYs the listener; while it is connected the last
+        # answer stays valid until the next wake.
+        if self._gate is not None and _listener_alive(self._listener):
+            return self._gate
+        seen = self._wake_count
+        gate = await _read_agent_gate(self.pool)
+        if gate is None:
+            return False, False
+        # A wake during the query may already describe a newer state; don't pin this one.
+        if seen == self._wake_count:
+            self._gate = gate
+        return gate
 
 
 async def _amain(mode: str, instance: str | None = None) -> None:
@@ -371,6 +669,19 @@ async def _amain(mode: str, instance: str | None = None) -> None:
     raise ValueError("mode must be one of: heartbeat, maintenance, both")
 
 
+def _install_uvloop() -> None:
+    """Opt into uvloop with WORKER_USE_UVLOOP=1 (not available on Windows)."""
+    if os.getenv("WORKER_USE_UVLOOP", "").strip().lower() not in {"1", "true", "yes"}:
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("WORKER_USE_UVLOOP is set but uvloop is not installed; using asyncio's default loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def main() -> int:
     p = argparse.ArgumentParser(prog="hexis-worker", description="Run Hexis background workers.")
     p.add_argument(
@@ -385,6 +696,7 @@ def main() -> int:
         help="Target a specific instance (overrides HEXIS_INSTANCE env var).",
     )
     args = p.parse_args()
+    _install_uvloop()
     asyncio.run(_amain(args.mode, args.instance))
     return 0
 
@@ -163,3 +163,38 @@ async def test_cli_config_validate_fails_when_unconfigured(db_pool):
     finally:
         async with db_pool.acquire() as conn:
             await conn.execute("SELECT set_config('agent.is_configured', 'true'::jsonb)")
+
+
+def test_init_load_agent_config_fills_defaults(tmp_path):
+    from apps import hexis_init
+
+    spec = tmp_path / "init.json"
+    spec.write_text(
+        json.dumps(
+            {
+                "objectives": ["ship tests"],
+                "llm_heartbeat": {"provider": "anthropic", "model": "claude"},
+                "contact_destinations": {"email": "dev@example.com"},
+            }
+        )
+    )
+    config = hexis_init._load_agent_config(  # noqa: SLF001
+        str(spec),
+        {"heartbeat_interval_minutes": 30, "max_energy": 12.0},
+        {"OPENAI_BASE_URL": ""},
+    )
+    assert config["heartbeat_interval_minutes"] == 30
+    assert config["max_energy"] == 12.0
+    assert config["objectives"] == ["ship tests"]
+    assert config["llm_chat"]["provider"] == "anthropic"
+    assert config["llm_subconscious"]["model"] == "claude"
+    assert config["contact_channels"] == ["email"]
+
+
+def test_init_load_agent_config_requires_objectives(tmp_path):
+    from apps import hexis_init
+
+    spec = tmp_path / "init.json"
+    spec.write_text(json.dumps({"objectives": []}))
+    with pytest.raises(ValueError):
+        hexis_init._load_agent_config(str(spec), {}, {})  # noqa: SLF001
@@ -15,6 +15,7 @@ from tenacity import (
     wait_fixed,
 )
 
+from core import agent_api
 from tests.utils import _db_dsn
 
 
@@ -80,6 +81,8 @@ async def temp_test_db():
 
     yield
 
+    # Shared helper pools hold connections to the temp DB; release them before the drop.
+    await agent_api.close_pool()
     try:
         admin_conn = await _connect_with_retry(
             admin_dsn,
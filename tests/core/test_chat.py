@@ -53,7 +53,7 @@ async def test_chat_turn_basic_flow(monkeypatch):
         return {"content": "hello there", "tool_calls": []}
 
     monkeypatch.setattr(chat_mod.CognitiveMemory, "connect", fake_connect)
-    monkeypatch.setattr(chat_mod, "chat_completion", fake_chat_completion)
+    monkeypatch.setattr(chat_mod, "_chat_completion_impl", fake_chat_completion)
     async def fake_agent_profile(_dsn):
         return {}
 
@@ -104,13 +104,13 @@ async def test_chat_turn_tool_loop(monkeypatch):
     async def fake_chat_completion(**_kwargs):
         return responses.pop(0)
 
-    async def fake_execute_tool(name, arguments, **_kwargs):
-        tool_calls.append((name, arguments))
-        return {"ok": True}
+    async def fake_execute_tools(calls, **_kwargs):
+        tool_calls.extend((call["name"], call["arguments"]) for call in calls)
+        return [{"ok": True} for _ in calls]
 
     monkeypatch.setattr(chat_mod.CognitiveMemory, "connect", fake_connect)
-    monkeypatch.setattr(chat_mod, "chat_completion", fake_chat_completion)
-    monkeypatch.setattr(chat_mod, "execute_tool", fake_execute_tool)
+    monkeypatch.setattr(chat_mod, "_chat_completion_impl", fake_chat_completion)
+    monkeypatch.setattr(chat_mod, "execute_tools", fake_execute_tools)
     async def fake_agent_profile(_dsn):
         return {}
 
@@ -154,6 +154,21 @@ async def test_touch_memories_updates_access_count(mem_client, db_pool):
             await conn.execute("DELETE FROM memories WHERE id = $1", mid)
 
 
+async def test_recall_with_touch_updates_access_count(mem_client, db_pool):
+    test_id = get_test_identifier("recall_touch")
+    content = f"Recall touch {test_id}"
+    mid = await mem_client.remember(content, type=MemoryType.SEMANTIC, importance=0.6)
+    try:
+        result = await mem_client.recall(content, limit=5, include_partial=False, touch=True)
+        assert mid in [m.id for m in result.memories]
+        async with db_pool.acquire() as conn:
+            count = await conn.fetchval("SELECT access_count FROM memories WHERE id = $1", mid)
+        assert int(count) >= 1
+    finally:
+        async with db_pool.acquire() as conn:
+            await conn.execute("DELETE FROM memories WHERE id = $1", mid)
+
+
 async def test_get_emotional_state_shape(mem_client):
     state = await mem_client.get_emotional_state()
     assert state is None or isinstance(state, dict)
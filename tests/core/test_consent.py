@@ -16,6 +16,13 @@ async def test_extract_json_payload_handles_noise():
     assert extracted["signature"] == "sig"
 
 
+async def test_extract_json_payload_ignores_stray_braces():
+    payload = {"decision": "decline", "signature": "}{", "memories": []}
+    text = f"note {{draft}}\n{json.dumps(payload)}\nsee {{appendix}}"
+    extracted = consent_mod._extract_json_payload(text)  # noqa: SLF001
+    assert extracted == payload
+
+
 async def test_stream_consent_flow_records_log(monkeypatch, db_pool):
     async def fake_stream_text_completion(**_kwargs):
         yield '{"decision":"consent","signature":"unit-test","memories":[]}'
@@ -42,6 +49,30 @@ async def test_stream_consent_flow_records_log(monkeypatch, db_pool):
     assert row["decision"] == "consent"
 
 
+async def test_stream_consent_flow_surfaces_decision_early(monkeypatch, db_pool):
+    sent = []
+
+    async def fake_stream_text_completion(**_kwargs):
+        for piece in ('Thinking {aloud}. {"decision":"decline",', '"memories":[]} bye', " never read"):
+            sent.append(piece)
+            yield piece
+
+    monkeypatch.setattr(consent_mod, "stream_text_completion", fake_stream_text_completion)
+
+    events = [
+        event
+        async for event in consent_mod.stream_consent_flow(
+            llm_config={"provider": "openai", "model": "gpt-4o"},
+            dsn=_db_dsn(),
+        )
+    ]
+
+    assert {"type": "partial", "key": "decision", "value": "decline"} in events
+    assert events[-1]["decision"] == "decline"
+    assert events[-1]["raw"].endswith('"memories":[]}')
+    assert len(sent) == 2
+
+
 async def test_stream_consent_flow_abstains_without_signature(monkeypatch, db_pool):
     async def fake_stream_text_completion(**_kwargs):
         yield '{"decision":"consent","memories":[]}'
@@ -60,3 +91,24 @@ async def test_stream_consent_flow_abstains_without_signature(monkeypatch, db_po
         )
     assert row is not None
     assert row["decision"] == "abstain"
+
+
+async def test_ensure_consent_caches_recorded_status(monkeypatch):
+    class FakeConn:
+        def __init__(self):
+            self.queries = 0
+
+        async def fetchrow(self, _sql, *_args):
+            self.queries += 1
+            return {"consent": "consent", "llm": None}
+
+    monkeypatch.setattr(consent_mod, "_CONSENT_CACHE", {})
+    conn = FakeConn()
+    assert await consent_mod.ensure_consent(conn, dsn="postgresql://cache-test") is True
+    assert await consent_mod.ensure_consent(conn, dsn="postgresql://cache-test") is True
+    assert conn.queries == 1
+
+    consent_mod.invalidate_consent_cache("postgresql://cache-test")
+    assert await consent_mod.ensure_consent(conn, dsn="postgresql://cache-test") is True
+    assert await consent_mod.ensure_consent(conn, dsn="postgresql://cache-test", llm_config_key="llm.chat") is True
+    assert conn.queries == 3
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+
+from services import external_calls
+
+pytestmark = pytest.mark.core
+
+
+def test_context_json_stays_valid_within_limit():
+    context = {
+        "recent_memories": [{"id": i, "content": "x" * 5000} for i in range(200)],
+        "goals": list(range(100)),
+    }
+    text = external_calls._context_json(context, 8000)  # noqa: SLF001
+    assert len(text) <= 8000
+    doc = json.loads(text)
+    assert doc["recent_memories"][0]["id"] == 0
+    assert doc["goals"][0] == 0
+
+
+def test_context_json_leaves_small_context_untouched():
+    context = {"goals": [1, 2, 3], "note": "short"}
+    assert json.loads(external_calls._context_json(context, 2000)) == context  # noqa: SLF001
+
+
+
+def test_project_context_keeps_listed_fields():
+    context = {
+        "agent": {"objectives": ["learn"]},
+        "recent_memories": [{"id": i} for i in range(20)],
+        "action_costs": {"rest": 0},
+    }
+    projected = external_calls._project_context(context, external_calls._INQUIRE_CONTEXT_FIELDS)  # noqa: SLF001
+    assert projected == {"agent": {"objectives": ["learn"]}, "recent_memories": [{"id": i} for i in range(5)]}
+    assert external_calls._project_context(None, external_calls._INQUIRE_CONTEXT_FIELDS) is None  # noqa: SLF001
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_heartbeat_llm_config_cached_until_invalidated():
+    class FakeConn:
+        def __init__(self):
+            self.calls = 0
+
+        async def fetchval(self, _sql, *_args):
+            self.calls += 1
+            return json.dumps({"provider": "openai", "model": "gpt-test"})
+
+    conn = FakeConn()
+    processor = external_calls.ExternalCallProcessor()
+    first = await processor._heartbeat_llm_config(conn)  # noqa: SLF001
+    await processor._heartbeat_llm_config(conn)  # noqa: SLF001
+    assert first["model"] == "gpt-test"
+    assert conn.calls == 1
+
+    processor.invalidate_llm_config()
+    await processor._heartbeat_llm_config(conn)  # noqa: SLF001
+    assert conn.calls == 2
+
+
+def test_heartbeat_prompt_reuses_static_sections():
+    from services import heartbeat_prompt
+
+    heartbeat_prompt._format_section_from_key.cache_clear()  # noqa: SLF001
+    context = {
+        "agent": {"objectives": ["learn"], "tools": [{"name": "recall", "description": "search"}]},
+        "identity": [{"type": "value", "content": {"name": "curiosity"}}],
+        "heartbeat_number": 1,
+    }
+    first = heartbeat_prompt.build_heartbeat_decision_prompt(context)
+    second = heartbeat_prompt.build_heartbeat_decision_prompt({**context, "heartbeat_number": 2})
+    assert "  - learn" in first
+    assert "  - recall: search" in first
+    assert "## Heartbeat #2" in second
+    # Stable sections lead, so consecutive heartbeats share a long prompt prefix.
+    assert first.index("## Agent Profile") < first.index("## Heartbeat #1") < first.index("## Current Time")
+    assert heartbeat_prompt._format_section_from_key.cache_info().hits >= 1  # noqa: SLF001
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_inquire_answers_reused_for_same_question(monkeypatch):
+    calls = []
+
+    async def fake_chat_json(**kwargs):
+        calls.append(kwargs)
+        doc = {"summary": "Vectors of numbers.", "confidence": 0.9, "sources": []}
+        return doc, json.dumps(doc)
+
+    async def fake_llm_config(_conn):
+        return {"provider": "openai", "model": "gpt-test"}
+
+    monkeypatch.setattr(external_calls, "chat_json", fake_chat_json)
+    processor = external_calls.ExternalCallProcessor()
+    monkeypatch.setattr(processor, "_heartbeat_llm_config", fake_llm_config)
+
+    first = await processor._process_inquire_call(None, {"query": "What is an embedding?", "context": {"a": 1}})  # noqa: SLF001
+    second = await processor._process_inquire_call(None, {"query": "what is an  embedding?", "context": {"a": 2}})  # noqa: SLF001
+    await processor._process_inquire_call(None, {"query": "What is an embedding?", "depth": "inquire_deep"})  # noqa: SLF001
+
+    assert first["result"] == second["result"]
+    assert len(calls) == 2
+
+
+def test_output_budget_tracks_recent_reply_sizes():
+    budget = external_calls._OutputBudget()  # noqa: SLF001
+    assert budget.max_tokens("reflect", 1800) == 1800
+
+    for _ in range(external_calls.OUTPUT_BUDGET_MIN_SAMPLES):
+        budget.record("reflect", "x" * 1600, 1800, complete=True)  # ~400 tokens
+    limit = budget.max_tokens("reflect", 1800)
+    assert external_calls.OUTPUT_BUDGET_FLOOR <= limit < 1800
+
+    # Replies cut short by the reduced limit push it back to the ceiling.
+    for _ in range(external_calls.OUTPUT_BUDGET_WINDOW):
+        budget.record("reflect", '{"partial": "', 1800, complete=False)
+    assert budget.max_tokens("reflect", 1800) == 1800
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_truncated_reply_is_retried_at_ceiling(monkeypatch):
+    calls = []
+
+    async def fake_chat_json(**kwargs):
+        calls.append(kwargs["max_tokens"])
+        if kwargs["max_tokens"] < 1200:
+            return dict(kwargs["fallback"]), '{"goals": [{"title": "Lea'
+        return {"goals": []}, '{"goals": []}'
+
+    processor = external_calls.ExternalCallProcessor()
+    for _ in range(external_calls.OUTPUT_BUDGET_MIN_SAMPLES):
+        processor._output_budget.record("brainstorm_goals", "x" * 400, 1200, complete=True)  # noqa: SLF001
+    monkeypatch.setattr(external_calls, "chat_json", fake_chat_json)
+
+    doc, raw = await processor._budgeted_chat_json(  # noqa: SLF001
+        "brainstorm_goals", 1200, llm_config={}, messages=[], fallback={"goals": []}
+    )
+    assert calls[0] < 1200 and calls[1:] == [1200]
+    assert raw == '{"goals": []}'
+
+    # A valid empty goal list is complete: one call, sampled at its own size.
+    async def empty_goals(**kwargs):
+        calls.append(kwargs["max_tokens"])
+        return {"goals": []}, '{"goals": []}'
+
+    monkeypatch.setattr(external_calls, "chat_json", empty_goals)
+    calls.clear()
+    await processor._budgeted_chat_json(  # noqa: SLF001
+        "brainstorm_goals", 1200, llm_config={}, messages=[], fallback={"goals": []}
+    )
+    assert len(calls) == 1
+    assert processor._output_budget._samples["brainstorm_goals"][-1] < 1200  # noqa: SLF001
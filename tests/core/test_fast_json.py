@@ -0,0 +1,37 @@
+import pytest
+
+from core import fast_json
+
+pytestmark = pytest.mark.core
+
+
+def test_dumps_roundtrip():
+    doc = {"a": [1, 2.5, None], "b": "héllo", "c": True}
+    assert fast_json.loads(fast_json.dumps(doc)) == doc
+
+
+def test_dumps_default_and_fallback():
+    class Thing:
+        def __str__(self):
+            return "thing"
+
+    assert fast_json.loads(fast_json.dumps({"t": Thing()}, default=str)) == {"t": "thing"}
+    assert fast_json.loads(fast_json.dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def test_loads_accepts_bytes():
+    assert fast_json.loads(b'{"x": 1}') == {"x": 1}
+
+
+def test_dumps_truncated_matches_prefix():
+    doc = {"items": [{"id": i, "text": "héllo wörld"} for i in range(500)]}
+    full = fast_json.dumps(doc)
+    assert fast_json.dumps_truncated(doc, 100) == full[:100]
+    assert fast_json.dumps_truncated(doc, len(full) + 10) == full
+    assert fast_json.dumps_truncated(doc, 0) == ""
+
+
+def test_dumpb_returns_utf8_bytes():
+    data = fast_json.dumpb({"b": "héllo"})
+    assert isinstance(data, bytes)
+    assert fast_json.loads(data) == {"b": "héllo"}
@@ -13,6 +13,40 @@ async def test_create_and_cancel_ingestion_session():
     ingest_api._INGESTION_CANCEL.pop(session_id, None)  # noqa: SLF001
 
 
+async def test_cancel_registry_expires_and_bounds_sessions(monkeypatch):
+    registry = ingest_api._CancelRegistry(ttl=60, max_size=2)  # noqa: SLF001
+    now = [1000.0]
+    monkeypatch.setattr(ingest_api.time, "monotonic", lambda: now[0])
+
+    registry.add("a")
+    registry.add("b")
+    registry.add("c")
+    assert "a" not in registry
+    assert len(registry) == 2
+
+    now[0] += 61
+    assert registry.get("b") is None
+    registry.add("d")
+    assert len(registry) == 1
+
+
+async def test_cancel_registry_pins_active_sessions(monkeypatch):
+    registry = ingest_api._CancelRegistry(ttl=60, max_size=1)  # noqa: SLF001
+    now = [1000.0]
+    monkeypatch.setattr(ingest_api.time, "monotonic", lambda: now[0])
+
+    event = registry.add("a")
+    assert registry.activate("a") is event
+    registry.add("b")
+    registry.add("c")
+    now[0] += 3600
+    assert registry.get("a") is event
+    assert registry.get("c") is None
+
+    registry.pop("a")
+    assert "a" not in registry
+
+
 async def test_stream_ingestion_emits_logs(monkeypatch, tmp_path):
     class StubPipeline:
         def __init__(self, config):
@@ -48,3 +82,37 @@ async def test_stream_ingestion_emits_logs(monkeypatch, tmp_path):
     assert any("ingest_file" in line for line in logs)
     assert any("stats" in line for line in logs)
     assert session_id not in ingest_api._INGESTION_CANCEL  # noqa: SLF001
+
+
+async def test_stream_ingestion_bounded_queue_keeps_every_line(monkeypatch, tmp_path):
+    class ChattyPipeline:
+        def __init__(self, config):
+            self.config = config
+
+        def ingest_file(self, target):
+            for i in range(50):
+                self.config.log(f"line {i}")
+
+        def print_stats(self):
+            return None
+
+        def close(self):
+            return None
+
+    monkeypatch.setattr(ingest_api, "IngestionPipeline", ChattyPipeline)
+    monkeypatch.setattr(ingest_api, "INGEST_LOG_QUEUE_SIZE", 4)
+
+    test_file = tmp_path / "note.txt"
+    test_file.write_text("hello", encoding="utf-8")
+
+    session_id = ingest_api.create_ingestion_session()
+    lines = []
+    async for event in ingest_api.stream_ingestion(
+        session_id=session_id,
+        path=str(test_file),
+        recursive=False,
+        llm_config={"provider": "openai", "model": "gpt-4o"},
+    ):
+        lines.extend(event["text"].split("\n"))
+
+    assert lines == [f"line {i}" for i in range(50)]
@@ -65,10 +65,55 @@ def test_anthropic_tools_conversion():
     assert out == [{"name": "recall", "description": "desc", "input_schema": {"type": "object"}}]
 
 
-def test_chunk_text():
-    assert llm._chunk_text("") == []  # noqa: SLF001
-    chunks = llm._chunk_text("abcd", chunk_size=2)  # noqa: SLF001
-    assert chunks == ["ab", "cd"]
+def test_anthropic_system_blocks_mark_prompt_cacheable():
+    blocks = llm._anthropic_system_blocks("static prompt")  # noqa: SLF001
+    assert blocks == [
+        {"type": "text", "text": "static prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+def test_shared_http_client_is_per_event_loop():
+    import asyncio
+
+    async def grab():
+        return llm._shared_http_client(), llm._shared_http_client()  # noqa: SLF001
+
+    first, again = asyncio.run(grab())
+    other, _ = asyncio.run(grab())
+    assert first is again
+    assert other is not first
+
+
+def test_sdk_clients_are_reused_per_settings(monkeypatch):
+    import asyncio
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(llm, "openai", type("openai", (), {"AsyncOpenAI": FakeOpenAI}))
+
+    async def grab():
+        first = llm._get_openai_client("k", "https://a")  # noqa: SLF001
+        again = llm._get_openai_client("k", "https://a")  # noqa: SLF001
+        other = llm._get_openai_client("k", "https://b")  # noqa: SLF001
+        return first, again, other
+
+    first, again, other = asyncio.run(grab())
+    assert first is again
+    assert other is not first
+    assert first.kwargs["base_url"] == "https://a"
+
+
+def test_openai_prompt_cache_body_keys_on_system_prompt():
+    messages = [{"role": "system", "content": "static"}, {"role": "user", "content": "a"}]
+    body = llm._openai_prompt_cache_body("openai", None, messages)  # noqa: SLF001
+    assert body == llm._openai_prompt_cache_body("openai", None, messages[:1])  # noqa: SLF001
+    assert len(body["prompt_cache_key"]) == 32
+    assert llm._openai_prompt_cache_body("openai", "https://api.openai.com/v1", messages) == body  # noqa: SLF001
+    assert llm._openai_prompt_cache_body("openai", "http://localhost:8000/v1", messages) is None  # noqa: SLF001
+    assert llm._openai_prompt_cache_body("ollama", None, messages) is None  # noqa: SLF001
+    assert llm._openai_prompt_cache_body("openai", None, messages[1:]) is None  # noqa: SLF001
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -107,3 +152,48 @@ async def test_chat_completion_requires_openai_package(monkeypatch):
             api_key=None,
             messages=[{"role": "user", "content": "hi"}],
         )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_openai_stream_batches_deltas(monkeypatch):
+    from types import SimpleNamespace
+
+    class FakeStream:
+        def __init__(self, pieces):
+            self._pieces = iter(pieces)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                piece = next(self._pieces)
+            except StopIteration:
+                raise StopAsyncIteration from None
+            return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+        async def close(self):
+            return None
+
+    class FakeCompletions:
+        async def create(self, **_kwargs):
+            return FakeStream(["ab", "cd", None, "ef", "g"])
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setattr(llm, "_get_openai_client", lambda *_args: fake_client)
+
+    async def collect(flush_chars):
+        return [
+            chunk
+            async for chunk in llm.stream_text_completion(
+                provider="openai",
+                model="x",
+                endpoint=None,
+                api_key=None,
+                messages=[{"role": "user", "content": "hi"}],
+                flush_chars=flush_chars,
+            )
+        ]
+
+    assert await collect(4) == ["abcd", "efg"]
+    assert await collect(0) == ["ab", "cd", "ef", "g"]
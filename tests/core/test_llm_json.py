@@ -0,0 +1,126 @@
+import pytest
+
+from core import llm_json
+
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.core]
+
+LLM_CONFIG = {"provider": "openai", "model": "gpt-test", "endpoint": None, "api_key": None}
+MESSAGES = [{"role": "system", "content": "sys"}, {"role": "user", "content": "ctx"}]
+
+
+@pytest.fixture
+def fake_completion(monkeypatch):
+    calls = []
+
+    async def fake_chat_completion(**kwargs):
+        calls.append(kwargs)
+        return {"content": '{"ok": true}'}
+
+    llm_json.clear_response_cache()
+    monkeypatch.setattr(llm_json, "chat_completion", fake_chat_completion)
+    yield calls
+    llm_json.clear_response_cache()
+
+
+async def test_chat_json_reuses_identical_request(fake_completion):
+    first, _ = await llm_json.chat_json(llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100)
+    first["mutated"] = True
+    second, raw = await llm_json.chat_json(llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100)
+    assert second == {"ok": True}
+    assert raw == '{"ok": true}'
+    assert len(fake_completion) == 1
+
+
+async def test_chat_json_cache_ignores_max_tokens_and_expires(fake_completion, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_json.time, "monotonic", lambda: now[0])
+    await llm_json.chat_json(llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100)
+    await llm_json.chat_json(llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=250)
+    assert len(fake_completion) == 1
+
+    now[0] += llm_json.RESPONSE_CACHE_TTL_SECONDS + 1
+    await llm_json.chat_json(llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100)
+    assert len(fake_completion) == 2
+
+
+async def test_chat_json_cache_bypass(fake_completion):
+    for _ in range(2):
+        await llm_json.chat_json(
+            llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100, cache_bypass=True
+        )
+    assert len(fake_completion) == 2
+
+
+async def test_chat_json_does_not_cache_fallback(fake_completion, monkeypatch):
+    async def empty_completion(**kwargs):
+        fake_completion.append(kwargs)
+        return {"content": ""}
+
+    monkeypatch.setattr(llm_json, "chat_completion", empty_completion)
+    for _ in range(2):
+        doc, _ = await llm_json.chat_json(
+            llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100, fallback={"x": 1}
+        )
+        assert doc == {"x": 1}
+    assert len(fake_completion) == 2
+
+
+async def test_chat_json_stream_assembles_chunks(monkeypatch):
+    async def fake_stream_text_completion(**kwargs):
+        assert kwargs["response_format"] == {"type": "json_object"}
+        for chunk in ('{"actions": [', '{"action": "rest"}', "]}"):
+            yield chunk
+
+    llm_json.clear_response_cache()
+    monkeypatch.setattr(llm_json, "stream_text_completion", fake_stream_text_completion)
+    doc, raw = await llm_json.chat_json(
+        llm_config=LLM_CONFIG,
+        messages=MESSAGES,
+        max_tokens=100,
+        response_format={"type": "json_object"},
+        cache_bypass=True,
+        stream=True,
+    )
+    assert doc == {"actions": [{"action": "rest"}]}
+    assert raw == '{"actions": [{"action": "rest"}]}'
+
+
+def test_json_object_tracker_ignores_braces_in_strings():
+    tracker = llm_json.JsonObjectTracker()
+    assert tracker.feed('noise {"a": "}{", "b": {"c": "\\"}"') == -1
+    end = tracker.feed('}} trailing')
+    assert end == 2
+    assert (tracker.begin, tracker.pos) == (6, 36)
+
+
+async def test_chat_json_stream_stops_after_object_closes(monkeypatch):
+    sent = []
+
+    async def fake_stream_text_completion(**_kwargs):
+        for chunk in ('{"reasoning": "ok"', '} extra', " never read"):
+            sent.append(chunk)
+            yield chunk
+
+    llm_json.clear_response_cache()
+    monkeypatch.setattr(llm_json, "stream_text_completion", fake_stream_text_completion)
+    doc, raw = await llm_json.chat_json(
+        llm_config=LLM_CONFIG, messages=MESSAGES, max_tokens=100, cache_bypass=True, stream=True
+    )
+    assert doc == {"reasoning": "ok"}
+    assert raw == '{"reasoning": "ok"}'
+    assert len(sent) == 2
+
+
+def test_parse_json_response_recovers_embedded_object():
+    fallback = {"fallback": True}
+    raw = 'Sure: {"reason": "use } carefully", "n": {"x": 1}} done }'
+    assert llm_json.parse_json_response(raw, fallback) == {"reason": "use } carefully", "n": {"x": 1}}
+    assert llm_json.parse_json_response('see {draft} then {"ok": 1}', fallback) == {"ok": 1}
+    assert llm_json.parse_json_response('{"unterminated": ', fallback) == fallback
+
+
+def test_parse_json_response_reads_code_fence():
+    raw = 'Here you go:\n```json\n{"reason": "fenced {", "n": 2}\n```\nAnything else?'
+    assert llm_json.parse_json_response(raw, {}) == {"reason": "fenced {", "n": 2}
+    assert llm_json.strip_code_fence("```\n[1, 2]\n```") == "[1, 2]"
+    assert llm_json.strip_code_fence("```json\n{") is None
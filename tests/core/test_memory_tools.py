@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core import memory_tools
+from core.cognitive_memory_api import RecallResult
+
+pytestmark = pytest.mark.core
+
+
+def test_cached_recall_reuses_results_and_defers_touches():
+    class FakeClient:
+        def __init__(self):
+            self.recalls = 0
+            self.touched = []
+
+        def recall(self, query, **_kwargs):
+            self.recalls += 1
+            memories = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+            return RecallResult(memories=memories, partial_activations=[], query=query)
+
+        def touch_memories(self, ids):
+            self.touched.append(sorted(ids))
+
+    client = FakeClient()
+    memory_tools.clear_recall_cache()
+    try:
+        first = memory_tools._cached_recall(client, "Hello ", limit=5, touch=True)  # noqa: SLF001
+        again = memory_tools._cached_recall(client, "hello", limit=5, touch=True)  # noqa: SLF001
+        assert client.recalls == 1
+        assert [m.id for m in again] == [m.id for m in first]
+        assert client.touched == []
+
+        # The next query that reaches the database records the deferred touches.
+        memory_tools._cached_recall(client, "other", limit=5, touch=True)  # noqa: SLF001
+        assert client.recalls == 2
+        assert client.touched == [[1, 2]]
+
+        # Each cache hit counts as an access, even for the same memory.
+        memory_tools._cached_recall(client, "hello", limit=5, touch=True)  # noqa: SLF001
+        memory_tools._cached_recall(client, "hello", limit=5, touch=True)  # noqa: SLF001
+        memory_tools._flush_pending_touches(client)  # noqa: SLF001
+        assert client.touched == [[1, 2], [1, 2], [1, 2]]
+
+        memory_tools.clear_recall_cache()
+        memory_tools._cached_recall(client, "hello", limit=5)  # noqa: SLF001
+        assert client.recalls == 3
+    finally:
+        memory_tools.clear_recall_cache()
+        memory_tools._PENDING_TOUCHES.pop(id(client), None)  # noqa: SLF001
@@ -1,6 +1,10 @@
+import asyncio
+import gc
+import weakref
+
 import pytest
 
-from core.sync_utils import run_sync
+from core.sync_utils import on_loop_shutdown, run_sync
 
 pytestmark = pytest.mark.core
 
@@ -12,6 +16,41 @@ def test_run_sync_runs_outside_loop():
     assert run_sync(_demo()) == "ok"
 
 
+def test_run_sync_reuses_one_loop():
+    async def _loop():
+        return asyncio.get_running_loop()
+
+    first = run_sync(_loop())
+    assert run_sync(_loop()) is first
+    assert first.is_running()
+
+
+def test_run_sync_propagates_exceptions():
+    async def _boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run_sync(_boom())
+
+
+def test_on_loop_shutdown_runs_callbacks_and_releases_loop():
+    closed = []
+    loops = []
+
+    async def _close():
+        closed.append(True)
+
+    async def _main():
+        on_loop_shutdown(_close)
+        on_loop_shutdown(_close)
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+
+    asyncio.run(_main())
+    gc.collect()
+    assert closed == [True]
+    assert loops[0]() is None
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_run_sync_raises_inside_loop():
     async def _demo():
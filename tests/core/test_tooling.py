@@ -1,7 +1,10 @@
+from uuid import uuid4
+
 import pytest
 
 from core.cognitive_memory_api import CognitiveMemory, MemoryType
-from services.tooling import execute_tool
+from core.cognitive_memory_api import RecallResult
+from services.tooling import execute_tool, execute_tools
 from tests.utils import _db_dsn, get_test_identifier
 
 pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.core]
@@ -109,7 +112,8 @@ async def test_tool_explore_cluster(mem_client, db_pool):
     try:
         result = await execute_tool("explore_cluster", {"query": content}, mem_client=mem_client)
         assert result["count"] >= 1
-        assert any(str(cluster_id) == str(c["id"]) for c in result["clusters"])
+        cluster = next(c for c in result["clusters"] if str(c["id"]) == str(cluster_id))
+        assert [str(m["memory_id"]) for m in cluster["sample_memories"]] == [str(memory_id)]
     finally:
         async with db_pool.acquire() as conn:
             # Clean up graph edges via DETACH DELETE
@@ -185,3 +189,55 @@ async def test_tool_create_goal_and_queue_message(mem_client, db_pool):
             "DELETE FROM memories WHERE id = $1::uuid AND type = 'goal'::memory_type",
             goal_result["goal_id"],
         )
+
+
+async def test_execute_tools_coalesces_recalls():
+    class FakeClient:
+        def __init__(self):
+            self.batches = []
+
+        async def recall_many(self, queries, **kwargs):
+            self.batches.append((list(queries), kwargs["touch"]))
+            return [RecallResult(memories=[], partial_activations=[], query=q) for q in queries]
+
+        async def recall(self, *_args, **_kwargs):
+            raise AssertionError("concurrent recalls should be batched")
+
+    client = FakeClient()
+    results = await execute_tools(
+        [
+            {"name": "recall", "arguments": {"query": "alpha"}},
+            {"name": "recall", "arguments": {"query": "beta"}},
+            {"name": "nope", "arguments": {}},
+        ],
+        mem_client=client,
+    )
+    assert client.batches == [(["alpha", "beta"], True)]
+    assert [r.get("query") for r in results[:2]] == ["alpha", "beta"]
+    assert "error" in results[2]
+
+
+async def test_execute_tools_runs_writes_in_call_order():
+    class FakeClient:
+        def __init__(self):
+            self.events = []
+
+        async def recall(self, query, **_kwargs):
+            self.events.append(f"recall:{query}")
+            return RecallResult(memories=[], partial_activations=[], query=query)
+
+        async def create_goal(self, title, **_kwargs):
+            self.events.append(f"goal:{title}")
+            return uuid4()
+
+    client = FakeClient()
+    results = await execute_tools(
+        [
+            {"name": "recall", "arguments": {"query": "before"}},
+            {"name": "create_goal", "arguments": {"title": "plan"}},
+            {"name": "recall", "arguments": {"query": "after"}},
+        ],
+        mem_client=client,
+    )
+    assert client.events == ["recall:before", "goal:plan", "recall:after"]
+    assert results[1]["title"] == "plan"
@@ -1,7 +1,11 @@
+import asyncio
 import json
 
+import asyncpg
 import pytest
 
+from tests.utils import _db_dsn
+
 pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.db]
 
 
@@ -76,3 +80,53 @@ async def test_is_self_termination_enabled(db_pool):
     async with db_pool.acquire() as conn:
         enabled = await conn.fetchval("SELECT is_self_termination_enabled()")
         assert enabled is True
+
+
+async def test_set_config_many_upserts_batch(db_pool):
+    async with db_pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("SELECT set_config('agent.objectives', $1::jsonb)", json.dumps(["old"]))
+            await conn.execute(
+                "SELECT set_config_many($1::text[], $2::text[]::jsonb[])",
+                ["agent.objectives", "agent.initial_message", "agent.initial_message"],
+                [json.dumps(["new"]), json.dumps("first"), json.dumps("last")],
+            )
+            objectives = await conn.fetchval("SELECT get_config('agent.objectives')")
+            message = await conn.fetchval("SELECT get_config('agent.initial_message')")
+            assert (json.loads(objectives) if isinstance(objectives, str) else objectives) == ["new"]
+            assert (json.loads(message) if isinstance(message, str) else message) == "last"
+
+
+async def test_set_config_many_rejects_mismatched_lengths(db_pool):
+    async with db_pool.acquire() as conn:
+        with pytest.raises(Exception):
+            await conn.execute(
+                "SELECT set_config_many($1::text[], $2::text[]::jsonb[])",
+                ["a.b", "a.c"],
+                [json.dumps(1)],
+            )
+
+
+async def test_set_worker_pause_flags(db_pool):
+    async with db_pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("SELECT set_worker_pause_flags(TRUE, FALSE)")
+            assert await conn.fetchval("SELECT is_paused FROM heartbeat_state WHERE id = 1") is True
+            assert await conn.fetchval("SELECT is_paused FROM maintenance_state WHERE id = 1") is False
+
+            await conn.execute("SELECT set_worker_pause_flags(NULL, TRUE)")
+            assert await conn.fetchval("SELECT is_paused FROM heartbeat_state WHERE id = 1") is True
+            assert await conn.fetchval("SELECT is_paused FROM maintenance_state WHERE id = 1") is True
+
+
+async def test_config_change_notifies_worker_wake_channel(db_pool):
+    listener = await asyncpg.connect(_db_dsn())
+    woke = asyncio.Event()
+    await listener.add_listener("hexis_worker_wake", lambda *_args: woke.set())
+    try:
+        async with db_pool.acquire() as conn:
+            await conn.execute("SELECT set_config('test.worker_wake', $1::jsonb)", json.dumps(True))
+            await asyncio.wait_for(woke.wait(), timeout=5)
+            await conn.execute("DELETE FROM config WHERE key = 'test.worker_wake'")
+    finally:
+        await listener.close()
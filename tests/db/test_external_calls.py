@@ -79,3 +79,53 @@ async def test_apply_external_call_result_applies_side_effects(db_pool, ensure_e
             inquiry_summary,
         )
         assert inquiry_count == 1
+
+
+async def test_apply_external_call_and_continue_runs_next_round(db_pool, ensure_embedding_service):
+    async with db_pool.acquire() as conn:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            await conn.execute("UPDATE heartbeat_state SET current_energy = 20, is_paused = FALSE WHERE id = 1")
+            hb_payload = _coerce_json(await conn.fetchval("SELECT start_heartbeat()"))
+            hb_id = hb_payload.get("heartbeat_id")
+            assert hb_id is not None
+
+            test_id = get_test_identifier("apply_and_continue")
+            decision = {
+                "reasoning": "test",
+                "actions": [
+                    {"action": "inquire_shallow", "params": {"query": f"What is a vector? {test_id}"}},
+                    {"action": "rest", "params": {}},
+                ],
+                "goal_changes": [],
+            }
+            first = _coerce_json(
+                await conn.fetchval(
+                    "SELECT apply_heartbeat_decision($1::uuid, $2::jsonb, 0)",
+                    hb_id,
+                    json.dumps(decision),
+                )
+            )
+            pending = first.get("pending_external_call")
+            assert isinstance(pending, dict)
+
+            summary = f"Vectors are ordered lists of numbers ({test_id})."
+            doc = _coerce_json(
+                await conn.fetchval(
+                    "SELECT apply_external_call_and_continue($1::jsonb, $2::jsonb, $3::uuid, $4::jsonb, $5::int)",
+                    json.dumps(pending),
+                    json.dumps({"kind": "inquire", "summary": summary, "confidence": 0.8, "sources": []}),
+                    hb_id,
+                    json.dumps(decision),
+                    first.get("next_index"),
+                )
+            )
+            assert isinstance(doc.get("applied"), dict)
+            assert _coerce_json(doc.get("batch")).get("completed") is True
+            assert await conn.fetchval(
+                "SELECT COUNT(*) FROM memories WHERE type = 'semantic' AND content = $1",
+                summary,
+            ) == 1
+        finally:
+            await tr.rollback()
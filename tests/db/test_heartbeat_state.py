@@ -197,3 +197,74 @@ async def test_should_run_subconscious_decider_and_mark_run(db_pool):
             assert row["last_subconscious_run_at"] is not None
         finally:
             await tr.rollback()
+
+
+async def test_ingest_inbox_messages_batches_contact_update(db_pool, ensure_embedding_service):
+    async with db_pool.acquire() as conn:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            await conn.execute("UPDATE heartbeat_state SET last_user_contact = NULL WHERE id = 1")
+            assert await conn.fetchval("SELECT ingest_inbox_messages(ARRAY[]::text[])") == 0
+
+            ingested = await conn.fetchval(
+                "SELECT ingest_inbox_messages($1::text[])",
+                ["inbox test one", "inbox test two"],
+            )
+            assert ingested == 2
+            assert await conn.fetchval(
+                "SELECT last_user_contact FROM heartbeat_state WHERE id = 1"
+            ) is not None
+        finally:
+            await tr.rollback()
+
+
+async def test_seconds_until_heartbeat_due(db_pool):
+    async with db_pool.acquire() as conn:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            await conn.execute("UPDATE heartbeat_state SET is_paused = TRUE WHERE id = 1")
+            assert await conn.fetchval("SELECT seconds_until_heartbeat_due()") is None
+
+            await conn.execute("UPDATE heartbeat_state SET is_paused = FALSE, last_heartbeat_at = NULL WHERE id = 1")
+            assert await conn.fetchval("SELECT seconds_until_heartbeat_due()") == 0
+
+            await conn.execute("UPDATE heartbeat_state SET last_heartbeat_at = CURRENT_TIMESTAMP WHERE id = 1")
+            interval_minutes = await conn.fetchval("SELECT get_config_float('heartbeat.heartbeat_interval_minutes')")
+            remaining = await conn.fetchval("SELECT seconds_until_heartbeat_due()")
+            assert 0 < remaining <= interval_minutes * 60
+        finally:
+            await tr.rollback()
+
+
+async def test_seconds_until_maintenance_due(db_pool):
+    async with db_pool.acquire() as conn:
+        tr = conn.transaction()
+        await tr.start()
+        try:
+            await conn.execute("UPDATE maintenance_state SET is_paused = TRUE WHERE id = 1")
+            assert await conn.fetchval("SELECT seconds_until_maintenance_due()") is None
+
+            await conn.execute("UPDATE maintenance_state SET is_paused = FALSE, last_maintenance_at = NULL WHERE id = 1")
+            assert await conn.fetchval("SELECT seconds_until_maintenance_due()") == 0
+
+            await conn.execute("SELECT set_config('maintenance.maintenance_interval_seconds', '120'::jsonb)")
+            await conn.execute("SELECT set_config('maintenance.subconscious_enabled', 'true'::jsonb)")
+            await conn.execute("SELECT set_config('maintenance.subconscious_interval_seconds', '30'::jsonb)")
+            await conn.execute(
+                """
+                UPDATE maintenance_state
+                SET last_maintenance_at = CURRENT_TIMESTAMP,
+                    last_subconscious_run_at = CURRENT_TIMESTAMP
+                WHERE id = 1
+                """
+            )
+            remaining = await conn.fetchval("SELECT seconds_until_maintenance_due()")
+            assert 0 < remaining <= 30
+
+            await conn.execute("SELECT set_config('maintenance.subconscious_enabled', 'false'::jsonb)")
+            remaining = await conn.fetchval("SELECT seconds_until_maintenance_due()")
+            assert 30 < remaining <= 120
+        finally:
+            await tr.rollback()